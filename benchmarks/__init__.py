@@ -0,0 +1,11 @@
+"""
+Pruebas de rendimiento del juego.
+Mide la preparación de intentos, la actualización y el dibujo de gemas, la
+generación y el guardado del reporte y una sesión completa. Los resultados
+se guardan en JSON junto con los datos de la máquina y se pueden comparar
+contra una línea base para detectar regresiones.
+
+Uso:
+    python -m benchmarks --output resultados.json
+    python -m benchmarks --compare linea_base.json
+"""
@@ -0,0 +1,91 @@
+"""
+Punto de entrada: python -m benchmarks [opciones]
+"""
+
+import argparse
+import fnmatch
+import sys
+
+from benchmarks.runner import (
+    run_benchmark, machine_metadata, save_results, load_results,
+    compare_results, format_time,
+)
+
+
+def create_window(opengl):
+    """Crea la ventana de los benchmarks.
+
+    Args:
+        opengl: True para una ventana real de arcade (oculta) y medir el
+            dibujo en la GPU; False para la ventana sin pantalla.
+    """
+    if opengl:
+        import arcade
+        from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+        window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, "Benchmarks", visible=False)
+        window.tracker = None
+        return window
+    from headless import create_headless_window
+    return create_headless_window()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de NumWorld.")
+    parser.add_argument("--output", default="benchmark_results.json",
+                        help="Archivo JSON de resultados")
+    parser.add_argument("--compare", default=None,
+                        help="Archivo de resultados de la línea base")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="Aumento relativo considerado regresión (0.15 = 15%%)")
+    parser.add_argument("--filter", default="*",
+                        help="Patrón de nombres a ejecutar (por ejemplo 'gem_*')")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.1,
+                        help="Duración mínima de cada repetición en segundos")
+    parser.add_argument("--opengl", action="store_true",
+                        help="Dibujar con arcade en una ventana oculta en lugar del backend nulo")
+    args = parser.parse_args()
+
+    window = create_window(args.opengl)
+
+    from benchmarks.cases import all_benchmarks
+    from views.gem_atlas import load_gem_atlas
+    load_gem_atlas()
+
+    results = []
+    over_budget = []
+    for benchmark in all_benchmarks(window):
+        if not fnmatch.fnmatch(benchmark.name, args.filter):
+            continue
+        result = run_benchmark(benchmark, repeat=args.repeat, min_time=args.min_time)
+        results.append(result)
+        print(f"{result['name']:<32} {format_time(result['median']):>12}  "
+              f"(min {format_time(result['min'])}, x{result['number']})")
+        if result["budget"] is not None and result["median"] > result["budget"]:
+            over_budget.append(result)
+            print(f"  excede el presupuesto de {format_time(result['budget'])}")
+
+    metadata = machine_metadata("opengl" if args.opengl else "null")
+    save_results(args.output, metadata, results)
+    print(f"Resultados guardados en {args.output}")
+
+    if args.compare:
+        comparison = compare_results(load_results(args.compare), results, args.threshold)
+        regressions = [c for c in comparison if c["status"] == "regresión"]
+        print(f"\nComparación con {args.compare} (umbral {args.threshold:.0%}):")
+        for c in comparison:
+            if "ratio" in c:
+                print(f"  {c['name']:<32} x{c['ratio']:<7} {c['status']}")
+            else:
+                print(f"  {c['name']:<32} {'':8} {c['status']}")
+        if regressions:
+            print(f"{len(regressions)} regresiones")
+            sys.exit(1)
+
+    if over_budget:
+        print(f"{len(over_budget)} benchmarks exceden su presupuesto")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
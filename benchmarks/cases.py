@@ -0,0 +1,246 @@
+"""
+Benchmarks del juego.
+Todas las mediciones usan datos con semilla fija para que dos ejecuciones
+midan exactamente el mismo trabajo.
+"""
+
+import os
+import random
+import shutil
+import tempfile
+
+from constants import GEM_COLORS, GEM_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT, TRIALS_PER_LEVEL
+from benchmarks.runner import Benchmark
+
+# Cantidades de gemas de los benchmarks de gemas
+GEM_COUNTS = (10, 100, 1000)
+
+# Cantidades de intentos de los benchmarks del reporte
+REPORT_TRIAL_COUNTS = (1000, 100000)
+
+SEED = 12345
+FRAME_TIME = 1 / 60
+
+
+def make_gems(count, seed=SEED):
+    """Crea `count` gemas destellando en posiciones aleatorias."""
+    from views.level_base import Gem
+
+    rng = random.Random(seed)
+    gems = []
+    for _ in range(count):
+        gem = Gem(
+            rng.uniform(40, SCREEN_WIDTH - 40),
+            rng.uniform(40, SCREEN_HEIGHT - 40),
+            rng.choice(GEM_COLORS),
+            GEM_SIZE,
+        )
+        gem.start_sparkle()
+        gems.append(gem)
+    return gems
+
+
+def make_moving_gems(count, seed=SEED):
+    """Crea `count` gemas de Nivel 4 con velocidades aleatorias."""
+    from views.level4_estimation import MovingGem, FIELD_BOUNDS
+
+    rng = random.Random(seed)
+    left, right, bottom, top = FIELD_BOUNDS
+    return [
+        MovingGem(
+            rng.uniform(left, right), rng.uniform(bottom, top),
+            rng.choice(GEM_COLORS), GEM_SIZE,
+            rng.uniform(-80, 80), rng.uniform(-60, 60),
+        )
+        for _ in range(count)
+    ]
+
+
+def make_tracker(trial_count, seed=SEED):
+    """Crea un DataTracker con `trial_count` intentos respondidos repartidos en los niveles."""
+    from clock import VirtualClock
+    from data_tracker import DataTracker
+
+    rng = random.Random(seed)
+    clock = VirtualClock()
+    tracker = DataTracker(session_seed=seed, clock=clock)
+    tracker.set_player_info("Benchmark", "7")
+    for i in range(trial_count):
+        level = i % 5 + 1
+        correct = rng.randint(1, 20)
+        tracker.start_trial(level, i // 5 + 1, correct)
+        clock.advance(rng.uniform(0.5, 20))
+        answer = correct if rng.random() < 0.7 else correct + 1
+        tracker.record_answer(answer)
+    return tracker
+
+
+def level_view_classes():
+    from views.level1_subitizing import Level1View
+    from views.level2_counting import Level2View
+    from views.level3_comparison import Level3View
+    from views.level4_estimation import Level4View
+    from views.level5_sequencing import Level5View
+    return [Level1View, Level2View, Level3View, Level4View, Level5View]
+
+
+def setup_trial_benchmarks(window):
+    """setup_trial completo (generar y crear objetos) y generate_trial solo."""
+    from seeding import trial_rng
+
+    benchmarks = []
+    for view_class in level_view_classes():
+        level = view_class.__name__[5]
+
+        def setup_view(view_class=view_class):
+            from data_tracker import DataTracker
+            window.tracker = DataTracker(session_seed=SEED)
+            view = view_class()
+            # Vaciar el banco: cada llamada mide generación y creación de objetos
+            for _ in range(TRIALS_PER_LEVEL):
+                view.trial_bank.pop()
+            return view
+
+        benchmarks.append(Benchmark(
+            f"setup_trial.level{level}",
+            lambda view: view.setup_trial(),
+            setup=setup_view,
+            group="micro",
+        ))
+        benchmarks.append(Benchmark(
+            f"generate_trial.level{level}",
+            lambda view: view.generate_trial(trial_rng(SEED, view.level_number, 1)),
+            setup=setup_view,
+            group="micro",
+        ))
+    return benchmarks
+
+
+def gem_benchmarks():
+    """Gem.update, Gem.draw, GemBatch.draw y GemField.step (con y sin NumPy)."""
+    from views.gem_batch import GemBatch
+    from views.level4_estimation import GemField, FIELD_BOUNDS
+
+    def update_all(gems):
+        for gem in gems:
+            gem.update(FRAME_TIME)
+
+    def draw_all(gems):
+        for gem in gems:
+            gem.draw()
+
+    benchmarks = []
+    for count in GEM_COUNTS:
+        benchmarks += [
+            Benchmark(f"gem_update.{count}", update_all,
+                      setup=lambda count=count: make_gems(count), group="micro"),
+            Benchmark(f"gem_draw.{count}", draw_all,
+                      setup=lambda count=count: make_gems(count), group="micro"),
+            Benchmark(f"gem_batch_draw.{count}", lambda batch: batch.draw(),
+                      setup=lambda count=count: GemBatch(make_gems(count)), group="micro"),
+            Benchmark(f"gem_field_step.{count}", lambda field: field.step(FRAME_TIME),
+                      setup=lambda count=count: GemField(make_moving_gems(count), FIELD_BOUNDS),
+                      group="micro"),
+            Benchmark(f"gem_field_step_lists.{count}", lambda field: field.step(FRAME_TIME),
+                      setup=lambda count=count: GemField(
+                          make_moving_gems(count), FIELD_BOUNDS, use_numpy=False),
+                      group="micro"),
+        ]
+    return benchmarks
+
+
+def level4_benchmarks(window):
+    """Frame completo del Nivel 4 extendido con la cantidad máxima de gemas.
+
+    Tiene como presupuesto un frame de 60 Hz: si la mediana lo supera, la
+    ejecución termina con error. Con --opengl se espera a que la GPU
+    termine cada frame, así se mide también el dibujo.
+    """
+    from constants import ESTIMATION_EXTENDED_MAX
+
+    def setup_view():
+        from data_tracker import DataTracker
+        from views.level4_estimation import Level4View
+        window.tracker = DataTracker(session_seed=SEED)
+        view = Level4View(extended=True)
+        window.show_view(view)
+        view.setup_trial(view.generate_trial_for(ESTIMATION_EXTENDED_MAX, random.Random(SEED)))
+        return view
+
+    def frame(view):
+        view.on_update(FRAME_TIME)
+        view.on_draw()
+        if hasattr(window, "ctx"):
+            window.ctx.finish()
+
+    return [Benchmark(
+        f"level4_extended_frame.{ESTIMATION_EXTENDED_MAX}",
+        frame,
+        setup=setup_view,
+        group="micro",
+        budget=FRAME_TIME,
+    )]
+
+
+def report_benchmarks():
+    """DataTracker.get_full_report y save_report_to_file."""
+
+    def setup_save():
+        tracker = make_tracker(REPORT_TRIAL_COUNTS[0])
+        report = tracker.get_full_report()
+        # save_report_to_file escribe en el directorio actual
+        directory = tempfile.mkdtemp(prefix="bench_report_")
+        previous = os.getcwd()
+        os.chdir(directory)
+        return tracker, report, directory, previous
+
+    def teardown_save(state):
+        _, _, directory, previous = state
+        os.chdir(previous)
+        shutil.rmtree(directory, ignore_errors=True)
+
+    benchmarks = [
+        Benchmark(
+            f"get_full_report.{count}",
+            lambda tracker: tracker.get_full_report(),
+            setup=lambda count=count: make_tracker(count),
+            group="micro",
+        )
+        for count in REPORT_TRIAL_COUNTS
+    ]
+    benchmarks.append(Benchmark(
+        "save_report_to_file",
+        lambda state: state[0].save_report_to_file(state[1]),
+        setup=setup_save,
+        teardown=teardown_save,
+        group="micro",
+    ))
+    return benchmarks
+
+
+def session_benchmarks(window):
+    """Sesión completa jugada por un jugador simulado (ver simulation.py).
+
+    La sesión necesita una ventana sin pantalla con reloj virtual; si la
+    ventana de los benchmarks es de arcade, simulation crea la suya.
+    """
+    from headless import HeadlessWindow
+    from simulation import DEFAULT_PROFILES, play_session
+
+    session_window = window if isinstance(window, HeadlessWindow) else None
+    return [Benchmark(
+        "session.full",
+        lambda: play_session(DEFAULT_PROFILES[0], SEED, session_window),
+        group="macro",
+    )]
+
+
+def all_benchmarks(window):
+    """Lista de todos los benchmarks, micro primero y la sesión completa al final."""
+    return (
+        setup_trial_benchmarks(window)
+        + gem_benchmarks()
+        + level4_benchmarks(window)
+        + report_benchmarks()
+        + session_benchmarks(window)
+    )
@@ -0,0 +1,188 @@
+"""
+Ejecución, medición y comparación de benchmarks.
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+
+class Benchmark:
+    """Una medición: función a cronometrar con su preparación opcional."""
+
+    def __init__(self, name, func, setup=None, teardown=None, group="", budget=None):
+        """Crea el benchmark.
+
+        Args:
+            name: Nombre único (por ejemplo "gem_update.100").
+            func: Función sin argumentos a cronometrar. Si hay setup, recibe
+                lo que setup devuelve.
+            setup: Función que prepara el estado (no se cronometra).
+            teardown: Función que recibe el estado al terminar.
+            group: Grupo para ordenar la salida ("micro" o "macro").
+            budget: Tiempo máximo por llamada en segundos (por ejemplo un
+                frame de 60 Hz); si la mediana lo supera la ejecución de
+                los benchmarks termina con error.
+        """
+        self.name = name
+        self.func = func
+        self.setup = setup
+        self.teardown = teardown
+        self.group = group
+        self.budget = budget
+
+
+def time_calls(func, number):
+    """Cronometra `number` llamadas seguidas y devuelve segundos por llamada."""
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - start) / number
+
+
+def calibrate(func, min_time):
+    """Elige cuántas llamadas hacer por repetición para que dure al menos min_time."""
+    number = 1
+    while True:
+        elapsed = time_calls(func, number) * number
+        if elapsed >= min_time or number >= 1_000_000:
+            return number
+        # Estimar cuántas llamadas faltan, con margen
+        if elapsed <= 0:
+            number *= 10
+        else:
+            number = max(number * 2, int(number * min_time / elapsed * 1.2))
+
+
+def run_benchmark(benchmark, repeat=5, min_time=0.1):
+    """Ejecuta un benchmark y resume sus tiempos.
+
+    Args:
+        benchmark: Benchmark a medir.
+        repeat: Número de repeticiones (se reporta la mediana).
+        min_time: Duración mínima de cada repetición en segundos.
+
+    Returns:
+        Diccionario con nombre, grupo, llamadas por repetición, tiempos
+        por llamada (min, mediana, media, desviación) y presupuesto en
+        segundos.
+    """
+    state = benchmark.setup() if benchmark.setup else None
+    try:
+        func = (lambda: benchmark.func(state)) if benchmark.setup else benchmark.func
+        number = calibrate(func, min_time)
+        samples = [time_calls(func, number) for _ in range(repeat)]
+    finally:
+        if benchmark.teardown:
+            benchmark.teardown(state)
+
+    return {
+        "name": benchmark.name,
+        "group": benchmark.group,
+        "number": number,
+        "repeat": repeat,
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "budget": benchmark.budget,
+    }
+
+
+def machine_metadata(backend):
+    """Datos de la máquina y del entorno para interpretar los resultados."""
+    try:
+        import arcade
+        arcade_version = arcade.version.VERSION
+    except Exception:
+        arcade_version = None
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        ).stdout.strip() or None
+    except Exception:
+        commit = None
+
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "arcade": arcade_version,
+        "numpy": numpy_version,
+        "git_commit": commit,
+        "backend": backend,
+    }
+
+
+def save_results(path, metadata, results):
+    """Guarda los resultados en JSON."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"metadata": metadata, "results": results}, f, ensure_ascii=False, indent=2)
+
+
+def load_results(path):
+    """Carga un archivo de resultados guardado con save_results."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_results(baseline, results, threshold=0.15):
+    """Compara los resultados actuales con una línea base.
+
+    Args:
+        baseline: Contenido de un archivo de resultados (load_results).
+        results: Lista de resultados actuales (run_benchmark).
+        threshold: Aumento relativo de la mediana a partir del cual se
+            considera regresión (0.15 = 15% más lento).
+
+    Returns:
+        Lista de diccionarios con nombre, medianas, razón actual/base y
+        estado ("regresión", "mejora", "igual" o "nuevo").
+    """
+    base_by_name = {r["name"]: r for r in baseline.get("results", [])}
+    comparison = []
+    for result in results:
+        base = base_by_name.get(result["name"])
+        if base is None or base["median"] <= 0:
+            comparison.append({"name": result["name"], "status": "nuevo",
+                               "median": result["median"]})
+            continue
+        ratio = result["median"] / base["median"]
+        if ratio > 1 + threshold:
+            status = "regresión"
+        elif ratio < 1 / (1 + threshold):
+            status = "mejora"
+        else:
+            status = "igual"
+        comparison.append({
+            "name": result["name"],
+            "status": status,
+            "baseline_median": base["median"],
+            "median": result["median"],
+            "ratio": round(ratio, 3),
+        })
+    return comparison
+
+
+def format_time(seconds):
+    """Formatea un tiempo por llamada con la unidad adecuada."""
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.2f} µs"
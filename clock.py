@@ -0,0 +1,78 @@
+"""
+Relojes del juego.
+Los tiempos de respuesta y los temporizadores de las vistas leen la hora de
+un reloj intercambiable en lugar de llamar a time.time() directamente:
+
+- MonotonicClock: hora real monótona de alta resolución (perf_counter_ns;
+  no salta si cambia la hora del sistema).
+- VirtualClock: solo avanza cuando se le pide. Con él una simulación sin
+  pantalla puede recorrer una sesión completa mucho más rápido que en
+  tiempo real y los tiempos de respuesta siguen siendo exactos.
+"""
+
+import time
+
+
+class MonotonicClock:
+    """Reloj real basado en time.perf_counter_ns()."""
+
+    def now(self):
+        """Segundos desde un origen arbitrario."""
+        return time.perf_counter_ns() / 1e9
+
+    def now_ns(self):
+        """Nanosegundos desde un origen arbitrario."""
+        return time.perf_counter_ns()
+
+    def describe(self):
+        """Tipo y resolución del reloj, para el reporte."""
+        return {
+            "clock": "perf_counter_ns",
+            "resolution": time.get_clock_info("perf_counter").resolution,
+        }
+
+
+class VirtualClock:
+    """Reloj que solo avanza con advance()."""
+
+    def __init__(self, start=0.0):
+        self.current = start
+
+    def now(self):
+        """Segundos virtuales transcurridos."""
+        return self.current
+
+    def now_ns(self):
+        """Nanosegundos virtuales transcurridos."""
+        return round(self.current * 1e9)
+
+    def describe(self):
+        """Tipo del reloj, para el reporte (el tiempo virtual es exacto)."""
+        return {"clock": "virtual", "resolution": 0.0}
+
+    def advance(self, seconds):
+        """Adelanta el reloj.
+
+        Args:
+            seconds: Segundos a avanzar (no negativo).
+        """
+        if seconds < 0:
+            raise ValueError("El reloj virtual no puede retroceder")
+        self.current += seconds
+
+
+# Reloj activo
+CLOCK = MonotonicClock()
+
+
+def set_clock(clock):
+    """Cambia el reloj activo y devuelve el anterior."""
+    global CLOCK
+    previous = CLOCK
+    CLOCK = clock
+    return previous
+
+
+def get_clock():
+    """Devuelve el reloj activo."""
+    return CLOCK
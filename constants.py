@@ -41,6 +41,42 @@ SPARKLE_DURATION = 0.5
 # --- Configuración de Juego ---
 TOTAL_LEVELS = 5
 TRIALS_PER_LEVEL = 5  # Número de intentos/rondas por nivel
+FEEDBACK_DURATION = 1.5  # Segundos que se muestra el feedback de cada respuesta
+INSTRUCTIONS_READY_DELAY = 1.5  # Segundos antes de poder empezar un nivel
+
+# --- Exposición del estímulo (Nivel 1) ---
+# Las gemas se muestran un número entero de frames presentados en pantalla,
+# calculado con el refresco medido para durar LEVEL1_EXPOSURE_TIME (90
+# frames a 60 Hz, 180 a 120 Hz). Los instantes reales de aparición y
+# desaparición se miden en el flip de cada frame y se guardan en el intento.
+LEVEL1_EXPOSURE_TIME = 1.5
+LEVEL1_EXPOSURE_FRAMES = 90  # Si todavía no se midió el refresco (se supone 60 Hz)
+
+# --- Modo de estimación extendido (Nivel 4) ---
+# Arreglos grandes de gemas para investigación de estimación por razón y
+# recta numérica. Desactivado por defecto.
+ESTIMATION_EXTENDED_MODE = False
+ESTIMATION_EXTENDED_MIN = 50
+# El tamaño de las gemas y la cantidad máxima salen del costo medido de
+# dibujarlas, para que el frame quepa en 60 fps. Costo de GemBatch.draw en
+# el rasterizador por software de referencia (Mesa llvmpipe, un núcleo),
+# esperando a que termine cada frame: un costo fijo, uno por gema y uno por
+# píxel (tamaño de gema al cuadrado).
+ESTIMATION_GEM_DRAW_BASE = 0.0005  # segundos
+ESTIMATION_GEM_DRAW_COST = 0.000015  # segundos por gema
+ESTIMATION_GEM_PIXEL_COST = 0.00000009  # segundos por píxel de cada gema
+# Parte del frame de 60 Hz para las gemas; el resto es para el fondo, el
+# HUD, los botones y el movimiento
+ESTIMATION_GEM_DRAW_BUDGET = 0.006  # segundos
+ESTIMATION_GEM_MIN_SIZE = 10  # píxeles
+# Cuántas gemas del tamaño mínimo caben en el presupuesto
+ESTIMATION_EXTENDED_MAX = int(
+    (ESTIMATION_GEM_DRAW_BUDGET - ESTIMATION_GEM_DRAW_BASE)
+    / (ESTIMATION_GEM_DRAW_COST + ESTIMATION_GEM_PIXEL_COST * ESTIMATION_GEM_MIN_SIZE ** 2)
+)
+# Cantidad de referencia del modo normal: con ella las desviaciones de
+# las opciones son las originales (±4 y ±8, es decir ±25% y ±50%)
+ESTIMATION_REFERENCE_COUNT = 16
 
 # --- Configuración de Fuentes ---
 FONT_SIZE_TITLE = 48
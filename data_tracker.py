@@ -7,42 +7,145 @@ NOTA IMPORTANTE: Esta es una herramienta de OBSERVACIÓN, NO de diagnóstico.
 """
 
 import time
-import json
+import math
 import os
 from constants import LEVEL_NAMES
+from clock import get_clock, VirtualClock
+from input_timing import INPUT_TIMESTAMP
+from trial_store import (
+    TrialStore, LevelTrials, RECORD_FIELDS,
+    int_column, bool_column, optional_int_column, float_column, answer_column,
+)
+from seeding import new_session_seed
+from scoring import exact_match
+from session_log import SessionLog, read_events
+from report_writer import REPORT_WRITER, write_json_atomic
 
 
 class TrialData:
-    """Datos de un solo intento/ronda dentro de un nivel."""
+    """Datos de un solo intento/ronda dentro de un nivel.
 
-    def __init__(self, level, trial_number, correct_answer):
+    Es una vista sobre una fila de un TrialStore (ver trial_store.py): los
+    atributos se leen y escriben en las columnas del almacén.
+    """
+
+    __slots__ = ("store", "row")
+
+    level = int_column("level")
+    trial_number = int_column("trial_number")
+    correct_answer = answer_column("correct_answer")
+    player_answer = answer_column("player_answer")
+    is_correct = bool_column("is_correct")
+    start_time = float_column("start_time")
+    end_time = float_column("end_time")
+    response_time = float_column("response_time")
+    attempts = int_column("attempts")  # Número de intentos antes de acertar o pasar
+    # Instantes medidos en que el estímulo apareció y desapareció de la
+    # pantalla (solo niveles con exposición breve, ver Nivel 1)
+    stimulus_onset = float_column("stimulus_onset")
+    stimulus_offset = float_column("stimulus_offset")
+    exposure_frames = optional_int_column("exposure_frames")
+    refresh_interval = float_column("refresh_interval")  # Con que se calcularon los frames
+    # Segundos entre la llegada del evento de entrada y su manejador
+    dispatch_delay = float_column("dispatch_delay")
+    # Un frame largo mientras se esperaba la respuesta (ver hitch_watchdog.py)
+    timing_suspect = bool_column("timing_suspect")
+    hitch_count = int_column("hitch_count")
+
+    def __init__(self, level, trial_number, correct_answer, clock=None, store=None):
+        """Inicia el intento en una fila nueva.
+
+        Args:
+            clock: Reloj para medir el tiempo de respuesta (por defecto el
+                activo). Se ignora si se pasa store: se usa el del almacén.
+            store: TrialStore donde guardar el intento (por defecto uno propio).
+        """
+        self.store = store if store is not None else TrialStore(clock or get_clock())
+        self.row = self.store.append()
         self.level = level
         self.trial_number = trial_number
         self.correct_answer = correct_answer
-        self.player_answer = None
-        self.is_correct = False
-        self.start_time = time.time()
-        self.end_time = None
-        self.response_time = None
-        self.attempts = 0  # Número de intentos antes de acertar o pasar
-
-    def record_answer(self, answer):
-        """Registra la respuesta del jugador."""
+        self.start_time = self.clock.now()
+
+    @classmethod
+    def view(cls, store, row):
+        """Vista sobre una fila existente (sin crear un intento nuevo)."""
+        trial = cls.__new__(cls)
+        trial.store = store
+        trial.row = row
+        return trial
+
+    @property
+    def clock(self):
+        return self.store.clock
+
+    def record_answer(self, answer, scoring=exact_match):
+        """Registra la respuesta del jugador.
+
+        Args:
+            answer: Respuesta del jugador.
+            scoring: Regla que decide si es correcta (ver scoring.py).
+
+        Returns:
+            True si la respuesta es correcta.
+        """
         self.attempts += 1
         self.player_answer = answer
-        self.end_time = time.time()
-        self.response_time = self.end_time - self.start_time
+        self.record_response_time()
+        self.is_correct = scoring(answer, self.correct_answer)
+        return self.is_correct
 
-        if isinstance(self.correct_answer, list):
-            self.is_correct = answer == self.correct_answer
-        else:
-            self.is_correct = answer == self.correct_answer
+    def record_response_time(self):
+        """Marca el instante de la respuesta y calcula el tiempo de respuesta.
 
-        return self.is_correct
+        Si se llama mientras se despacha un evento de entrada se usa la hora
+        de llegada del evento (ver input_timing.py) y se guarda el retraso
+        de despacho; si no, la hora actual.
+        """
+        arrival, delay = INPUT_TIMESTAMP.current()
+        self.end_time = arrival if arrival is not None else self.clock.now()
+        self.dispatch_delay = delay
+        # Con exposición breve el tiempo de respuesta cuenta desde que el
+        # estímulo desapareció, no desde que empezó el intento
+        reference = self.stimulus_offset if self.stimulus_offset is not None else self.start_time
+        self.response_time = self.end_time - reference
+
+    def record_stimulus_onset(self, timestamp):
+        """Registra el instante (del reloj del intento) en que apareció el estímulo."""
+        self.stimulus_onset = timestamp
+
+    def record_stimulus_offset(self, timestamp, frames, refresh_interval=None):
+        """Registra el instante en que desapareció el estímulo.
+
+        Args:
+            timestamp: Instante del flip del primer frame sin estímulo.
+            frames: Frames presentados con el estímulo visible.
+            refresh_interval: Intervalo de refresco medido con que se
+                calculó el número de frames, si se conoce.
+        """
+        self.stimulus_offset = timestamp
+        self.exposure_frames = frames
+        self.refresh_interval = refresh_interval
+
+    def exposure_time(self):
+        """Duración medida de la exposición en segundos, o None."""
+        if self.stimulus_onset is None or self.stimulus_offset is None:
+            return None
+        return self.stimulus_offset - self.stimulus_onset
+
+    def to_record(self):
+        """Todos los campos del intento sin redondear (para el registro de la sesión)."""
+        return {name: getattr(self, name) for name in RECORD_FIELDS}
+
+    def restore_record(self, record):
+        """Copia al intento los campos de un diccionario de to_record."""
+        for name in RECORD_FIELDS:
+            if name in record:
+                setattr(self, name, record[name])
 
     def to_dict(self):
         """Convierte los datos a diccionario."""
-        return {
+        data = {
             "level": self.level,
             "trial_number": self.trial_number,
             "correct_answer": self.correct_answer,
@@ -50,7 +153,18 @@ class TrialData:
             "is_correct": self.is_correct,
             "response_time": round(self.response_time, 2) if self.response_time else None,
             "attempts": self.attempts,
+            "timing_suspect": self.timing_suspect,
         }
+        if self.dispatch_delay is not None:
+            data["dispatch_delay"] = round(self.dispatch_delay, 6)
+        if self.stimulus_onset is not None:
+            exposure = self.exposure_time()
+            data["stimulus_onset"] = round(self.stimulus_onset - self.start_time, 4)
+            data["exposure_frames"] = self.exposure_frames
+            data["exposure_time"] = round(exposure, 4) if exposure is not None else None
+            if self.refresh_interval is not None:
+                data["refresh_interval"] = round(self.refresh_interval, 6)
+        return data
 
 
 class DataTracker:
@@ -59,31 +173,187 @@ class DataTracker:
     Registra todos los datos de rendimiento para generar el resumen observacional.
     """
 
-    def __init__(self):
+    def __init__(self, session_seed=None, clock=None):
+        """Inicializa el tracker.
+
+        Args:
+            session_seed: Semilla de la sesión para generar los estímulos.
+                Si es None se crea una nueva; pasar la de un reporte anterior
+                repite exactamente los mismos intentos.
+            clock: Reloj de la sesión (por defecto el activo, ver clock.py).
+        """
+        self.clock = clock or get_clock()
+        self.session_seed = session_seed if session_seed is not None else new_session_seed()
         self.player_name = ""
         self.player_age = ""
-        self.session_start = time.time()
+        self.session_start = self.clock.now()
         self.session_end = None
-        self.level_data = {1: [], 2: [], 3: [], 4: [], 5: []}
+        # Todos los intentos de la sesión en columnas; level_data guarda las
+        # filas de los intentos respondidos de cada nivel
+        self.trials = TrialStore(self.clock)
+        self.level_data = {level: LevelTrials(self.trials, TrialData) for level in range(1, 6)}
         self.current_trial = None
+        # Funciones listener(trial) llamadas al completar cada intento
+        self.trial_listeners = []
+        self.completed_levels = []
+        self.event_log = None  # SessionLog con los eventos de la sesión (opcional)
+        self.recovered_timing = None  # Reloj original de una sesión recuperada
+        self.report_file = None  # Ruta del último reporte guardado
+        self.reports_saving = 0  # Guardados de save_report_async sin terminar
 
     def set_player_info(self, name, age):
         """Establece la información del jugador."""
         self.player_name = name
         self.player_age = age
 
+    def open_event_log(self, path=None):
+        """Empieza a registrar los eventos de la sesión en disco (ver session_log.py).
+
+        Llamarlo después de set_player_info: el primer evento guarda los
+        datos del jugador y la semilla para poder recuperar la sesión.
+
+        Args:
+            path: Archivo JSON Lines; por defecto sesion_<jugador>_<hora>.jsonl.
+
+        Returns:
+            Ruta del registro, o None si no se pudo abrir.
+        """
+        if path is None:
+            path = f"sesion_{self.player_name}_{int(time.time())}.jsonl"
+        try:
+            self.event_log = SessionLog(path)
+        except OSError as e:
+            print(f"Aviso: no se pudo crear el registro de la sesión {path}: {e}")
+            return None
+        self.log_event(
+            "session",
+            player_name=self.player_name,
+            player_age=self.player_age,
+            session_seed=self.session_seed,
+            started_at=time.time(),
+            timing=self.clock.describe(),
+        )
+        return path
+
+    def close_event_log(self, wait=True):
+        """Escribe los eventos pendientes y cierra el registro.
+
+        Si hay un reporte guardándose en segundo plano no se cierra todavía:
+        save_report_async lo cierra cuando el reporte ya está en disco, así
+        el evento "report" no se pierde.
+
+        Args:
+            wait: False para no esperar al disco (ver SessionLog.close).
+        """
+        if self.event_log is not None and not self.reports_saving:
+            self.event_log.close(wait)
+
+    def log_event(self, kind, **fields):
+        """Agrega un evento al registro de la sesión (si hay uno abierto)."""
+        if self.event_log is not None:
+            fields["event"] = kind
+            fields["t"] = self.clock.now()
+            self.event_log.write(fields)
+
     def start_trial(self, level, trial_number, correct_answer):
         """Inicia un nuevo intento/ronda."""
-        self.current_trial = TrialData(level, trial_number, correct_answer)
+        self.current_trial = TrialData(level, trial_number, correct_answer, store=self.trials)
+        self.log_event(
+            "trial_start", level=level, trial=trial_number, correct_answer=correct_answer
+        )
         return self.current_trial
 
-    def record_answer(self, answer):
-        """Registra la respuesta del intento actual."""
+    def record_stimulus_onset(self, timestamp):
+        """Registra la aparición del estímulo del intento actual."""
+        if self.current_trial:
+            self.current_trial.record_stimulus_onset(timestamp)
+
+    def record_stimulus_offset(self, timestamp, frames, refresh_interval=None):
+        """Registra la desaparición del estímulo del intento actual."""
         if self.current_trial:
-            result = self.current_trial.record_answer(answer)
-            self.level_data[self.current_trial.level].append(self.current_trial)
-            return result
-        return False
+            self.current_trial.record_stimulus_offset(timestamp, frames, refresh_interval)
+
+    def record_answer(self, answer, scoring=exact_match):
+        """Completa el intento actual con la respuesta del jugador.
+
+        Es el único camino para terminar un intento en todos los niveles:
+        registra la respuesta y el tiempo, actualiza los acumulados del
+        nivel y avisa a los trial_listeners.
+
+        Args:
+            answer: Respuesta del jugador.
+            scoring: Regla de calificación del nivel (ver scoring.py); por
+                defecto la respuesta debe ser exacta.
+
+        Returns:
+            True si la respuesta es correcta (False si no hay intento en curso).
+        """
+        trial = self.current_trial
+        if not trial:
+            return False
+        result = trial.record_answer(answer, scoring)
+        self.level_data[trial.level].append(trial)
+        self.log_event("answer", trial=trial.to_record())
+        for listener in self.trial_listeners:
+            listener(trial)
+        return result
+
+    def record_level_complete(self, level):
+        """Registra que el jugador terminó todos los intentos de un nivel."""
+        self.completed_levels.append(level)
+        self.log_event("level_complete", level=level)
+
+    @classmethod
+    def recover(cls, path):
+        """Reconstruye un tracker desde el registro de una sesión interrumpida.
+
+        Los intentos respondidos se restauran con sus tiempos originales; el
+        intento que quedó sin respuesta queda como current_trial. El reloj
+        del tracker es virtual y se detiene en el último evento, así la
+        duración de la sesión del reporte es la que llegó a registrarse.
+
+        Args:
+            path: Archivo escrito por open_event_log (puede estar incompleto).
+
+        Returns:
+            DataTracker con los datos de la sesión.
+
+        Raises:
+            ValueError: Si el archivo no empieza con los datos de la sesión.
+        """
+        events = read_events(path)
+        if not events or events[0].get("event") != "session":
+            raise ValueError(f"{path} no es un registro de sesión")
+        header = events[0]
+        clock = VirtualClock(header["t"])
+        tracker = cls(session_seed=header["session_seed"], clock=clock)
+        tracker.set_player_info(header["player_name"], header["player_age"])
+        tracker.recovered_timing = header.get("timing")
+
+        for event in events[1:]:
+            if event["t"] > clock.now():
+                clock.advance(event["t"] - clock.now())
+            kind = event["event"]
+            if kind == "trial_start":
+                tracker.start_trial(event["level"], event["trial"], event["correct_answer"])
+            elif kind == "answer":
+                record = event["trial"]
+                trial = tracker.current_trial
+                if (
+                    trial is None
+                    or trial.level != record["level"]
+                    or trial.trial_number != record["trial_number"]
+                ):
+                    trial = tracker.start_trial(
+                        record["level"], record["trial_number"], record["correct_answer"]
+                    )
+                trial.restore_record(record)
+                tracker.level_data[trial.level].append(trial)
+            elif kind == "level_complete":
+                tracker.completed_levels.append(event["level"])
+            elif kind == "report":
+                tracker.report_file = event["file"]
+        return tracker
 
     def get_level_summary(self, level):
         """Obtiene un resumen del rendimiento en un nivel específico."""
@@ -91,32 +361,42 @@ class DataTracker:
         if not trials:
             return None
 
-        total = len(trials)
-        correct = sum(1 for t in trials if t.is_correct)
-        times = [t.response_time for t in trials if t.response_time is not None]
-        avg_time = sum(times) / len(times) if times else 0
-        total_attempts = sum(t.attempts for t in trials)
+        # Acumulados del nivel (se actualizan al registrar cada respuesta)
+        stats = trials.stats
+        total = stats.count
+        correct = stats.correct
+        avg_time = stats.time_sum / stats.time_count if stats.time_count else 0
 
-        return {
+        summary = {
             "level": level,
             "level_name": LEVEL_NAMES.get(level, f"Nivel {level}"),
             "total_trials": total,
             "correct": correct,
             "accuracy": round((correct / total) * 100, 1) if total > 0 else 0,
             "avg_response_time": round(avg_time, 2),
-            "total_attempts": total_attempts,
+            "response_time_sd": round(math.sqrt(stats.time_variance()), 2),
+            "min_response_time": round(stats.time_min, 2) if stats.time_min is not None else None,
+            "max_response_time": round(stats.time_max, 2) if stats.time_max is not None else None,
+            "total_attempts": stats.attempts,
             "errors": total - correct,
+            "timing_suspect_trials": list(stats.suspect_trials),
         }
+        if stats.exposure_count:
+            # Exposición medida del estímulo (debería ser casi constante)
+            summary["avg_exposure_time"] = round(stats.exposure_sum / stats.exposure_count, 4)
+            summary["exposure_time_range"] = round(stats.exposure_max - stats.exposure_min, 4)
+        return summary
 
     def get_full_report(self):
         """Genera el reporte observacional completo."""
-        self.session_end = time.time()
+        self.session_end = self.clock.now()
         total_time = self.session_end - self.session_start
 
         report = {
             "player_name": self.player_name,
             "player_age": self.player_age,
             "total_session_time": round(total_time, 1),
+            "session_seed": self.session_seed,
             "levels": {},
             "observations": [],
             "disclaimer": (
@@ -160,27 +440,89 @@ class DataTracker:
                         f"Podria indicar inseguridad o dificultad con el concepto."
                     )
 
+                if summary["timing_suspect_trials"]:
+                    report["observations"].append(
+                        f"{summary['level_name']}: El juego se detuvo momentaneamente en "
+                        f"{len(summary['timing_suspect_trials'])} ronda(s); sus tiempos "
+                        f"pueden no ser exactos."
+                    )
+
         report["overall_accuracy"] = (
             round((all_correct / all_total) * 100, 1) if all_total > 0 else 0
         )
         report["overall_correct"] = all_correct
         report["overall_total"] = all_total
+        report["timing"] = self.get_timing_precision()
 
         return report
 
-    def save_report_to_file(self, report):
-        """Guarda el reporte en un archivo JSON."""
-        filename = f"reporte_{self.player_name}_{int(time.time())}.json"
-        # Convertir datos de trials a diccionarios serializables
-        serializable_report = report.copy()
-        for level_key, level_val in serializable_report.get("levels", {}).items():
-            if isinstance(level_val, dict):
-                serializable_report["levels"][level_key] = level_val
+    def get_timing_precision(self):
+        """Precisión de las mediciones de tiempo de la sesión.
 
+        Returns:
+            Diccionario con el reloj usado y su resolución, y el retraso de
+            despacho (promedio y máximo) de las respuestas con hora de
+            llegada del evento de entrada.
+        """
+        stats = [trials.stats for trials in self.level_data.values()]
+        count = sum(s.delay_count for s in stats)
+        maxima = [s.delay_max for s in stats if s.delay_max is not None]
+        timing = dict(self.recovered_timing) if self.recovered_timing else self.clock.describe()
+        timing["timestamped_responses"] = count
+        timing["avg_dispatch_delay"] = (
+            round(sum(s.delay_sum for s in stats) / count, 6) if count else None
+        )
+        timing["max_dispatch_delay"] = round(max(maxima), 6) if maxima else None
+        return timing
+
+    def report_filename(self):
+        """Nombre del archivo para un reporte nuevo del jugador."""
+        return f"reporte_{self.player_name}_{int(time.time())}.json"
+
+    def save_report_to_file(self, report):
+        """Guarda el reporte en un archivo JSON (en el hilo actual)."""
+        filename = self.report_filename()
         try:
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(serializable_report, f, ensure_ascii=False, indent=2)
-            return filename
+            write_json_atomic(report, filename)
         except Exception as e:
             print(f"Error al guardar reporte: {e}")
-            return None
\ No newline at end of file
+            return None
+        self._report_saved(filename)
+        return filename
+
+    def save_report_async(self, report, callback=None, writer=REPORT_WRITER):
+        """Guarda el reporte en segundo plano (ver report_writer.py).
+
+        Al terminar (bien o mal) se cierra el registro de la sesión de este
+        tracker: el reporte es su último evento.
+
+        Args:
+            report: Reporte de get_full_report; no debe modificarse mientras
+                se guarda.
+            callback: Función callback(filename) que se llama en el hilo
+                principal (desde writer.poll()) cuando el archivo ya está en
+                disco; filename es None si no se pudo guardar.
+            writer: ReportWriter que hace el guardado.
+
+        Returns:
+            Ruta del archivo que se está escribiendo.
+        """
+        def done(filename, error):
+            if error is not None:
+                print(f"Error al guardar reporte: {error}")
+                filename = None
+            else:
+                self._report_saved(filename)
+            self.reports_saving -= 1
+            self.close_event_log(wait=False)
+            if callback is not None:
+                callback(filename)
+
+        filename = self.report_filename()
+        self.reports_saving += 1
+        writer.submit(report, filename, done)
+        return filename
+
+    def _report_saved(self, filename):
+        self.report_file = filename
+        self.log_event("report", file=filename)
@@ -0,0 +1,126 @@
+"""
+Ejecución de las vistas sin pantalla ni OpenGL.
+HeadlessWindow reemplaza a arcade.Window: guarda la vista actual y el
+tracker, y avanza los frames a mano. Junto con el NullBackend de
+views/render.py permite ejecutar los niveles miles de veces por segundo
+en máquinas sin GPU (por ejemplo para pruebas y mediciones). Con un
+VirtualClock (clock.py) cada frame avanza exactamente delta_time segundos
+de tiempo de juego, sin importar cuánto tarde en ejecutarse.
+
+Uso:
+    window = create_headless_window()
+    window.tracker = DataTracker()
+    window.show_view(Level1View())
+    window.run_frames(600)
+    close_headless_window(window)
+"""
+
+import arcade
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from clock import VirtualClock, set_clock
+from views import render
+from views.frame_timing import notify_flip
+from scheduler import SCHEDULER
+from report_writer import REPORT_WRITER
+
+
+class HeadlessWindow:
+    """Ventana sin pantalla con la interfaz mínima que usan las vistas."""
+
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        self.width = width
+        self.height = height
+        self.background_color = (0, 0, 0)
+        self.tracker = None
+        self.current_view = None
+        self.frame_count = 0
+        self.backend = None
+        self.previous_backend = None
+        self.clock = None
+        self.previous_clock = None
+
+    def show_view(self, view):
+        """Cambia la vista actual, igual que arcade.Window.show_view."""
+        if self.current_view is not None:
+            self.current_view.on_hide_view()
+        self.current_view = view
+        view.on_show_view()
+
+    def clear(self, color=None, normalized=False, viewport=None):
+        """No hace nada: no hay pantalla que limpiar."""
+
+    def step(self, delta_time=1 / 60, draw=True):
+        """Avanza un frame: temporizadores, on_update y on_draw de la vista actual.
+
+        Si la ventana usa un reloj virtual, primero lo adelanta delta_time.
+
+        Args:
+            delta_time: Duración del frame en segundos.
+            draw: False para saltar on_draw (solo lógica).
+        """
+        view = self.current_view
+        if view is None:
+            return
+        if self.clock is not None:
+            self.clock.advance(delta_time)
+        SCHEDULER.run_due()
+        # Los guardados terminados avisan aunque su vista ya no esté (ver report_writer.py)
+        REPORT_WRITER.poll()
+        # Un temporizador pudo cambiar de vista
+        view = self.current_view
+        view.on_update(delta_time)
+        # La vista pudo cambiar durante on_update (fin de nivel)
+        if draw:
+            self.current_view.on_draw()
+            self.flip()
+        self.frame_count += 1
+
+    def flip(self):
+        """Presenta el frame dibujado (aquí solo avisa a la vista, ver on_flip)."""
+        notify_flip(self)
+
+    def run_frames(self, frames, delta_time=1 / 60, draw=True):
+        """Avanza varios frames seguidos con un paso de tiempo fijo."""
+        for _ in range(frames):
+            self.step(delta_time, draw)
+
+    def advance(self, seconds, max_step=0.25, draw=False):
+        """Avanza `seconds` segundos de juego en frames de hasta max_step.
+
+        Sirve para saltar esperas largas (feedback, tiempo de respuesta)
+        con pocos frames.
+        """
+        while seconds > 1e-9:
+            delta_time = min(seconds, max_step)
+            self.step(delta_time, draw)
+            seconds -= delta_time
+
+
+def create_headless_window(record=False, virtual_clock=True):
+    """Crea una ventana sin pantalla y activa el backend nulo.
+
+    Args:
+        record: True para que el backend guarde cada primitiva dibujada.
+        virtual_clock: True para activar un VirtualClock que avanza con
+            cada frame (queda en window.clock). Con False se usa el reloj real.
+
+    Returns:
+        HeadlessWindow registrada como ventana actual de arcade (las vistas
+        la obtienen con arcade.get_window()). Su backend queda en window.backend.
+    """
+    window = HeadlessWindow()
+    window.backend = render.NullBackend(record=record)
+    window.previous_backend = render.set_backend(window.backend)
+    if virtual_clock:
+        window.clock = VirtualClock()
+        window.previous_clock = set_clock(window.clock)
+    arcade.set_window(window)
+    return window
+
+
+def close_headless_window(window):
+    """Restaura el backend y el reloj anteriores y deja de registrar la ventana en arcade."""
+    render.set_backend(window.previous_backend)
+    if window.previous_clock is not None:
+        set_clock(window.previous_clock)
+    arcade.set_window(None)
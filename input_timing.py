@@ -0,0 +1,77 @@
+"""
+Hora de llegada de los eventos de entrada.
+Los clics y las teclas pasan por window.dispatch_event antes de llegar a la
+vista. install_input_timestamps envuelve ese método para anotar la hora
+(con el reloj de la sesión) en cuanto el evento entra, antes de recorrer
+los manejadores. Mientras el evento se despacha, DataTracker toma esa hora
+como instante de la respuesta y guarda cuánto tardó el evento en llegar
+al manejador (retraso de despacho).
+
+El despacho completo también se mide con el detector de tirones
+(views/hitch_watchdog.py): en los manejadores de clics se registran las
+respuestas y se prepara el siguiente estado de la vista.
+"""
+
+import time
+
+from clock import get_clock
+from views.hitch_watchdog import HITCH_WATCHDOG
+
+# Eventos cuyo instante de llegada se anota
+INPUT_EVENTS = frozenset((
+    "on_mouse_press", "on_mouse_release", "on_key_press", "on_key_release",
+))
+
+
+class InputTimestamp:
+    """Instante de llegada del evento de entrada que se está despachando."""
+
+    def __init__(self):
+        self.event_type = None
+        self.arrival = None     # Segundos del reloj de la sesión
+        self.arrival_ns = None  # perf_counter_ns real, para el retraso de despacho
+
+    def begin(self, event_type, clock):
+        self.arrival_ns = time.perf_counter_ns()
+        self.arrival = clock.now()
+        self.event_type = event_type
+
+    def end(self):
+        self.event_type = None
+        self.arrival = None
+        self.arrival_ns = None
+
+    def current(self):
+        """Llegada del evento en curso.
+
+        Returns:
+            Tupla (instante en segundos del reloj de la sesión, retraso de
+            despacho en segundos), o (None, None) si no se está despachando
+            un evento de entrada (por ejemplo en una simulación).
+        """
+        if self.event_type is None:
+            return None, None
+        return self.arrival, (time.perf_counter_ns() - self.arrival_ns) / 1e9
+
+
+# Evento de entrada en curso (los eventos se despachan en el hilo principal)
+INPUT_TIMESTAMP = InputTimestamp()
+
+
+def install_input_timestamps(window):
+    """Anota la hora de llegada de cada evento de entrada de la ventana."""
+    dispatch_event = window.dispatch_event
+
+    def dispatch_with_timestamp(event_type, *args):
+        if event_type not in INPUT_EVENTS:
+            return dispatch_event(event_type, *args)
+        tracker = getattr(window, "tracker", None)
+        INPUT_TIMESTAMP.begin(event_type, tracker.clock if tracker else get_clock())
+        try:
+            return HITCH_WATCHDOG.watch(
+                window.current_view, event_type, dispatch_event, event_type, *args
+            )
+        finally:
+            INPUT_TIMESTAMP.end()
+
+    window.dispatch_event = dispatch_with_timestamp
@@ -3,17 +3,71 @@ NumWorld - Aventura Numérica
 
 """
 
+import argparse
+
 import arcade
 from constants import SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE
 from views.menu_view import MenuView
+from views.gem_atlas import load_gem_atlas
+from views.frame_timing import FRAME_STATS, install_overlay_key, install_flip_hook
+from views.hitch_watchdog import HITCH_WATCHDOG, HITCH_BUDGET, watch_timers
+from profiler import SamplingProfiler, view_context
+from input_timing import install_input_timestamps
+from scheduler import SCHEDULER, install_pyglet_driver
+from data_tracker import DataTracker
+from report_writer import REPORT_WRITER, install_pyglet_poll
 
 
 def main():
     """Función principal que inicia el juego."""
+    parser = argparse.ArgumentParser(description=SCREEN_TITLE)
+    parser.add_argument(
+        "--profile", nargs="?", const="", default=None, metavar="ARCHIVO",
+        help="Perfilar la sesión por muestreo y guardar las pilas colapsadas "
+             "(por defecto junto al reporte)",
+    )
+    parser.add_argument(
+        "--hitch-budget", type=float, default=HITCH_BUDGET * 1000, metavar="MS",
+        help="Duración de frame (ms) a partir de la cual se registra un tirón",
+    )
+    parser.add_argument(
+        "--recover", metavar="REGISTRO",
+        help="Generar el reporte de una sesión interrumpida desde su registro "
+             "(sesion_*.jsonl) sin abrir el juego",
+    )
+    args = parser.parse_args()
+
+    if args.recover:
+        recover_report(args.recover)
+        return
+
     # Crear ventana del juego
-    window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, resizable=False)
+    # vsync: cada flip espera al refresco de la pantalla (exposición exacta del Nivel 1)
+    window = arcade.Window(
+        SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, resizable=False, vsync=True
+    )
     window.set_location(100, 50)
 
+    # Cargar (o generar la primera vez) el atlas de texturas de gemas
+    load_gem_atlas()
+
+    # Los clics y teclas se marcan con su hora de llegada (tiempos de respuesta)
+    install_input_timestamps(window)
+
+    # Los temporizadores de las vistas se ejecutan justo en su plazo
+    install_pyglet_driver()
+    # Los temporizadores (cambio de intento y de nivel) también se vigilan por tirones
+    watch_timers(SCHEDULER)
+
+    # Los reportes guardados en segundo plano avisan desde el bucle principal
+    install_pyglet_poll()
+
+    # Las vistas reciben on_flip() cuando su frame llega a la pantalla
+    install_flip_hook(window)
+
+    # F3 muestra los tiempos de frame de la vista actual
+    install_overlay_key(window)
+
     # Inicializar el tracker como atributo de la ventana (se configurará al iniciar partida)
     window.tracker = None
 
@@ -21,9 +75,59 @@ def main():
     menu_view = MenuView()
     window.show_view(menu_view)
 
+    # Vigilar los frames largos durante toda la sesión
+    HITCH_WATCHDOG.budget = args.hitch_budget / 1000
+    HITCH_WATCHDOG.start()
+
+    profiler = None
+    if args.profile is not None:
+        profiler = SamplingProfiler(context=view_context(window))
+        profiler.start()
+
     # Iniciar el bucle del juego
     arcade.run()
 
+    HITCH_WATCHDOG.stop()
+
+    # Si la ventana se cerró mientras se guardaba el reporte, esperar a que termine
+    REPORT_WRITER.wait()
+    tracker = window.tracker
+    if tracker:
+        tracker.close_event_log()
+
+    # Guardar los tiempos de frame, los tirones (y el perfil) junto al reporte de la
+    # sesión; sin reporte solo se guardan si se pidió perfilar
+    report_file = tracker.report_file if tracker else None
+    if report_file or profiler is not None:
+        FRAME_STATS.save(report_file)
+        HITCH_WATCHDOG.save(report_file)
+    if profiler is not None:
+        profiler.stop()
+        filename = args.profile or None
+        if filename is None and report_file:
+            base = report_file[:-5] if report_file.endswith(".json") else report_file
+            filename = f"{base}_profile.txt"
+        filename = profiler.save(filename)
+        if filename:
+            print(f"Perfil guardado en {filename} ({profiler.samples} muestras)")
+
+
+def recover_report(path):
+    """Guarda el reporte de una sesión interrumpida a partir de su registro."""
+    try:
+        tracker = DataTracker.recover(path)
+    except (OSError, ValueError) as e:
+        print(f"Error al recuperar la sesión: {e}")
+        return
+    report = tracker.get_full_report()
+    filename = tracker.save_report_to_file(report)
+    if filename:
+        print(
+            f"Reporte recuperado en {filename} "
+            f"({report['overall_total']} intentos, niveles terminados: "
+            f"{tracker.completed_levels or 'ninguno'})"
+        )
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,242 @@
+"""
+Colocación de gemas sin superposición.
+Muestreo de disco de Poisson sobre una cuadrícula uniforme: cada celda mide
+min_distance / sqrt(2), así que contiene como máximo un punto y comprobar
+si un candidato está demasiado cerca solo requiere mirar las celdas vecinas.
+El costo por gema es constante y colocar n gemas es casi lineal en n.
+
+Si el muestreo aleatorio no logra colocar todas las gemas en un área muy
+llena, se usa una cuadrícula (hexagonal o cuadrada) con un pequeño
+desplazamiento aleatorio, que siempre respeta la distancia mínima.
+"""
+
+import math
+import random
+
+
+class PlacementError(ValueError):
+    """No se pudieron colocar `count` puntos en el área con la distancia mínima."""
+
+
+class PlacementGrid:
+    """Cuadrícula de aceleración para consultas de distancia mínima."""
+
+    def __init__(self, bounds, min_distance):
+        """Inicializa la cuadrícula vacía.
+
+        Args:
+            bounds: Tupla (izquierda, derecha, abajo, arriba) del área.
+            min_distance: Distancia mínima entre dos puntos.
+        """
+        self.left, self.right, self.bottom, self.top = bounds
+        self.min_distance = min_distance
+        self.cell_size = min_distance / math.sqrt(2)
+        self.cols = int((self.right - self.left) / self.cell_size) + 1
+        self.rows = int((self.top - self.bottom) / self.cell_size) + 1
+        self.cells = {}
+
+    def _cell(self, x, y):
+        return (
+            int((x - self.left) / self.cell_size),
+            int((y - self.bottom) / self.cell_size),
+        )
+
+    def contains(self, x, y):
+        """Indica si (x, y) está dentro del área."""
+        return self.left <= x <= self.right and self.bottom <= y <= self.top
+
+    def fits(self, x, y):
+        """Indica si (x, y) respeta la distancia mínima con los puntos existentes."""
+        col, row = self._cell(x, y)
+        limit = self.min_distance * self.min_distance
+        for c in range(col - 2, col + 3):
+            for r in range(row - 2, row + 3):
+                point = self.cells.get((c, r))
+                if point is not None:
+                    dx = point[0] - x
+                    dy = point[1] - y
+                    if dx * dx + dy * dy < limit:
+                        return False
+        return True
+
+    def add(self, x, y):
+        """Registra un punto (debe cumplir fits)."""
+        self.cells[self._cell(x, y)] = (x, y)
+
+
+def max_points(bounds, min_distance):
+    """Cota superior del número de puntos que caben en el área.
+
+    Usa el empaquetamiento hexagonal (el más denso posible) más un margen
+    por los bordes, así que si count la supera la colocación es imposible.
+
+    Args:
+        bounds: Tupla (izquierda, derecha, abajo, arriba).
+        min_distance: Distancia mínima entre puntos.
+
+    Returns:
+        Número máximo de puntos (entero).
+    """
+    width = bounds[1] - bounds[0]
+    height = bounds[3] - bounds[2]
+    if min_distance <= 0:
+        return math.inf
+    area = (width + min_distance) * (height + min_distance)
+    return int(area / (math.sqrt(3) / 2 * min_distance * min_distance))
+
+
+def poisson_disk_sample(bounds, min_distance, count, attempts=30, rng=None):
+    """Genera `count` puntos aleatorios separados al menos por min_distance.
+
+    Primero se prueban posiciones uniformes en toda el área (así la
+    distribución no depende de un punto inicial). Si una gema no encuentra
+    lugar tras `attempts` intentos, el resto se coloca con el algoritmo de
+    Bridson: se buscan candidatos en el anillo [d, 2d] alrededor de los
+    puntos ya colocados hasta agotar el espacio libre. Si aun así faltan
+    gemas, todas se colocan en una cuadrícula (ver lattice_sample).
+
+    Args:
+        bounds: Tupla (izquierda, derecha, abajo, arriba) del área.
+        min_distance: Distancia mínima entre dos puntos.
+        count: Número de puntos a colocar.
+        attempts: Intentos por punto antes de cambiar de estrategia.
+        rng: Generador aleatorio (random.Random); por defecto el módulo random.
+
+    Returns:
+        Lista de tuplas (x, y).
+
+    Raises:
+        PlacementError: Si count supera max_points (la colocación es
+            imposible) o si ni el muestreo ni la cuadrícula lograron
+            colocar todos los puntos.
+    """
+    rng = rng or random
+    left, right, bottom, top = bounds
+    if count <= 0:
+        return []
+    if right < left or top < bottom:
+        raise PlacementError(f"Área vacía: {bounds}")
+    if count > max_points(bounds, min_distance):
+        raise PlacementError(
+            f"No caben {count} gemas a distancia {min_distance} en {bounds}"
+        )
+
+    grid = PlacementGrid(bounds, min_distance)
+    points = []
+
+    # Fase 1: posiciones uniformes en toda el área
+    while len(points) < count:
+        for _ in range(attempts):
+            x = rng.uniform(left, right)
+            y = rng.uniform(bottom, top)
+            if grid.fits(x, y):
+                grid.add(x, y)
+                points.append((x, y))
+                break
+        else:
+            break
+
+    # Fase 2: Bridson a partir de los puntos ya colocados
+    active = list(points)
+    if not active:
+        x, y = rng.uniform(left, right), rng.uniform(bottom, top)
+        grid.add(x, y)
+        points.append((x, y))
+        active.append((x, y))
+
+    while len(points) < count:
+        if not active:
+            # El muestreo aleatorio se trabó: colocar todo en una cuadrícula
+            return lattice_sample(bounds, min_distance, count, rng)
+        index = rng.randrange(len(active))
+        ax, ay = active[index]
+        for _ in range(attempts):
+            angle = rng.uniform(0, 2 * math.pi)
+            radius = rng.uniform(min_distance, 2 * min_distance)
+            x = ax + math.cos(angle) * radius
+            y = ay + math.sin(angle) * radius
+            if grid.contains(x, y) and grid.fits(x, y):
+                grid.add(x, y)
+                points.append((x, y))
+                active.append((x, y))
+                break
+        else:
+            # Sin espacio alrededor de este punto
+            active[index] = active[-1]
+            active.pop()
+
+    return points
+
+
+def lattice_points(bounds, min_distance):
+    """Puntos de la cuadrícula más densa (hexagonal o cuadrada) que cabe en el área.
+
+    Las filas y columnas se estiran hasta los bordes del área, así que la
+    separación entre vecinos es al menos min_distance.
+
+    Returns:
+        Tupla (lista de puntos (x, y), distancia mínima entre vecinos).
+    """
+    left, right, bottom, top = bounds
+    width = right - left
+    height = top - bottom
+    cols = int(width / min_distance) + 1
+    rows = int(height / min_distance) + 1
+
+    def axis(start, length, n):
+        if n == 1:
+            return [start + length / 2], math.inf
+        step = length / (n - 1)
+        return [start + i * step for i in range(n)], step
+
+    xs, step_x = axis(left, width, cols)
+    ys, step_y = axis(bottom, height, rows)
+    best = [(x, y) for y in ys for x in xs], min(step_x, step_y)
+
+    # Hexagonal: filas a d·√3/2, las impares corridas media columna
+    hex_rows = int(height / (min_distance * math.sqrt(3) / 2)) + 1
+    if cols >= 2 and hex_rows >= 2:
+        xs, step_x = axis(left, width, cols)
+        ys, step_y = axis(bottom, height, hex_rows)
+        points = []
+        for row, y in enumerate(ys):
+            if row % 2 == 0:
+                points.extend((x, y) for x in xs)
+            else:
+                points.extend((x + step_x / 2, y) for x in xs[:-1])
+        spacing = min(step_x, math.hypot(step_x / 2, step_y))
+        if len(points) > len(best[0]):
+            best = points, spacing
+    return best
+
+
+def lattice_sample(bounds, min_distance, count, rng=None):
+    """Coloca `count` puntos en posiciones de una cuadrícula, con desplazamiento aleatorio.
+
+    Se eligen al azar `count` posiciones de lattice_points y cada punto se
+    mueve dentro de un círculo de radio (separación - min_distance) / 2, así
+    que la distancia mínima se respeta siempre.
+
+    Raises:
+        PlacementError: Si la cuadrícula no tiene suficientes posiciones.
+    """
+    rng = rng or random
+    left, right, bottom, top = bounds
+    lattice, spacing = lattice_points(bounds, min_distance)
+    if count > len(lattice):
+        raise PlacementError(
+            f"El muestreo no logró colocar {count} gemas a distancia {min_distance} "
+            f"en {bounds} (la cuadrícula tiene {len(lattice)} posiciones)"
+        )
+    jitter = max(0.0, (spacing - min_distance) / 2) if spacing != math.inf else 0.0
+    points = []
+    for x, y in rng.sample(lattice, count):
+        angle = rng.uniform(0, 2 * math.pi)
+        radius = jitter * math.sqrt(rng.random())
+        jx = x + math.cos(angle) * radius
+        jy = y + math.sin(angle) * radius
+        # Fuera del área se deja la posición de la cuadrícula
+        if left <= jx <= right and bottom <= jy <= top:
+            x, y = jx, jy
+        points.append((x, y))
+    return points
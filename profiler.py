@@ -0,0 +1,137 @@
+"""
+Perfilador por muestreo.
+Un hilo toma cada pocos milisegundos la pila del hilo principal con
+sys._current_frames() y cuenta cuántas veces aparece cada pila. A diferencia
+de cProfile no instrumenta cada llamada, así que no deforma el tiempo de los
+callbacks de arcade de cada frame.
+
+La salida usa el formato de pilas colapsadas ("a;b;c 42" por línea) que
+leen flamegraph.pl, speedscope e inferno. Cada pila empieza con la vista
+activa y el intento en curso, por ejemplo:
+
+    Level4View;intento 3;main.py:main;...;level_base.py:draw 17
+"""
+
+import os
+import sys
+import threading
+import time
+
+# Segundos entre muestras (200 por segundo)
+PROFILE_INTERVAL = 0.005
+
+# Profundidad máxima de pila registrada
+PROFILE_MAX_DEPTH = 128
+
+
+def frame_name(frame):
+    """Nombre corto de un frame: archivo:función."""
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+class SamplingProfiler:
+    """Muestrea periódicamente la pila de un hilo desde un hilo aparte."""
+
+    def __init__(self, context=None, interval=PROFILE_INTERVAL, thread_id=None):
+        """Inicializa el perfilador.
+
+        Args:
+            context: Función sin argumentos que devuelve una lista de
+                etiquetas que se antepone a cada pila (vista e intento).
+            interval: Segundos entre muestras.
+            thread_id: Hilo a muestrear; por defecto el hilo que lo crea.
+        """
+        self.context = context
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.stacks = {}
+        self.samples = 0
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    def sample(self):
+        """Toma una muestra de la pila del hilo observado."""
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return
+        names = []
+        while frame is not None and len(names) < PROFILE_MAX_DEPTH:
+            names.append(frame_name(frame))
+            frame = frame.f_back
+        names.reverse()
+        if self.context:
+            try:
+                names = list(self.context()) + names
+            except Exception:
+                pass
+        stack = ";".join(names)
+        self.stacks[stack] = self.stacks.get(stack, 0) + 1
+        self.samples += 1
+
+    def _run(self):
+        next_time = time.perf_counter()
+        while not self.stop_event.is_set():
+            self.sample()
+            # Mantener la frecuencia sin acumular el retraso de cada muestra
+            next_time += self.interval
+            delay = next_time - time.perf_counter()
+            if delay < 0:
+                next_time = time.perf_counter()
+                delay = 0
+            self.stop_event.wait(delay)
+
+    def start(self):
+        """Inicia el hilo de muestreo."""
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, name="SamplingProfiler", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Detiene el hilo de muestreo y espera a que termine."""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def collapsed(self):
+        """Pilas en formato colapsado, de la más frecuente a la menos."""
+        lines = sorted(self.stacks.items(), key=lambda item: item[1], reverse=True)
+        return "\n".join(f"{stack} {count}" for stack, count in lines) + "\n"
+
+    def save(self, filename=None):
+        """Guarda las pilas colapsadas.
+
+        Args:
+            filename: Ruta del archivo. Por defecto profile_<timestamp>.txt.
+
+        Returns:
+            Ruta del archivo guardado o None si hubo un error.
+        """
+        if filename is None:
+            filename = f"profile_{int(time.time())}.txt"
+        try:
+            with open(filename, "w", encoding="utf-8") as f:
+                f.write(self.collapsed())
+            return filename
+        except Exception as e:
+            print(f"Aviso: No se pudo guardar el perfil: {e}")
+            return None
+
+
+def view_context(window):
+    """Función de contexto que etiqueta las muestras con la vista y el intento.
+
+    Args:
+        window: Ventana del juego.
+    """
+    def context():
+        view = window.current_view
+        if view is None:
+            return ["sin vista"]
+        labels = [type(view).__name__]
+        trial = getattr(view, "trial_number", None)
+        if trial is not None:
+            labels.append(f"intento {trial}")
+        return labels
+    return context
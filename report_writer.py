@@ -0,0 +1,140 @@
+"""
+Guardado de reportes en segundo plano.
+Escribir el reporte puede tardar mucho en una memoria USB lenta o en una
+carpeta de red; si se hace en el hilo principal la pantalla del reporte se
+congela. ReportWriter escribe en un hilo de trabajo y entrega el resultado
+a una función callback en el hilo principal cuando este llama a poll()
+(en cada vuelta del bucle de pyglet, ver install_pyglet_poll, o en cada
+frame de HeadlessWindow).
+
+Cada archivo se escribe de forma atómica (write_json_atomic): primero en un
+archivo temporal en la misma carpeta, con fsync, y después se renombra al
+nombre final. Así nunca queda un reporte a medias con el nombre final, y
+cuando llega el callback los datos ya están en disco.
+"""
+
+import json
+import os
+import queue
+import threading
+
+
+def write_json_atomic(data, filename):
+    """Escribe data como JSON en filename de forma atómica y durable.
+
+    Raises:
+        Exception: El error de escritura o de serialización; en ese caso el
+            archivo final no cambia.
+    """
+    temporary = f"{filename}.tmp"
+    try:
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, filename)
+    except BaseException:
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass
+        raise
+    _fsync_directory(os.path.dirname(os.path.abspath(filename)))
+
+
+def _fsync_directory(directory):
+    """Asegura que el cambio de nombre quede en disco (no disponible en Windows)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class ReportWriter:
+    """Hilo de trabajo que guarda reportes y avisa al terminar."""
+
+    def __init__(self):
+        self.jobs = queue.Queue()
+        self.finished = queue.Queue()
+        self.pending = 0  # Trabajos enviados cuyo callback aún no se ejecutó
+        self.worker = None
+
+    def submit(self, data, filename, callback=None):
+        """Encola el guardado de data en filename.
+
+        Args:
+            data: Diccionario serializable a JSON. No debe modificarse hasta
+                que llegue el callback.
+            filename: Ruta final del archivo.
+            callback: Función callback(filename, error) que se llama desde
+                poll() en el hilo principal; error es None si se guardó.
+        """
+        if self.worker is None or not self.worker.is_alive():
+            self.worker = threading.Thread(target=self._run, name="report-writer", daemon=True)
+            self.worker.start()
+        self.pending += 1
+        self.jobs.put((data, filename, callback))
+
+    def _run(self):
+        while True:
+            data, filename, callback = self.jobs.get()
+            error = None
+            try:
+                write_json_atomic(data, filename)
+            except Exception as e:
+                # Cualquier error se entrega al callback: el hilo sigue vivo
+                error = e
+            finally:
+                # Cada trabajo se cuenta siempre, así wait() y poll() no se quedan esperando
+                self.finished.put((callback, filename, error))
+                self.jobs.task_done()
+
+    def poll(self):
+        """Ejecuta los callbacks de los guardados terminados (hilo principal).
+
+        Returns:
+            Número de callbacks ejecutados.
+        """
+        calls = 0
+        while True:
+            try:
+                callback, filename, error = self.finished.get_nowait()
+            except queue.Empty:
+                return calls
+            self.pending -= 1
+            calls += 1
+            if callback is not None:
+                callback(filename, error)
+
+    def busy(self):
+        """True si hay guardados sin terminar o sin avisar."""
+        return self.pending > 0
+
+    def wait(self):
+        """Espera a que terminen todos los guardados y ejecuta sus callbacks."""
+        self.jobs.join()
+        self.poll()
+
+
+# Escritor compartido por la ventana del juego
+REPORT_WRITER = ReportWriter()
+
+
+def install_pyglet_poll(writer=REPORT_WRITER):
+    """Entrega los guardados terminados en cada vuelta del bucle de pyglet.
+
+    Así los callbacks llegan aunque la vista que pidió el guardado ya no
+    esté en pantalla.
+    """
+    import pyglet
+
+    def poll(delta_time):
+        writer.poll()
+
+    pyglet.clock.schedule(poll)
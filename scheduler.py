@@ -0,0 +1,170 @@
+"""
+Planificador central de temporizadores.
+Las vistas registran funciones para que se llamen una vez después de un
+tiempo (call_later) o periódicamente (call_every) en lugar de sumar
+delta_time en cada on_update. Los plazos se guardan en un montículo (heap)
+ordenado por instante, con la hora del reloj activo (clock.py), así que no
+acumulan el error de cada frame y funcionan igual con el reloj virtual.
+
+Quién llama a run_due():
+- En el juego, install_pyglet_driver programa con pyglet.clock una sola
+  llamada para el próximo plazo; los temporizadores no dependen de la
+  frecuencia de on_update.
+- En la ventana sin pantalla (headless.py), cada step().
+
+Los temporizadores se pueden asociar a un dueño (la vista) para cancelarlos
+juntos cuando la vista se oculta.
+
+Si se asigna on_call, run_due llama a on_call(timer) en lugar de ejecutar
+el callback directamente (así el detector de tirones mide cada llamada,
+ver views/hitch_watchdog.py); on_call debe ejecutar el callback.
+"""
+
+import heapq
+import itertools
+
+from clock import get_clock
+
+
+class Timer:
+    """Temporizador registrado en el planificador."""
+
+    __slots__ = ("deadline", "interval", "callback", "args", "owner", "cancelled")
+
+    def __init__(self, deadline, interval, callback, args, owner):
+        self.deadline = deadline
+        self.interval = interval  # None para los de una sola vez
+        self.callback = callback
+        self.args = args
+        self.owner = owner
+        self.cancelled = False
+
+    def cancel(self):
+        """Cancela el temporizador (si ya se ejecutó no hace nada)."""
+        self.cancelled = True
+
+
+class Scheduler:
+    """Montículo de temporizadores ordenados por plazo."""
+
+    def __init__(self, clock=None):
+        """Inicializa el planificador.
+
+        Args:
+            clock: Reloj de los plazos; por defecto el reloj activo en cada
+                llamada (así sigue al VirtualClock de la ventana sin pantalla).
+        """
+        self.clock = clock
+        self.heap = []
+        self.counter = itertools.count()  # Desempate: orden de registro
+        self.on_change = None  # Se llama cuando cambia el próximo plazo
+        self.on_call = None  # on_call(timer) ejecuta cada callback vencido
+
+    def now(self):
+        return (self.clock or get_clock()).now()
+
+    def _push(self, timer):
+        heapq.heappush(self.heap, (timer.deadline, next(self.counter), timer))
+        if self.on_change is not None and self.heap[0][2] is timer:
+            self.on_change()
+        return timer
+
+    def call_later(self, delay, callback, *args, owner=None):
+        """Llama a callback(*args) una vez dentro de `delay` segundos.
+
+        Returns:
+            Timer (se puede cancelar).
+        """
+        return self._push(Timer(self.now() + delay, None, callback, args, owner))
+
+    def call_every(self, interval, callback, *args, owner=None):
+        """Llama a callback(*args) cada `interval` segundos hasta cancelarlo.
+
+        Los plazos son múltiplos exactos del intervalo desde el registro: un
+        retraso en una llamada no corre las siguientes.
+
+        Returns:
+            Timer (se puede cancelar).
+        """
+        if interval <= 0:
+            raise ValueError("El intervalo debe ser positivo")
+        return self._push(Timer(self.now() + interval, interval, callback, args, owner))
+
+    def cancel_owner(self, owner):
+        """Cancela todos los temporizadores de un dueño."""
+        for _, _, timer in self.heap:
+            if timer.owner is owner:
+                timer.cancelled = True
+
+    def next_deadline(self):
+        """Instante del próximo temporizador pendiente, o None."""
+        heap = self.heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def run_due(self, now=None):
+        """Ejecuta los temporizadores vencidos en orden de plazo.
+
+        Args:
+            now: Instante actual; por defecto la hora del reloj.
+
+        Returns:
+            Número de llamadas hechas.
+        """
+        if now is None:
+            now = self.now()
+        heap = self.heap
+        calls = 0
+        while heap and heap[0][0] <= now:
+            _, _, timer = heapq.heappop(heap)
+            if timer.cancelled:
+                continue
+            if timer.interval is not None:
+                timer.deadline += timer.interval
+                # Si el programa se detuvo varios intervalos, no repetir las llamadas perdidas
+                if timer.deadline <= now:
+                    missed = int((now - timer.deadline) / timer.interval) + 1
+                    timer.deadline += missed * timer.interval
+                heapq.heappush(heap, (timer.deadline, next(self.counter), timer))
+            else:
+                timer.cancelled = True
+            if self.on_call is not None:
+                self.on_call(timer)
+            else:
+                timer.callback(*timer.args)
+            calls += 1
+        if calls and self.on_change is not None:
+            self.on_change()
+        return calls
+
+    def clear(self):
+        """Elimina todos los temporizadores."""
+        self.heap.clear()
+        if self.on_change is not None:
+            self.on_change()
+
+    def __len__(self):
+        return sum(1 for _, _, timer in self.heap if not timer.cancelled)
+
+
+# Planificador compartido por todas las vistas
+SCHEDULER = Scheduler()
+
+
+def install_pyglet_driver(scheduler=SCHEDULER):
+    """Hace que pyglet despierte al planificador justo en cada plazo."""
+    import pyglet
+
+    def run(delta_time):
+        scheduler.run_due()
+        rearm()
+
+    def rearm():
+        pyglet.clock.unschedule(run)
+        deadline = scheduler.next_deadline()
+        if deadline is not None:
+            pyglet.clock.schedule_once(run, max(0.0, deadline - scheduler.now()))
+
+    scheduler.on_change = rearm
+    rearm()
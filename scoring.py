@@ -0,0 +1,31 @@
+"""
+Reglas de calificación de las respuestas.
+Cada regla es una función rule(answer, correct_answer) -> bool que decide si
+la respuesta del jugador cuenta como correcta. Los niveles la pasan a
+DataTracker.record_answer, que es el único camino para completar un intento
+en todos los niveles.
+"""
+
+
+def exact_match(answer, correct_answer):
+    """Correcta solo si es igual a la respuesta esperada (Niveles 1 a 3)."""
+    return answer == correct_answer
+
+
+def within_tolerance(tolerance):
+    """Regla para estimaciones: correcta si está a `tolerance` o menos.
+
+    Args:
+        tolerance: Distancia máxima a la cantidad real (ver Nivel 4).
+
+    Returns:
+        Función de calificación.
+    """
+    def rule(answer, correct_answer):
+        return abs(answer - correct_answer) <= tolerance
+    return rule
+
+
+def sequence_match(answer, correct_answer):
+    """Correcta si la secuencia tiene los mismos elementos en el mismo orden (Nivel 5)."""
+    return list(answer) == list(correct_answer)
@@ -0,0 +1,45 @@
+"""
+Semillas reproducibles para la generación de estímulos.
+Cada sesión tiene una semilla; de ella se deriva una semilla por nivel y
+por intento, así cualquier intento se puede regenerar a partir de la
+semilla guardada en el reporte sin tener que repetir toda la sesión.
+"""
+
+import hashlib
+import random
+
+
+def new_session_seed():
+    """Crea una semilla de sesión aleatoria (entero de 32 bits)."""
+    return random.SystemRandom().getrandbits(32)
+
+
+def derive_seed(*parts):
+    """Deriva una semilla estable a partir de varias partes.
+
+    No depende de hash() de Python (que cambia entre ejecuciones), así la
+    misma combinación de partes da siempre la misma semilla.
+
+    Args:
+        *parts: Valores que identifican el flujo (semilla de sesión, nivel, intento...).
+
+    Returns:
+        Entero de 64 bits.
+    """
+    key = "/".join(str(part) for part in parts)
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def trial_rng(session_seed, level, trial_number):
+    """Generador aleatorio de un intento.
+
+    Args:
+        session_seed: Semilla de la sesión.
+        level: Número de nivel (1-5).
+        trial_number: Número de intento dentro del nivel (empieza en 1).
+
+    Returns:
+        random.Random independiente de los demás intentos.
+    """
+    return random.Random(derive_seed(session_seed, "level", level, "trial", trial_number))
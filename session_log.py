@@ -0,0 +1,123 @@
+"""
+Registro de eventos de la sesión en disco.
+DataTracker escribe cada inicio de intento, respuesta y cambio de nivel en
+un archivo JSON Lines de solo anexado (un objeto JSON por línea). Así, si el
+juego se cierra o falla antes del reporte final, los datos ya registrados
+no se pierden: DataTracker.recover reconstruye la sesión desde el archivo.
+
+La escritura la hace un hilo de fondo: write() solo encola el evento y
+vuelve enseguida, así el bucle de frames nunca espera al disco. El hilo
+escribe juntos todos los eventos que se acumularon mientras hacía el
+fsync anterior y hace un solo fsync por grupo (group commit).
+"""
+
+import json
+import os
+import queue
+import threading
+
+# Marca de fin para el hilo de escritura
+_STOP = object()
+
+
+class SessionLog:
+    """Archivo JSON Lines de solo anexado escrito en un hilo de fondo."""
+
+    def __init__(self, path):
+        """Abre (o crea) el archivo e inicia el hilo de escritura.
+
+        Args:
+            path: Ruta del archivo; si ya existe, los eventos se agregan al final.
+        """
+        self.path = path
+        self.file = open(path, "a", encoding="utf-8")
+        self.pending = queue.Queue()
+        self.events_written = 0
+        self.commits = 0  # Número de fsync hechos
+        self.error = None
+        self.closed = False
+        self.worker = threading.Thread(target=self._run, name="session-log", daemon=True)
+        self.worker.start()
+
+    def write(self, event):
+        """Encola un evento (diccionario serializable a JSON) sin bloquear.
+
+        El diccionario no debe modificarse después: se serializa en el hilo
+        de escritura. Después de close() se ignora.
+        """
+        if not self.closed:
+            self.pending.put(event)
+
+    def _run(self):
+        while True:
+            batch = [self.pending.get()]
+            # Todo lo que llegó mientras se escribía el grupo anterior va en este
+            while True:
+                try:
+                    batch.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(event is _STOP for event in batch)
+            self._commit([event for event in batch if event is not _STOP])
+            for _ in batch:
+                self.pending.task_done()
+            if stop:
+                self.file.close()
+                return
+
+    def _commit(self, events):
+        if not events or self.error is not None:
+            return
+        try:
+            self.file.write("".join(
+                json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n"
+                for event in events
+            ))
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.events_written += len(events)
+            self.commits += 1
+        except (OSError, TypeError, ValueError) as e:
+            # Sin registro el juego sigue: el reporte final se guarda igual
+            self.error = e
+            print(f"Aviso: no se pudo escribir el registro de la sesión {self.path}: {e}")
+
+    def sync(self):
+        """Espera a que todos los eventos encolados estén en disco."""
+        self.pending.join()
+
+    def close(self, wait=True):
+        """Escribe los eventos pendientes, detiene el hilo y cierra el archivo.
+
+        Args:
+            wait: False para volver enseguida; el hilo termina de escribir y
+                cierra el archivo por su cuenta. Llamar de nuevo con
+                wait=True espera a que termine.
+        """
+        if not self.closed:
+            self.closed = True
+            self.pending.put(_STOP)
+        if wait:
+            self.worker.join()
+
+
+def read_events(path):
+    """Lee los eventos de un registro, aunque haya quedado a medias.
+
+    Se detiene en la primera línea incompleta o dañada (la que se estaba
+    escribiendo cuando el programa terminó); los eventos anteriores ya
+    estaban en disco completos.
+
+    Returns:
+        Lista de diccionarios en el orden en que se escribieron.
+    """
+    events = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+    return events
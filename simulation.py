@@ -0,0 +1,291 @@
+"""
+Simulación de jugadores.
+Juega sesiones completas (Niveles 1 a 5) sin pantalla con jugadores
+simulados de precisión y tiempos de respuesta configurables, y reparte las
+sesiones entre varios procesos. Sirve para revisar con poblaciones grandes
+los umbrales de las observaciones del reporte (precisión < 40%, tiempo
+promedio > 15 s, etc.).
+
+Uso:
+    python simulation.py --sessions 10000 --processes 8 --output resultados.json
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import random
+import time
+
+from constants import TRIALS_PER_LEVEL
+from seeding import derive_seed, new_session_seed
+
+
+class BotProfile:
+    """Perfil de un jugador simulado."""
+
+    def __init__(self, name, accuracy=0.8, rt_median=3.0, rt_sigma=0.5, level_accuracy=None):
+        """Crea el perfil.
+
+        Args:
+            name: Nombre del perfil (agrupa los resultados).
+            accuracy: Probabilidad de responder bien (0-1).
+            rt_median: Mediana del tiempo de respuesta en segundos. Los
+                tiempos siguen una distribución log-normal.
+            rt_sigma: Dispersión (sigma) de la log-normal.
+            level_accuracy: Diccionario nivel -> precisión para sobrescribir
+                la precisión general en algunos niveles.
+        """
+        self.name = name
+        self.accuracy = accuracy
+        self.rt_median = rt_median
+        self.rt_sigma = rt_sigma
+        self.level_accuracy = level_accuracy or {}
+
+    def accuracy_for(self, level):
+        """Precisión del perfil en un nivel."""
+        return self.level_accuracy.get(level, self.accuracy)
+
+    def response_time(self, rng):
+        """Sortea un tiempo de respuesta en segundos."""
+        return rng.lognormvariate(math.log(self.rt_median), self.rt_sigma)
+
+
+# Perfiles por defecto de la población simulada
+DEFAULT_PROFILES = [
+    BotProfile("alto", accuracy=0.9, rt_median=2.5, rt_sigma=0.4),
+    BotProfile("medio", accuracy=0.6, rt_median=5.0, rt_sigma=0.5),
+    BotProfile("bajo", accuracy=0.3, rt_median=9.0, rt_sigma=0.6),
+    BotProfile("lento", accuracy=0.8, rt_median=16.0, rt_sigma=0.3),
+    BotProfile(
+        "estimacion_baja", accuracy=0.85, rt_median=3.0, rt_sigma=0.4,
+        level_accuracy={4: 0.25},
+    ),
+]
+
+
+class BotPlayer:
+    """Jugador simulado que responde a los niveles haciendo clics."""
+
+    def __init__(self, profile, rng):
+        self.profile = profile
+        self.rng = rng
+
+    def answer(self, view):
+        """Responde el intento actual de la vista.
+
+        Args:
+            view: Vista de nivel (Level1View a Level5View) lista para responder.
+        """
+        correct = self.rng.random() < self.profile.accuracy_for(view.level_number)
+        if view.level_number == 3:
+            self._answer_comparison(view, correct)
+        elif view.level_number == 5:
+            self._answer_sequence(view, correct)
+        else:
+            self._answer_buttons(view, correct)
+
+    def _answer_buttons(self, view, correct):
+        # Se separan las opciones con la regla del nivel: en el Nivel 4 una
+        # opción cercana a la cantidad real también cuenta como correcta
+        scoring = view.scoring()
+        right = [b for b in view.answer_buttons if scoring(b.value, view.correct_count)]
+        wrong = [b for b in view.answer_buttons if not scoring(b.value, view.correct_count)]
+        btn = self.rng.choice(right if correct or not wrong else wrong)
+        view.on_mouse_press(btn.x, btn.y, 1, 0)
+
+    def _answer_comparison(self, view, correct):
+        side = view.correct_side
+        if not correct:
+            side = "right" if side == "left" else "left"
+        group = view.group_left if side == "left" else view.group_right
+        view.on_mouse_press(group.center_x, group.center_y, 1, 0)
+
+    def _answer_sequence(self, view, correct):
+        order = list(view.correct_sequence)
+        if not correct:
+            while order == view.correct_sequence:
+                self.rng.shuffle(order)
+        cards = {card.number: card for card in view.cards}
+        for number in order:
+            card = cards[number]
+            view.on_mouse_press(card.x, card.y, 1, 0)
+        view.on_mouse_press(view.confirm_btn_x, view.confirm_btn_y, 1, 0)
+
+
+def level_views():
+    """Clases de vista de cada nivel (importadas aquí para no cargar arcade al importar)."""
+    from views.level1_subitizing import Level1View
+    from views.level2_counting import Level2View
+    from views.level3_comparison import Level3View
+    from views.level4_estimation import Level4View
+    from views.level5_sequencing import Level5View
+    return {1: Level1View, 2: Level2View, 3: Level3View, 4: Level4View, 5: Level5View}
+
+
+# Paso máximo del reloj virtual al esperar (segundos). Las esperas no
+# necesitan animación fluida, así que se usan pocos frames largos.
+SIMULATION_STEP = 1.0
+
+# Ventana sin pantalla de cada proceso
+_WINDOW = None
+
+
+def _get_window():
+    global _WINDOW
+    if _WINDOW is None:
+        from headless import create_headless_window
+        _WINDOW = create_headless_window()
+    return _WINDOW
+
+
+def play_session(profile, session_seed, window=None):
+    """Juega una sesión completa con un jugador simulado.
+
+    Las vistas de nivel se muestran directamente (sin pantallas de
+    instrucciones ni reporte, que guardaría un archivo por sesión) y el
+    tiempo avanza con el reloj virtual de la ventana sin dibujar.
+
+    Args:
+        profile: BotProfile del jugador.
+        session_seed: Semilla de la sesión (estímulos y decisiones del bot).
+        window: HeadlessWindow con reloj virtual; por defecto la del proceso.
+
+    Returns:
+        Reporte de DataTracker.get_full_report() con el nombre del perfil.
+    """
+    from data_tracker import DataTracker
+
+    window = window or _get_window()
+    tracker = DataTracker(session_seed=session_seed, clock=window.clock)
+    tracker.set_player_info(profile.name, "")
+    window.tracker = tracker
+    bot = BotPlayer(profile, random.Random(derive_seed(session_seed, "bot")))
+
+    for level, view_class in level_views().items():
+        view = view_class()
+        window.show_view(view)
+        for trial in range(TRIALS_PER_LEVEL):
+            if level == 1:
+                # Presentar los frames de exposición hasta que desaparezcan las gemas
+                window.run_frames(view.exposure_frames + 1)
+            window.advance(bot.profile.response_time(bot.rng), SIMULATION_STEP)
+            bot.answer(view)
+            if trial < TRIALS_PER_LEVEL - 1:
+                # Esperar a que termine el feedback y empiece el siguiente intento
+                window.advance(1.5, SIMULATION_STEP)
+                while view.state == "feedback":
+                    window.step()
+
+    report = tracker.get_full_report()
+    report["profile"] = profile.name
+    return report
+
+
+def _play_task(task):
+    profile, session_seed = task
+    return play_session(profile, session_seed)
+
+
+def run_population(sessions, profiles=None, processes=None, seed=None, chunksize=64):
+    """Juega muchas sesiones repartidas en un grupo de procesos.
+
+    Los perfiles se asignan por turnos. La semilla de cada sesión se deriva
+    de `seed`, así la población completa es reproducible.
+
+    Args:
+        sessions: Número de sesiones.
+        profiles: Lista de BotProfile (por defecto DEFAULT_PROFILES).
+        processes: Número de procesos (por defecto, uno por núcleo).
+        seed: Semilla de la población (por defecto, aleatoria).
+        chunksize: Sesiones que recibe cada proceso por envío.
+
+    Returns:
+        Lista de reportes, en el orden de las sesiones.
+    """
+    profiles = profiles or DEFAULT_PROFILES
+    seed = seed if seed is not None else new_session_seed()
+    tasks = [
+        (profiles[i % len(profiles)], derive_seed(seed, "session", i) & 0xFFFFFFFF)
+        for i in range(sessions)
+    ]
+    if processes == 1:
+        return [_play_task(task) for task in tasks]
+    with multiprocessing.Pool(processes) as pool:
+        return pool.map(_play_task, tasks, chunksize=chunksize)
+
+
+def aggregate_reports(reports):
+    """Resume los reportes por perfil y nivel.
+
+    Para cada perfil y nivel cuenta cuántas sesiones activan cada regla de
+    observación de DataTracker.get_full_report (precisión < 40, entre 40 y
+    70, y tiempo promedio > 15 s).
+
+    Returns:
+        Diccionario perfil -> {"sessions", "levels": {nivel: {...}}}.
+    """
+    result = {}
+    for report in reports:
+        entry = result.setdefault(report["profile"], {"sessions": 0, "levels": {}})
+        entry["sessions"] += 1
+        for level, summary in report["levels"].items():
+            stats = entry["levels"].setdefault(level, {
+                "sessions": 0,
+                "accuracy_sum": 0.0,
+                "response_time_sum": 0.0,
+                "accuracy_below_40": 0,
+                "accuracy_below_70": 0,
+                "slow_response": 0,
+            })
+            stats["sessions"] += 1
+            stats["accuracy_sum"] += summary["accuracy"]
+            stats["response_time_sum"] += summary["avg_response_time"]
+            if summary["accuracy"] < 40:
+                stats["accuracy_below_40"] += 1
+            elif summary["accuracy"] < 70:
+                stats["accuracy_below_70"] += 1
+            if summary["avg_response_time"] > 15:
+                stats["slow_response"] += 1
+
+    for entry in result.values():
+        for stats in entry["levels"].values():
+            n = stats["sessions"]
+            stats["mean_accuracy"] = round(stats.pop("accuracy_sum") / n, 1)
+            stats["mean_response_time"] = round(stats.pop("response_time_sum") / n, 2)
+            for key in ("accuracy_below_40", "accuracy_below_70", "slow_response"):
+                stats[key + "_rate"] = round(stats[key] / n * 100, 1)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simula sesiones con jugadores automáticos.")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", default=None, help="Archivo JSON de resultados")
+    args = parser.parse_args()
+
+    seed = args.seed if args.seed is not None else new_session_seed()
+    start = time.perf_counter()
+    reports = run_population(args.sessions, processes=args.processes, seed=seed)
+    elapsed = time.perf_counter() - start
+    summary = aggregate_reports(reports)
+
+    print(f"{len(reports)} sesiones en {elapsed:.1f} s "
+          f"({len(reports) / elapsed * 60:.0f} sesiones/minuto)")
+    for name, entry in summary.items():
+        print(f"  {name}: {entry['sessions']} sesiones")
+        for level, stats in sorted(entry["levels"].items()):
+            print(f"    Nivel {level}: precisión {stats['mean_accuracy']}%, "
+                  f"tiempo {stats['mean_response_time']} s, "
+                  f"<40%: {stats['accuracy_below_40_rate']}%, "
+                  f">15 s: {stats['slow_response_rate']}%")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"seed": seed, "summary": summary}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
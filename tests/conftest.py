@@ -0,0 +1,29 @@
+"""
+Configuración común de las pruebas.
+Las pruebas se ejecutan desde la raíz del repositorio con `python -m pytest`
+y sin pantalla: pyglet se inicia en modo headless y las vistas se dibujan
+con la ventana sin pantalla de headless.py.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import pyglet
+    pyglet.options["headless"] = True
+except ImportError:
+    pyglet = None
+
+
+@pytest.fixture
+def headless_window():
+    """Ventana sin pantalla con reloj virtual (ver headless.py)."""
+    from headless import create_headless_window, close_headless_window
+
+    window = create_headless_window()
+    yield window
+    close_headless_window(window)
@@ -0,0 +1,67 @@
+"""Pruebas de la exposición del Nivel 1 según el refresco medido."""
+
+import pytest
+
+from constants import LEVEL1_EXPOSURE_FRAMES, LEVEL1_EXPOSURE_TIME
+from data_tracker import DataTracker
+from views.frame_timing import REFRESH_RATE, RefreshRate
+from views.level1_subitizing import Level1View
+
+
+def test_refresh_rate_ignores_gaps_and_needs_samples():
+    refresh = RefreshRate()
+    assert refresh.interval() is None
+    t = 0.0
+    for i in range(30):
+        t += 1 / 120 if i != 10 else 2.0  # Un salto largo no es un frame
+        refresh.record_flip(t)
+    assert refresh.interval() == pytest.approx(1 / 120)
+
+
+@pytest.mark.parametrize("hz, frames", [(60, 90), (120, 180), (144, 216)])
+def test_exposure_frames_follow_the_refresh_rate(hz, frames):
+    assert Level1View.exposure_frames_for(1 / hz) == frames
+    assert Level1View.exposure_frames_for(None) == LEVEL1_EXPOSURE_FRAMES
+
+
+def test_measured_exposure_is_recorded(headless_window):
+    REFRESH_RATE.intervals.clear()
+    REFRESH_RATE.last_flip = None
+    headless_window.tracker = DataTracker(session_seed=2, clock=headless_window.clock)
+    view = Level1View()
+    headless_window.show_view(view)
+    for _ in range(20):
+        headless_window.step(1 / 144)
+    view.setup_trial()  # Ya con el refresco medido
+
+    assert view.exposure_frames == 216
+    headless_window.run_frames(view.exposure_frames + 1, delta_time=1 / 144)
+    trial = headless_window.tracker.current_trial
+    assert trial.exposure_frames == 216
+    assert trial.refresh_interval == pytest.approx(1 / 144)
+    assert trial.exposure_time() == pytest.approx(LEVEL1_EXPOSURE_TIME)
+    assert trial.to_dict()["exposure_time"] == LEVEL1_EXPOSURE_TIME
+
+
+def test_clicks_wait_for_the_offset_flip(headless_window):
+    headless_window.tracker = DataTracker(session_seed=3, clock=headless_window.clock)
+    view = Level1View()
+    headless_window.show_view(view)
+    button = next(b for b in view.answer_buttons if b.value == view.correct_count)
+
+    # Último frame con gemas: el frame sin gemas todavía no se presentó
+    headless_window.run_frames(view.exposure_frames)
+    assert not view.showing_gems and view.offset_pending
+    view.on_mouse_press(button.x, button.y, 1, 0)
+    trial = headless_window.tracker.current_trial
+    assert not view.answered and trial.stimulus_offset is None
+
+    headless_window.step()
+    offset = trial.stimulus_offset
+    assert offset is not None
+    headless_window.clock.advance(0.4)
+    view.on_mouse_press(button.x, button.y, 1, 0)
+    assert view.answered and trial.is_correct
+    assert trial.response_time == pytest.approx(0.4)
+    headless_window.step()
+    assert trial.stimulus_offset == offset
@@ -0,0 +1,71 @@
+"""Pruebas de las gemas de Nivel 4: movimiento (GemField) y presupuesto de dibujo."""
+
+import random
+
+import pytest
+
+from benchmarks.cases import make_moving_gems
+from constants import (
+    ESTIMATION_EXTENDED_MAX, ESTIMATION_EXTENDED_MIN, ESTIMATION_GEM_DRAW_BASE,
+    ESTIMATION_GEM_DRAW_BUDGET, ESTIMATION_GEM_DRAW_COST, ESTIMATION_GEM_PIXEL_COST,
+    GEM_COLORS,
+)
+from views.level4_estimation import FIELD_BOUNDS, GemField, Level4View
+from views.level_base import Gem
+
+
+def test_numpy_and_list_paths_give_the_same_trajectories(headless_window):
+    pytest.importorskip("numpy")
+    fields = [
+        GemField(make_moving_gems(200, seed=7), FIELD_BOUNDS, use_numpy=use_numpy)
+        for use_numpy in (True, False)
+    ]
+    assert fields[0].use_numpy and not fields[1].use_numpy
+
+    # 20 segundos de juego: todas las gemas rebotan varias veces
+    for _ in range(1200):
+        for field in fields:
+            field.step(1 / 60)
+    vectorized, lists = fields
+    # Sin seno de por medio los resultados son idénticos bit a bit
+    assert vectorized.x.tolist() == lists.x
+    assert vectorized.base_y.tolist() == lists.base_y
+    assert vectorized.vx.tolist() == lists.vx
+    assert vectorized.vy.tolist() == lists.vy
+    # np.sin puede diferir de math.sin en el último bit
+    assert vectorized.y.tolist() == pytest.approx(lists.y, rel=1e-12, abs=1e-9)
+    assert [g.x for g in vectorized.gems] == [g.x for g in lists.gems]
+
+
+def test_gems_stay_inside_the_field(headless_window):
+    field = GemField(make_moving_gems(100, seed=3), FIELD_BOUNDS, use_numpy=False)
+    left, right, bottom, top = FIELD_BOUNDS
+    for _ in range(600):
+        field.step(1 / 60)
+        assert all(left <= x <= right for x in field.x)
+        assert all(bottom <= y <= top for y in field.base_y)
+
+
+def test_extended_gems_fit_the_draw_budget(headless_window):
+    from data_tracker import DataTracker
+
+    headless_window.tracker = DataTracker(session_seed=1)
+    view = Level4View(extended=True)
+    for count in range(ESTIMATION_EXTENDED_MIN, ESTIMATION_EXTENDED_MAX + 1):
+        size = view.gem_size_for(count)
+        cost = ESTIMATION_GEM_DRAW_BASE + count * (
+            ESTIMATION_GEM_DRAW_COST + ESTIMATION_GEM_PIXEL_COST * size ** 2
+        )
+        assert cost <= ESTIMATION_GEM_DRAW_BUDGET
+    counts = [view.generate_trial(random.Random(seed))["correct_count"] for seed in range(200)]
+    assert ESTIMATION_EXTENDED_MIN <= min(counts) and max(counts) <= ESTIMATION_EXTENDED_MAX
+
+
+def test_sparkle_sprites_are_created_on_first_sparkle(headless_window):
+    gem = Gem(100, 100, GEM_COLORS[0])
+    assert gem.sprites == [gem.sprite] and gem.sparkle_sprites == []
+    gem.start_sparkle()
+    sparkles = list(gem.sparkle_sprites)
+    assert len(sparkles) == 2 and gem.sprites == [gem.sprite, *sparkles]
+    gem.start_sparkle()
+    assert gem.sparkle_sprites == sparkles
@@ -0,0 +1,43 @@
+"""Pruebas del detector de frames largos (views/hitch_watchdog.py)."""
+
+import time
+
+from clock import VirtualClock
+from scheduler import Scheduler
+from views.hitch_watchdog import HitchWatchdog, watch_timers
+
+
+class FakeView:
+    window = None
+    level_number = 2
+    trial_number = 3
+    state = "feedback"
+
+    def end_feedback(self):
+        time.sleep(0.03)
+
+
+def test_slow_timer_callback_is_attributed_to_its_view():
+    watchdog = HitchWatchdog(budget=0.01, poll_interval=0.002)
+    watchdog.start()
+    try:
+        clock = VirtualClock()
+        scheduler = Scheduler(clock)
+        watch_timers(scheduler, watchdog)
+        scheduler.call_later(0.0, FakeView().end_feedback)
+        scheduler.call_later(0.0, lambda: None)
+        scheduler.run_due()
+    finally:
+        watchdog.stop()
+
+    assert len(watchdog.events) == 1
+    event = watchdog.events[0]
+    assert (event["view"], event["callback"]) == ("FakeView", "timer:end_feedback")
+    assert (event["level"], event["trial"]) == (2, 3)
+    assert event["stack"]
+
+
+def test_watch_only_runs_the_callback_when_inactive():
+    watchdog = HitchWatchdog(budget=0.0)
+    assert watchdog.watch(None, "on_mouse_press", lambda x: x * 2, 21) == 42
+    assert watchdog.events == []
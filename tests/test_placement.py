@@ -0,0 +1,71 @@
+"""Pruebas de la colocación de gemas sin superposición (placement.py)."""
+
+import itertools
+import math
+import random
+
+import pytest
+
+from placement import (
+    PlacementError, lattice_points, lattice_sample, max_points, poisson_disk_sample,
+)
+
+
+def assert_valid(points, bounds, min_distance):
+    left, right, bottom, top = bounds
+    for x, y in points:
+        assert left <= x <= right and bottom <= y <= top
+    for a, b in itertools.combinations(points, 2):
+        assert math.dist(a, b) >= min_distance - 1e-9
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_points_keep_min_distance_and_bounds(seed):
+    bounds = (220, 860, 200, 650)
+    points = poisson_disk_sample(bounds, 75, 6, rng=random.Random(seed))
+    assert len(points) == 6
+    assert_valid(points, bounds, 75)
+
+
+def test_same_seed_gives_same_points():
+    bounds = (0, 500, 0, 400)
+    a = poisson_disk_sample(bounds, 40, 30, rng=random.Random(7))
+    b = poisson_disk_sample(bounds, 40, 30, rng=random.Random(7))
+    assert a == b
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_dense_but_feasible_layout_is_placed(seed):
+    # Una cuadrícula de 4x4 cabe, aunque el muestreo aleatorio se trabe
+    bounds = (0, 100, 0, 100)
+    points = poisson_disk_sample(bounds, 30, 12, rng=random.Random(seed))
+    assert len(points) == 12
+    assert_valid(points, bounds, 30)
+
+
+def test_count_over_capacity_is_rejected():
+    bounds = (0, 100, 0, 100)
+    with pytest.raises(PlacementError, match="No caben"):
+        poisson_disk_sample(bounds, 30, max_points(bounds, 30) + 1)
+
+
+def test_max_points_is_an_upper_bound_of_the_lattice():
+    for bounds, d in [((0, 100, 0, 100), 30), ((0, 640, 0, 450), 50), ((0, 10, 0, 300), 20)]:
+        lattice, spacing = lattice_points(bounds, d)
+        assert len(lattice) <= max_points(bounds, d)
+        assert spacing >= d - 1e-9
+        assert_valid(lattice, bounds, d)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_lattice_sample_keeps_min_distance(seed):
+    bounds = (0, 300, 0, 200)
+    points = lattice_sample(bounds, 25, 60, rng=random.Random(seed))
+    assert len(points) == 60
+    assert_valid(points, bounds, 25)
+
+
+def test_zero_count_and_empty_area():
+    assert poisson_disk_sample((0, 10, 0, 10), 5, 0) == []
+    with pytest.raises(PlacementError):
+        poisson_disk_sample((10, 0, 0, 10), 5, 1)
@@ -0,0 +1,92 @@
+"""Pruebas del guardado de reportes en segundo plano (report_writer.py)."""
+
+import json
+
+from clock import VirtualClock
+from data_tracker import DataTracker
+from report_writer import ReportWriter, write_json_atomic
+
+
+def test_write_json_atomic_replaces_the_file(tmp_path):
+    path = tmp_path / "reporte.json"
+    path.write_text("viejo", encoding="utf-8")
+    write_json_atomic({"a": 1}, str(path))
+    assert json.loads(path.read_text(encoding="utf-8")) == {"a": 1}
+    assert [p.name for p in tmp_path.iterdir()] == ["reporte.json"]
+
+
+def test_failed_write_keeps_the_old_file(tmp_path):
+    path = tmp_path / "reporte.json"
+    path.write_text('{"a": 1}', encoding="utf-8")
+    circular = []
+    circular.append(circular)
+    writer = ReportWriter()
+    results = []
+    writer.submit({"datos": circular}, str(path), lambda f, e: results.append(e))
+    writer.wait()
+    assert isinstance(results[0], ValueError)
+    assert path.read_text(encoding="utf-8") == '{"a": 1}'
+    assert [p.name for p in tmp_path.iterdir()] == ["reporte.json"]
+
+
+def test_every_job_is_reported_even_after_unexpected_errors(tmp_path, monkeypatch):
+    import report_writer
+
+    write = report_writer.write_json_atomic
+
+    def write_or_fail(data, filename):
+        if data is None:
+            raise RecursionError("inesperado")
+        write(data, filename)
+
+    monkeypatch.setattr(report_writer, "write_json_atomic", write_or_fail)
+    writer = ReportWriter()
+    results = []
+    writer.submit(None, str(tmp_path / "a.json"), lambda f, e: results.append(e))
+    writer.submit({"ok": True}, str(tmp_path / "b.json"), lambda f, e: results.append(e))
+    assert writer.busy()
+    writer.wait()  # No debe quedarse esperando
+    assert not writer.busy()
+    assert isinstance(results[0], RecursionError)
+    assert results[1] is None
+    assert writer.worker.is_alive()
+
+
+def test_callback_arrives_only_from_poll(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    tracker = DataTracker(session_seed=1, clock=VirtualClock())
+    tracker.set_player_info("Ana", "7")
+    writer = ReportWriter()
+    saved = []
+    filename = tracker.save_report_async(tracker.get_full_report(), saved.append, writer=writer)
+
+    writer.jobs.join()
+    assert saved == [] and tracker.report_file is None  # Aún sin poll()
+    assert writer.poll() == 1
+    assert saved == [filename] and tracker.report_file == filename
+    assert json.loads((tmp_path / filename).read_text(encoding="utf-8"))["player_name"] == "Ana"
+
+
+def test_late_save_closes_only_its_own_log(tmp_path, monkeypatch):
+    from session_log import read_events
+
+    monkeypatch.chdir(tmp_path)
+    old = DataTracker(session_seed=1, clock=VirtualClock())
+    old.set_player_info("Ana", "7")
+    old_log = old.open_event_log("vieja.jsonl")
+    writer = ReportWriter()
+    filename = old.save_report_async(old.get_full_report(), writer=writer)
+
+    # Nueva partida antes de que llegue el aviso del guardado anterior
+    old.close_event_log()
+    assert not old.event_log.closed  # Espera al reporte
+    new = DataTracker(session_seed=2, clock=VirtualClock())
+    new.set_player_info("Luis", "8")
+    new.open_event_log("nueva.jsonl")
+
+    writer.wait()
+    assert old.event_log.closed and not new.event_log.closed
+    old.event_log.close()
+    assert read_events(old_log)[-1]["event"] == "report"
+    assert read_events(old_log)[-1]["file"] == filename
+    new.close_event_log()
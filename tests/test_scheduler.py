@@ -0,0 +1,55 @@
+"""Pruebas del planificador central de temporizadores (scheduler.py)."""
+
+from clock import VirtualClock
+from scheduler import Scheduler
+
+
+def test_timers_run_in_deadline_order():
+    clock = VirtualClock()
+    scheduler = Scheduler(clock)
+    calls = []
+    scheduler.call_later(2.0, calls.append, "b")
+    scheduler.call_later(1.0, calls.append, "a")
+    scheduler.call_later(2.0, calls.append, "c")
+    clock.advance(1.5)
+    assert scheduler.run_due() == 1
+    clock.advance(1.0)
+    scheduler.run_due()
+    assert calls == ["a", "b", "c"]
+    assert len(scheduler) == 0
+
+
+def test_repeating_timer_does_not_drift_or_replay_missed_calls():
+    clock = VirtualClock()
+    scheduler = Scheduler(clock)
+    calls = []
+    timer = scheduler.call_every(0.5, lambda: calls.append(clock.now()))
+    for _ in range(4):
+        clock.advance(0.51)
+        scheduler.run_due()
+    assert len(calls) == 4
+    assert timer.deadline == 2.5
+    clock.advance(10.0)  # Pausa larga: una sola llamada
+    scheduler.run_due()
+    assert len(calls) == 5
+    assert timer.deadline > clock.now()
+
+
+def test_cancel_owner_and_on_call_hook():
+    clock = VirtualClock()
+    scheduler = Scheduler(clock)
+    owner, other = object(), object()
+    calls, wrapped = [], []
+    scheduler.call_later(1.0, calls.append, 1, owner=owner)
+    scheduler.call_later(1.0, calls.append, 2, owner=other)
+    scheduler.cancel_owner(owner)
+
+    def on_call(timer):
+        wrapped.append(timer.owner)
+        timer.callback(*timer.args)
+
+    scheduler.on_call = on_call
+    clock.advance(1.0)
+    scheduler.run_due()
+    assert calls == [2]
+    assert wrapped == [other]
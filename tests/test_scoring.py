@@ -0,0 +1,77 @@
+"""Pruebas de las reglas de calificación (scoring.py) y del registro de respuestas."""
+
+from data_tracker import DataTracker
+from scoring import exact_match, sequence_match, within_tolerance
+
+
+def test_exact_match():
+    assert exact_match(4, 4)
+    assert not exact_match(5, 4)
+    assert exact_match("left", "left")
+
+
+def test_within_tolerance_includes_the_limits():
+    rule = within_tolerance(2)
+    assert rule(10, 10)
+    assert rule(8, 10) and rule(12, 10)
+    assert not rule(7, 10) and not rule(13, 10)
+
+
+def test_sequence_match_compares_order():
+    assert sequence_match([1, 2, 3], [1, 2, 3])
+    assert sequence_match((1, 2, 3), [1, 2, 3])
+    assert not sequence_match([1, 3, 2], [1, 2, 3])
+    assert not sequence_match([1, 2], [1, 2, 3])
+
+
+def test_record_answer_uses_the_rule_and_notifies_listeners():
+    tracker = DataTracker(session_seed=1)
+    completed = []
+    tracker.trial_listeners.append(completed.append)
+
+    tracker.start_trial(4, 1, 20)
+    assert tracker.record_answer(22, within_tolerance(2))
+    tracker.start_trial(5, 1, [1, 2, 3])
+    assert not tracker.record_answer([2, 1, 3], sequence_match)
+
+    assert [(t.level, t.is_correct, t.attempts) for t in completed] == [(4, True, 1), (5, False, 1)]
+    assert tracker.get_level_summary(4)["correct"] == 1
+    assert tracker.get_level_summary(5)["errors"] == 1
+
+
+def test_level4_counts_a_close_estimate_through_the_tracker(headless_window):
+    from views.level4_estimation import Level4View
+
+    headless_window.tracker = DataTracker(session_seed=5, clock=headless_window.clock)
+    view = Level4View()
+    headless_window.show_view(view)
+    headless_window.run_frames(2)
+
+    button = view.answer_buttons[0]
+    button.value = view.correct_count + 1  # Cercana pero no exacta
+    view.on_mouse_press(button.x, button.y, 1, 0)
+
+    trials = headless_window.tracker.level_data[4]
+    assert len(trials) == 1
+    assert trials[0].is_correct
+    assert trials[0].player_answer == view.correct_count + 1
+
+
+def test_level5_scores_the_sequence_through_the_tracker(headless_window):
+    from views.level5_sequencing import Level5View
+
+    headless_window.tracker = DataTracker(session_seed=5, clock=headless_window.clock)
+    view = Level5View()
+    headless_window.show_view(view)
+    headless_window.run_frames(2)
+
+    cards = {card.number: card for card in view.cards}
+    order = list(reversed(view.correct_sequence))
+    for number in order:
+        view.on_mouse_press(cards[number].x, cards[number].y, 1, 0)
+    view.on_mouse_press(view.confirm_btn_x, view.confirm_btn_y, 1, 0)
+
+    trials = headless_window.tracker.level_data[5]
+    assert len(trials) == 1
+    assert not trials[0].is_correct
+    assert trials[0].player_answer == order
@@ -0,0 +1,63 @@
+"""Pruebas de la reproducibilidad de los intentos a partir de la semilla (seeding.py)."""
+
+import pytest
+
+from data_tracker import DataTracker
+from seeding import derive_seed, trial_rng
+from views.level1_subitizing import Level1View
+from views.level2_counting import Level2View
+from views.level3_comparison import Level3View
+from views.level4_estimation import Level4View
+from views.level5_sequencing import Level5View
+
+LEVEL_VIEWS = [
+    Level1View,
+    Level2View,
+    Level3View,
+    Level4View,
+    lambda: Level4View(extended=True),
+    Level5View,
+]
+
+
+def generate_session(window, make_view, seed):
+    """Genera todos los intentos de un nivel con una vista nueva."""
+    window.tracker = DataTracker(session_seed=seed)
+    view = make_view()
+    return [
+        view.generate_trial(trial_rng(seed, view.level_number, n))
+        for n in range(1, view.total_trials + 1)
+    ]
+
+
+def test_derive_seed_is_stable_and_depends_on_every_part():
+    assert derive_seed(7, "level", 1, "trial", 1) == derive_seed(7, "level", 1, "trial", 1)
+    seeds = {
+        derive_seed(7, "level", 1, "trial", 1),
+        derive_seed(8, "level", 1, "trial", 1),
+        derive_seed(7, "level", 2, "trial", 1),
+        derive_seed(7, "level", 1, "trial", 2),
+    }
+    assert len(seeds) == 4
+
+
+@pytest.mark.parametrize("make_view", LEVEL_VIEWS)
+def test_same_seed_gives_the_same_trials(headless_window, make_view):
+    first = generate_session(headless_window, make_view, 42)
+    second = generate_session(headless_window, make_view, 42)
+    assert first == second
+
+
+@pytest.mark.parametrize("make_view", LEVEL_VIEWS)
+def test_different_seed_gives_different_trials(headless_window, make_view):
+    assert generate_session(headless_window, make_view, 42) != generate_session(
+        headless_window, make_view, 43
+    )
+
+
+@pytest.mark.parametrize("make_view", LEVEL_VIEWS)
+def test_trial_bank_serves_the_seeded_trials(headless_window, make_view):
+    expected = generate_session(headless_window, make_view, 42)
+    view = make_view()  # Mismo tracker (semilla 42); setup_trial ya usó el intento 1
+    served = [view.trial_bank.pop() for _ in range(view.total_trials - 1)]
+    assert served == expected[1:]
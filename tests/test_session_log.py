@@ -0,0 +1,84 @@
+"""Pruebas del registro de eventos de la sesión y su recuperación (session_log.py)."""
+
+import json
+
+import pytest
+
+from clock import VirtualClock
+from data_tracker import DataTracker
+from scoring import sequence_match, within_tolerance
+from session_log import SessionLog, read_events
+
+
+def play(tracker, clock):
+    """Juega unos intentos de cada nivel con respuestas de distinto tipo."""
+    answers = {1: (3, 3), 2: (5, 6), 3: ("left", "left"), 4: (20, 22), 5: ([1, 2, 3], [1, 3, 2])}
+    for level, (correct, given) in answers.items():
+        for number in (1, 2):
+            tracker.start_trial(level, number, correct)
+            clock.advance(0.5 + level * 0.25)
+            if level == 4:
+                tracker.record_answer(given, within_tolerance(2))
+            elif level == 5:
+                tracker.record_answer(given, sequence_match)
+            else:
+                tracker.record_answer(given)
+        tracker.record_level_complete(level)
+
+
+def test_events_are_written_one_per_line(tmp_path):
+    path = tmp_path / "log.jsonl"
+    log = SessionLog(str(path))
+    for i in range(50):
+        log.write({"event": "x", "i": i})
+    log.close()
+    assert [event["i"] for event in read_events(str(path))] == list(range(50))
+    assert log.events_written == 50
+    assert 1 <= log.commits <= 50
+    # Después de cerrar se ignoran los eventos
+    log.write({"event": "tarde"})
+    assert len(read_events(str(path))) == 50
+
+
+def test_read_events_stops_at_a_torn_last_line(tmp_path):
+    path = tmp_path / "log.jsonl"
+    lines = [json.dumps({"event": "trial_start", "n": n}) for n in range(3)]
+    path.write_text("\n".join(lines) + '\n{"event":"answer","tri', encoding="utf-8")
+    assert [event["n"] for event in read_events(str(path))] == [0, 1, 2]
+
+    # Una línea completa pero dañada también corta la lectura
+    path.write_text(lines[0] + "\n{no es json}\n" + lines[1] + "\n", encoding="utf-8")
+    assert read_events(str(path)) == [json.loads(lines[0])]
+
+
+def test_recover_round_trip(tmp_path):
+    path = str(tmp_path / "sesion.jsonl")
+    clock = VirtualClock()
+    tracker = DataTracker(session_seed=123, clock=clock)
+    tracker.set_player_info("Ana", "7")
+    tracker.open_event_log(path)
+    play(tracker, clock)
+    tracker.start_trial(1, 3, 4)  # Intento sin responder al "fallar"
+    tracker.close_event_log()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"event":"answer","t":')
+
+    recovered = DataTracker.recover(path)
+    original, rebuilt = tracker.get_full_report(), recovered.get_full_report()
+    for key in ("player_name", "player_age", "session_seed", "levels",
+                "observations", "overall_total", "overall_correct"):
+        assert rebuilt[key] == original[key]
+    assert recovered.completed_levels == [1, 2, 3, 4, 5]
+    assert [t.to_dict() for t in recovered.level_data[5]] == [
+        t.to_dict() for t in tracker.level_data[5]
+    ]
+    assert recovered.current_trial.trial_number == 3
+    assert recovered.current_trial.end_time is None
+    assert rebuilt["timing"]["clock"] == original["timing"]["clock"]
+
+
+def test_recover_rejects_a_file_without_header(tmp_path):
+    path = tmp_path / "otro.jsonl"
+    path.write_text('{"event":"trial_start","t":0}\n', encoding="utf-8")
+    with pytest.raises(ValueError):
+        DataTracker.recover(str(path))
@@ -0,0 +1,42 @@
+"""Pruebas del banco de intentos pre-generados (trial_bank.py)."""
+
+import pytest
+
+from trial_bank import TrialBank
+
+
+def generate(rng):
+    return rng.random()
+
+
+def test_trials_follow_the_session_seed():
+    a = TrialBank(generate, 5, session_seed=42, level=1)
+    b = TrialBank(generate, 5, session_seed=42, level=1)
+    c = TrialBank(generate, 5, session_seed=43, level=1)
+    trials_a = [a.pop() for _ in range(5)]
+    assert trials_a == [b.pop() for _ in range(5)]
+    assert trials_a != [c.pop() for _ in range(5)]
+
+
+def test_pop_past_count_generates_in_current_thread():
+    bank = TrialBank(generate, 2, session_seed=1, level=2)
+    trials = [bank.pop() for _ in range(4)]
+    assert len(set(trials)) == 4
+    assert bank.remaining == 0
+
+
+def test_generation_error_is_raised_on_every_later_pop():
+    calls = []
+
+    def failing(rng):
+        calls.append(1)
+        if len(calls) == 2:
+            raise RuntimeError("fallo al generar")
+        return len(calls)
+
+    bank = TrialBank(failing, 5, session_seed=1, level=1)
+    assert bank.pop() == 1
+    # Las llamadas siguientes no deben quedarse esperando intentos que nunca llegan
+    for _ in range(3):
+        with pytest.raises(RuntimeError, match="fallo al generar"):
+            bank.pop()
@@ -0,0 +1,94 @@
+"""Pruebas del almacén columnar de intentos y sus acumulados (trial_store.py)."""
+
+import math
+import random
+import statistics
+
+import pytest
+
+from clock import VirtualClock
+from data_tracker import DataTracker, TrialData
+from trial_store import TrialStore, RunningStats
+
+
+def test_trial_view_reads_and_writes_columns():
+    store = TrialStore(VirtualClock())
+    trial = TrialData(3, 1, "left", store=store)
+    trial.player_answer = "right"
+    trial.is_correct = False
+    trial.response_time = 1.25
+
+    view = TrialData.view(store, trial.row)
+    assert (view.level, view.trial_number) == (3, 1)
+    assert (view.correct_answer, view.player_answer) == ("left", "right")
+    assert view.is_correct is False
+    assert view.response_time == 1.25
+    assert view.exposure_frames is None
+    assert view.stimulus_onset is None
+
+
+@pytest.mark.parametrize("answer", [0, 7, -3, 2 ** 62, "left", [3, 1, 2], None])
+def test_answers_round_trip(answer):
+    store = TrialStore()
+    row = store.append()
+    store.set_answer("player_answer", row, answer)
+    assert store.get_answer("player_answer", row) == answer
+
+
+def test_overwriting_a_side_table_answer_with_an_int():
+    store = TrialStore()
+    row = store.append()
+    store.set_answer("correct_answer", row, [1, 2])
+    store.set_answer("correct_answer", row, 5)
+    assert store.get_answer("correct_answer", row) == 5
+    assert store.side_table == {}
+
+
+def test_running_stats_match_statistics_module():
+    rng = random.Random(3)
+    clock = VirtualClock()
+    tracker = DataTracker(session_seed=1, clock=clock)
+    times = []
+    for number in range(1, 501):
+        tracker.start_trial(2, number, 4)
+        rt = rng.lognormvariate(1.0, 0.6)
+        clock.advance(rt)
+        times.append(tracker.current_trial.clock.now() - tracker.current_trial.start_time)
+        tracker.record_answer(4 if rng.random() < 0.7 else 5)
+
+    stats = tracker.level_data[2].stats
+    assert stats.count == 500
+    assert stats.time_mean == pytest.approx(statistics.fmean(times), rel=1e-12)
+    assert stats.time_variance() == pytest.approx(statistics.variance(times), rel=1e-9)
+    assert stats.time_min == min(times)
+    assert stats.time_max == max(times)
+
+    summary = tracker.get_level_summary(2)
+    trials = list(tracker.level_data[2])
+    assert summary["correct"] == sum(t.is_correct for t in trials)
+    assert summary["response_time_sd"] == round(statistics.stdev(times), 2)
+
+
+def test_variance_is_stable_with_a_large_offset():
+    # Welford no pierde precisión aunque los tiempos estén lejos de cero
+    values = [1e9 + x for x in (4.0, 7.0, 13.0, 16.0)]
+
+    class Trial:
+        is_correct = True
+        attempts = 1
+        dispatch_delay = None
+        timing_suspect = False
+        trial_number = 1
+
+        def __init__(self, rt):
+            self.response_time = rt
+
+        def exposure_time(self):
+            return None
+
+    stats = RunningStats()
+    for value in values:
+        stats.add(Trial(value))
+    assert stats.time_variance() == pytest.approx(statistics.variance(values))
+    assert RunningStats().time_variance() == 0.0
+    assert not math.isnan(stats.time_mean)
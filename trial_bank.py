@@ -0,0 +1,81 @@
+"""
+Banco de intentos pre-generados.
+Cada nivel genera en un hilo de fondo los datos de sus próximos intentos
+(posiciones, colores, opciones y respuesta correcta). Así setup_trial solo
+toma el siguiente intento ya preparado y crea los objetos de arcade, y no
+hay pausa entre el panel de feedback y el siguiente estímulo.
+"""
+
+import queue
+import threading
+
+from seeding import trial_rng
+
+
+class TrialBank:
+    """Cola de intentos generados por adelantado en un hilo de trabajo."""
+
+    def __init__(self, generate_trial, count, session_seed, level):
+        """Inicia la generación en segundo plano.
+
+        Args:
+            generate_trial: Función que recibe un random.Random y devuelve
+                los datos de un intento (un diccionario). Se ejecuta en otro
+                hilo, así que no debe tocar la ventana ni objetos de arcade.
+            count: Número de intentos a generar.
+            session_seed: Semilla de la sesión.
+            level: Número de nivel, para derivar la semilla de cada intento.
+        """
+        self.generate_trial = generate_trial
+        self.count = count
+        self.remaining = count
+        self.session_seed = session_seed
+        self.level = level
+        self.next_number = count + 1
+        self.trials = queue.Queue()
+        self.error = None  # Error del hilo de trabajo, una vez que pop lo recibió
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+
+    def _generate(self, trial_number):
+        rng = trial_rng(self.session_seed, self.level, trial_number)
+        return self.generate_trial(rng)
+
+    def _run(self):
+        for trial_number in range(1, self.count + 1):
+            try:
+                trial = self._generate(trial_number)
+            except Exception as e:
+                # Se entrega el error para que pop lo lance en el hilo principal
+                self.trials.put(e)
+                return
+            self.trials.put(trial)
+
+    def ready(self):
+        """Número de intentos listos para usarse."""
+        return self.trials.qsize()
+
+    def pop(self):
+        """Devuelve el siguiente intento preparado.
+
+        Si el hilo todavía no lo terminó, espera a que esté listo. Si ya se
+        usaron todos los intentos del banco, genera uno en el hilo actual.
+
+        Raises:
+            Exception: El error que haya ocurrido al generar el intento. El
+                hilo se detiene en el primer error, así que las llamadas
+                siguientes lanzan el mismo error en lugar de esperar
+                intentos que nunca llegarán.
+        """
+        if self.error is not None:
+            raise self.error
+        if self.remaining <= 0:
+            trial = self._generate(self.next_number)
+            self.next_number += 1
+            return trial
+        self.remaining -= 1
+        trial = self.trials.get()
+        if isinstance(trial, Exception):
+            self.error = trial
+            raise trial
+        return trial
@@ -0,0 +1,261 @@
+"""
+Almacenamiento columnar de los intentos.
+En lugar de un objeto con su propio __dict__ por intento, los datos se
+guardan en arreglos tipados paralelos (una columna por campo, una fila por
+intento). TrialData (data_tracker.py) es una vista con __slots__ sobre una
+fila: se usa igual que antes, pero cada intento ocupa unas decenas de bytes.
+Sirve para mantener en memoria historiales de muchas sesiones y las
+simulaciones con millones de intentos.
+
+Los valores opcionales se guardan con un marcador: NaN en las columnas
+float y -1 en las enteras. Las respuestas (correcta y del jugador) son
+enteros en casi todos los niveles; las que no lo son (el lado en el
+Nivel 3, la secuencia en el Nivel 5) van a una tabla aparte.
+"""
+
+import math
+from array import array
+
+NAN = float("nan")
+
+# Marcadores de la columna entera de respuestas
+ANSWER_NONE = -(2 ** 63)
+ANSWER_IN_SIDE_TABLE = ANSWER_NONE + 1
+
+# Columnas numéricas: (nombre, tipo de array, valor inicial)
+NUMERIC_COLUMNS = (
+    ("level", "b", 0),
+    ("trial_number", "i", 0),
+    ("is_correct", "b", 0),
+    ("attempts", "i", 0),
+    ("start_time", "d", NAN),
+    ("end_time", "d", NAN),
+    ("response_time", "d", NAN),
+    ("stimulus_onset", "d", NAN),
+    ("stimulus_offset", "d", NAN),
+    ("exposure_frames", "i", -1),
+    ("refresh_interval", "d", NAN),
+    ("dispatch_delay", "d", NAN),
+    ("timing_suspect", "b", 0),
+    ("hitch_count", "i", 0),
+)
+
+ANSWER_COLUMNS = ("correct_answer", "player_answer")
+
+# Campos de un intento, en el orden de las columnas (ver TrialData.to_record)
+RECORD_FIELDS = tuple(name for name, _, _ in NUMERIC_COLUMNS) + ANSWER_COLUMNS
+
+
+class TrialStore:
+    """Columnas de los intentos de una sesión (o de muchas)."""
+
+    def __init__(self, clock=None):
+        """Crea un almacén vacío.
+
+        Args:
+            clock: Reloj con que se miden los intentos de este almacén.
+        """
+        self.clock = clock
+        self.size = 0
+        for name, code, _ in NUMERIC_COLUMNS:
+            setattr(self, name, array(code))
+        for name in ANSWER_COLUMNS:
+            setattr(self, name, array("q"))
+        # (columna, fila) -> respuesta que no es un entero
+        self.side_table = {}
+
+    def __len__(self):
+        return self.size
+
+    def append(self):
+        """Agrega una fila con los valores iniciales y devuelve su índice."""
+        for name, _, default in NUMERIC_COLUMNS:
+            getattr(self, name).append(default)
+        for name in ANSWER_COLUMNS:
+            getattr(self, name).append(ANSWER_NONE)
+        self.size += 1
+        return self.size - 1
+
+    def get_answer(self, column, row):
+        code = getattr(self, column)[row]
+        if code == ANSWER_NONE:
+            return None
+        if code == ANSWER_IN_SIDE_TABLE:
+            return self.side_table[(column, row)]
+        return code
+
+    def set_answer(self, column, row, value):
+        self.side_table.pop((column, row), None)
+        if value is None:
+            code = ANSWER_NONE
+        elif type(value) is int and ANSWER_IN_SIDE_TABLE < value < 2 ** 63:
+            code = value
+        else:
+            code = ANSWER_IN_SIDE_TABLE
+            self.side_table[(column, row)] = value
+        getattr(self, column)[row] = code
+
+    def memory_bytes(self):
+        """Bytes ocupados por las columnas (sin contar la tabla aparte)."""
+        columns = [name for name, _, _ in NUMERIC_COLUMNS] + list(ANSWER_COLUMNS)
+        return sum(
+            getattr(self, name).itemsize * len(getattr(self, name)) for name in columns
+        )
+
+
+class RunningStats:
+    """Acumulados de los intentos respondidos de un nivel.
+
+    Se actualizan al agregar cada intento, así el resumen del nivel (y la
+    varianza del tiempo de respuesta) se obtiene en tiempo constante en
+    cualquier momento. La varianza usa el método de Welford, que no pierde
+    precisión al restar sumas grandes.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.correct = 0
+        self.attempts = 0
+        # Tiempos de respuesta
+        self.time_count = 0
+        self.time_sum = 0.0
+        self.time_mean = 0.0
+        self.time_m2 = 0.0
+        self.time_min = None
+        self.time_max = None
+        # Exposición medida del estímulo
+        self.exposure_count = 0
+        self.exposure_sum = 0.0
+        self.exposure_min = None
+        self.exposure_max = None
+        # Retraso de despacho de las respuestas con hora de llegada
+        self.delay_count = 0
+        self.delay_sum = 0.0
+        self.delay_max = None
+        self.suspect_trials = []
+
+    def add(self, trial):
+        """Suma un intento respondido (TrialData)."""
+        self.count += 1
+        self.correct += 1 if trial.is_correct else 0
+        self.attempts += trial.attempts
+
+        rt = trial.response_time
+        if rt is not None:
+            self.time_count += 1
+            self.time_sum += rt
+            delta = rt - self.time_mean
+            self.time_mean += delta / self.time_count
+            self.time_m2 += delta * (rt - self.time_mean)
+            self.time_min = rt if self.time_min is None else min(self.time_min, rt)
+            self.time_max = rt if self.time_max is None else max(self.time_max, rt)
+
+        exposure = trial.exposure_time()
+        if exposure is not None:
+            self.exposure_count += 1
+            self.exposure_sum += exposure
+            self.exposure_min = exposure if self.exposure_min is None else min(self.exposure_min, exposure)
+            self.exposure_max = exposure if self.exposure_max is None else max(self.exposure_max, exposure)
+
+        delay = trial.dispatch_delay
+        if delay is not None:
+            self.delay_count += 1
+            self.delay_sum += delay
+            self.delay_max = delay if self.delay_max is None else max(self.delay_max, delay)
+
+        if trial.timing_suspect:
+            self.suspect_trials.append(trial.trial_number)
+
+    def time_variance(self):
+        """Varianza muestral del tiempo de respuesta (0 con menos de dos datos)."""
+        if self.time_count < 2:
+            return 0.0
+        return self.time_m2 / (self.time_count - 1)
+
+
+class LevelTrials:
+    """Intentos respondidos de un nivel: índices de filas de un TrialStore.
+
+    Se comporta como la lista de TrialData que era antes (append, len,
+    iteración e índices) y mantiene los acumulados del nivel en stats.
+    """
+
+    def __init__(self, store, view_class):
+        """Crea la lista vacía.
+
+        Args:
+            store: TrialStore de las filas.
+            view_class: Clase con view(store, row) para leer cada fila.
+        """
+        self.store = store
+        self.view_class = view_class
+        self.rows = array("l")
+        self.stats = RunningStats()
+
+    def append(self, trial):
+        """Agrega un intento ya respondido y actualiza los acumulados."""
+        if trial.store is not self.store:
+            raise ValueError("El intento pertenece a otro almacén")
+        self.rows.append(trial.row)
+        self.stats.add(trial)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        view = self.view_class.view
+        store = self.store
+        for row in self.rows:
+            yield view(store, row)
+
+    def __getitem__(self, index):
+        return self.view_class.view(self.store, self.rows[index])
+
+
+# --- Propiedades de TrialData sobre las columnas ---
+
+def int_column(name):
+    def get(self):
+        return getattr(self.store, name)[self.row]
+
+    def set(self, value):
+        getattr(self.store, name)[self.row] = value
+    return property(get, set)
+
+
+def bool_column(name):
+    def get(self):
+        return bool(getattr(self.store, name)[self.row])
+
+    def set(self, value):
+        getattr(self.store, name)[self.row] = 1 if value else 0
+    return property(get, set)
+
+
+def optional_int_column(name):
+    def get(self):
+        value = getattr(self.store, name)[self.row]
+        return None if value == -1 else value
+
+    def set(self, value):
+        getattr(self.store, name)[self.row] = -1 if value is None else value
+    return property(get, set)
+
+
+def float_column(name):
+    def get(self):
+        value = getattr(self.store, name)[self.row]
+        return None if math.isnan(value) else value
+
+    def set(self, value):
+        getattr(self.store, name)[self.row] = NAN if value is None else value
+    return property(get, set)
+
+
+def answer_column(name):
+    def get(self):
+        return self.store.get_answer(name, self.row)
+
+    def set(self, value):
+        self.store.set_answer(name, self.row, value)
+    return property(get, set)
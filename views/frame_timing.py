@@ -0,0 +1,422 @@
+"""
+Medición del tiempo de cada frame por vista.
+Las vistas que heredan de TimedView registran la duración de on_update y
+on_draw en un búfer circular de tamaño fijo (los últimos frames, con el
+nivel y el intento en que ocurrieron) y en un histograma de cubetas
+logarítmicas (toda la sesión). Registrar un frame cuesta dos lecturas de
+perf_counter y unas pocas escrituras en arreglos.
+
+Cada frame guarda también las llamadas de dibujo y primitivas contadas por
+render.DRAW_COUNTER, y la vista acumula los totales por objeto y tipo de
+primitiva.
+
+Con F3 se muestra una capa de depuración con los percentiles p50/p95/p99 y
+las llamadas de dibujo del último frame de la vista actual. Al cerrar el
+juego los datos se guardan junto al reporte.
+
+notify_flip mide además el intervalo entre flips (REFRESH_RATE), con el que
+el Nivel 1 calcula cuántos frames dura la exposición.
+"""
+
+import json
+import math
+import statistics
+import time
+from array import array
+from collections import deque
+
+import arcade
+from views import render
+from views.hitch_watchdog import HITCH_WATCHDOG
+from scheduler import SCHEDULER
+from clock import get_clock
+
+# Frames guardados por vista en el búfer circular
+FRAME_RING_SIZE = 8192
+
+# Histograma: cubetas logarítmicas desde 10 µs hasta ~10 s, 4 por octava
+HISTOGRAM_MIN = 1e-5
+HISTOGRAM_BUCKETS_PER_OCTAVE = 4
+HISTOGRAM_BUCKETS = 80
+
+OVERLAY_KEY = arcade.key.F3
+
+# Intervalos entre flips con que se estima el refresco de la pantalla
+REFRESH_SAMPLES = 120
+REFRESH_MIN_SAMPLES = 10
+# Intervalos más largos no son frames seguidos (carga, ventana minimizada...)
+REFRESH_MAX_INTERVAL = 0.1
+
+
+class FrameHistogram:
+    """Histograma de duraciones con cubetas logarítmicas (error relativo ~19%)."""
+
+    def __init__(self):
+        self.counts = array("l", [0] * HISTOGRAM_BUCKETS)
+        self.total = 0
+        self.max = 0.0
+
+    def bucket(self, seconds):
+        """Índice de la cubeta de una duración."""
+        if seconds <= HISTOGRAM_MIN:
+            return 0
+        index = int(math.log2(seconds / HISTOGRAM_MIN) * HISTOGRAM_BUCKETS_PER_OCTAVE)
+        return min(index, HISTOGRAM_BUCKETS - 1)
+
+    @staticmethod
+    def upper_edge(index):
+        """Límite superior (en segundos) de una cubeta."""
+        return HISTOGRAM_MIN * 2 ** ((index + 1) / HISTOGRAM_BUCKETS_PER_OCTAVE)
+
+    def add(self, seconds):
+        self.counts[self.bucket(seconds)] += 1
+        self.total += 1
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, p):
+        """Percentil aproximado (límite superior de la cubeta que lo contiene).
+
+        Args:
+            p: Percentil entre 0 y 100.
+
+        Returns:
+            Duración en segundos, o 0 si no hay datos.
+        """
+        if self.total == 0:
+            return 0.0
+        target = self.total * p / 100
+        running = 0
+        for index, count in enumerate(self.counts):
+            running += count
+            if running >= target and count:
+                return min(self.upper_edge(index), self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            "bucket_upper_edges": [self.upper_edge(i) for i in range(HISTOGRAM_BUCKETS)],
+            "counts": list(self.counts),
+            "total": self.total,
+            "max": self.max,
+        }
+
+
+class ViewTiming:
+    """Tiempos de frame de una vista: búfer circular e histogramas."""
+
+    def __init__(self, name, size=FRAME_RING_SIZE):
+        self.name = name
+        self.size = size
+        self.index = 0
+        self.count = 0
+        # Búfer circular (estructura de arreglos)
+        self.timestamps = array("d", [0.0] * size)
+        self.update_times = array("d", [0.0] * size)
+        self.draw_times = array("d", [0.0] * size)
+        self.levels = array("b", [0] * size)
+        self.trials = array("h", [0] * size)
+        self.draw_calls = array("l", [0] * size)
+        self.primitives = array("l", [0] * size)
+        self.update_histogram = FrameHistogram()
+        self.draw_histogram = FrameHistogram()
+        self.frame_histogram = FrameHistogram()
+        self.pending_update = 0.0
+        # Acumulado de la sesión: "objeto/primitiva" -> [llamadas, primitivas]
+        self.draw_totals = {}
+        self.max_draw_calls = 0
+        self.last_owners = {}
+
+    def record_update(self, seconds):
+        """Guarda la duración de on_update; se completa con el on_draw siguiente."""
+        self.pending_update = seconds
+        self.update_histogram.add(seconds)
+
+    def record_draw(self, seconds, level=0, trial=0):
+        """Guarda la duración de on_draw y cierra el frame en el búfer circular."""
+        i = self.index
+        self.timestamps[i] = time.perf_counter()
+        self.update_times[i] = self.pending_update
+        self.draw_times[i] = seconds
+        self.levels[i] = level
+        self.trials[i] = trial
+        self.index = (i + 1) % self.size
+        self.count += 1
+        self.draw_histogram.add(seconds)
+        self.frame_histogram.add(self.pending_update + seconds)
+        self.pending_update = 0.0
+
+    def record_draw_counts(self, counter):
+        """Guarda los contadores de dibujo del frame recién cerrado.
+
+        Args:
+            counter: render.DrawCounter con lo dibujado en el frame.
+        """
+        i = (self.index - 1) % self.size
+        calls = counter.total_calls()
+        self.draw_calls[i] = calls
+        self.primitives[i] = counter.total_primitives()
+        if calls > self.max_draw_calls:
+            self.max_draw_calls = calls
+        for key, count in counter.calls.items():
+            name = f"{key[0]}/{key[1]}"
+            entry = self.draw_totals.get(name)
+            if entry is None:
+                entry = self.draw_totals[name] = [0, 0]
+            entry[0] += count
+            entry[1] += counter.primitives[key]
+        if FRAME_STATS.overlay_visible:
+            self.last_owners = counter.by_owner()
+
+    def recent_frames(self):
+        """Frames del búfer circular en orden cronológico.
+
+        Returns:
+            Lista de diccionarios (instante, update, draw, nivel, intento).
+        """
+        stored = min(self.count, self.size)
+        start = (self.index - stored) % self.size
+        frames = []
+        for k in range(stored):
+            i = (start + k) % self.size
+            frames.append({
+                "t": round(self.timestamps[i], 6),
+                "update_ms": round(self.update_times[i] * 1000, 3),
+                "draw_ms": round(self.draw_times[i] * 1000, 3),
+                "level": self.levels[i],
+                "trial": self.trials[i],
+                "draw_calls": self.draw_calls[i],
+                "primitives": self.primitives[i],
+            })
+        return frames
+
+    def percentiles(self, histogram=None):
+        """p50/p95/p99 en milisegundos del frame completo (update + draw)."""
+        histogram = histogram or self.frame_histogram
+        return {
+            f"p{p}": round(histogram.percentile(p) * 1000, 2) for p in (50, 95, 99)
+        }
+
+    def to_dict(self):
+        return {
+            "frames": self.count,
+            "frame_percentiles_ms": self.percentiles(),
+            "update_percentiles_ms": self.percentiles(self.update_histogram),
+            "draw_percentiles_ms": self.percentiles(self.draw_histogram),
+            "frame_histogram": self.frame_histogram.to_dict(),
+            "update_histogram": self.update_histogram.to_dict(),
+            "draw_histogram": self.draw_histogram.to_dict(),
+            "max_draw_calls": self.max_draw_calls,
+            "draw_totals": {
+                name: {"calls": calls, "primitives": primitives}
+                for name, (calls, primitives) in sorted(self.draw_totals.items())
+            },
+            "recent_frames": self.recent_frames(),
+        }
+
+
+class FrameStats:
+    """Registro de los tiempos de todas las vistas."""
+
+    def __init__(self):
+        self.views = {}
+        self.overlay_visible = False
+
+    def for_view(self, name):
+        timing = self.views.get(name)
+        if timing is None:
+            timing = self.views[name] = ViewTiming(name)
+        return timing
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+
+    def to_dict(self):
+        return {name: timing.to_dict() for name, timing in self.views.items()}
+
+    def save(self, report_file=None):
+        """Guarda los tiempos en JSON.
+
+        Args:
+            report_file: Ruta del reporte de la sesión. Si se indica, los
+                tiempos se guardan al lado con el sufijo "_frames".
+
+        Returns:
+            Ruta del archivo guardado o None si hubo un error.
+        """
+        if report_file:
+            base = report_file[:-5] if report_file.endswith(".json") else report_file
+            filename = f"{base}_frames.json"
+        else:
+            filename = f"frames_{int(time.time())}.json"
+        try:
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f)
+            return filename
+        except Exception as e:
+            print(f"Aviso: No se pudieron guardar los tiempos de frame: {e}")
+            return None
+
+
+# Registro compartido por todas las vistas
+FRAME_STATS = FrameStats()
+
+
+def draw_overlay(timing):
+    """Dibuja la capa de depuración con los percentiles de la vista."""
+    frame = timing.percentiles()
+    update = timing.percentiles(timing.update_histogram)
+    draw = timing.percentiles(timing.draw_histogram)
+    lines = [
+        timing.name,
+        "frame  p50 {p50} ms  p95 {p95} ms  p99 {p99} ms".format(**frame),
+        "update p50 {p50} ms  p95 {p95} ms  p99 {p99} ms".format(**update),
+        "draw   p50 {p50} ms  p95 {p95} ms  p99 {p99} ms".format(**draw),
+    ]
+    if timing.count:
+        last = (timing.index - 1) % timing.size
+        lines.append(
+            f"llamadas {timing.draw_calls[last]}  primitivas {timing.primitives[last]}"
+            f"  (máx. {timing.max_draw_calls})"
+        )
+        # Los tres objetos con más llamadas en el último frame
+        owners = sorted(
+            timing.last_owners.items(), key=lambda item: item[1]["calls"], reverse=True
+        )[:3]
+        lines.append("  ".join(f"{owner} {entry['calls']}" for owner, entry in owners))
+
+    height = len(lines) * 20 + 16
+    render.draw_rectangle_filled(190, 4 + height / 2, 370, height, (0, 0, 0, 170))
+    for i, line in enumerate(lines):
+        render.draw_text_cached(
+            ("frame_overlay", i), line, 12, height - 10 - i * 20, (255, 255, 255),
+            font_size=10,
+        )
+
+
+def _timed_update(on_update):
+    def wrapper(self, delta_time):
+        watchdog = HITCH_WATCHDOG if HITCH_WATCHDOG.active else None
+        if watchdog:
+            watchdog.begin()
+        start = time.perf_counter()
+        on_update(self, delta_time)
+        if watchdog:
+            watchdog.end(self, "on_update")
+        FRAME_STATS.for_view(type(self).__name__).record_update(time.perf_counter() - start)
+    wrapper.__wrapped__ = on_update
+    wrapper.__doc__ = on_update.__doc__
+    return wrapper
+
+
+def _timed_draw(on_draw):
+    def wrapper(self):
+        name = type(self).__name__
+        render.DRAW_COUNTER.reset(name)
+        watchdog = HITCH_WATCHDOG if HITCH_WATCHDOG.active else None
+        if watchdog:
+            watchdog.begin()
+        start = time.perf_counter()
+        on_draw(self)
+        elapsed = time.perf_counter() - start
+        if watchdog:
+            watchdog.end(self, "on_draw")
+        timing = FRAME_STATS.for_view(name)
+        timing.record_draw(
+            elapsed, getattr(self, "level_number", 0), getattr(self, "trial_number", 0)
+        )
+        timing.record_draw_counts(render.DRAW_COUNTER)
+        if FRAME_STATS.overlay_visible:
+            draw_overlay(timing)
+    wrapper.__wrapped__ = on_draw
+    wrapper.__doc__ = on_draw.__doc__
+    return wrapper
+
+
+class TimedView(arcade.View):
+    """Vista cuyos on_update y on_draw se cronometran automáticamente.
+
+    Al definir una subclase se envuelven los on_update/on_draw que declare,
+    así las vistas no tienen que llamar a nada para medirse.
+
+    También registra temporizadores en el planificador central (ver
+    scheduler.py) a nombre de la vista; se cancelan al ocultarla. Las
+    subclases que redefinan on_hide_view deben llamar a super().
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "on_update" in cls.__dict__:
+            cls.on_update = _timed_update(cls.__dict__["on_update"])
+        if "on_draw" in cls.__dict__:
+            cls.on_draw = _timed_draw(cls.__dict__["on_draw"])
+
+    def call_later(self, delay, callback, *args):
+        """Llama a callback(*args) una vez dentro de `delay` segundos."""
+        return SCHEDULER.call_later(delay, callback, *args, owner=self)
+
+    def call_every(self, interval, callback, *args):
+        """Llama a callback(*args) cada `interval` segundos mientras la vista se muestre."""
+        return SCHEDULER.call_every(interval, callback, *args, owner=self)
+
+    def on_hide_view(self):
+        SCHEDULER.cancel_owner(self)
+
+
+class RefreshRate:
+    """Intervalo de refresco de la pantalla medido entre flips consecutivos."""
+
+    def __init__(self, samples=REFRESH_SAMPLES):
+        self.intervals = deque(maxlen=samples)
+        self.last_flip = None
+
+    def record_flip(self, timestamp):
+        """Anota la hora (del reloj activo) de un flip."""
+        if self.last_flip is not None:
+            interval = timestamp - self.last_flip
+            if 0 < interval <= REFRESH_MAX_INTERVAL:
+                self.intervals.append(interval)
+        self.last_flip = timestamp
+
+    def interval(self):
+        """Mediana de los últimos intervalos en segundos, o None si aún hay pocos."""
+        if len(self.intervals) < REFRESH_MIN_SAMPLES:
+            return None
+        return statistics.median(self.intervals)
+
+
+# Refresco medido de la ventana del juego (lo actualiza notify_flip)
+REFRESH_RATE = RefreshRate()
+
+
+def notify_flip(window):
+    """Avisa a la vista actual que su frame acaba de llegar a la pantalla."""
+    REFRESH_RATE.record_flip(get_clock().now())
+    on_flip = getattr(window.current_view, "on_flip", None)
+    if on_flip is not None:
+        on_flip()
+
+
+def install_flip_hook(window):
+    """Hace que la ventana llame a on_flip() de la vista después de cada flip.
+
+    Con vsync activado el flip termina cuando el frame se muestra, así que
+    la hora leída en on_flip es la de aparición en pantalla.
+    """
+    flip = window.flip
+
+    def flip_and_notify():
+        flip()
+        notify_flip(window)
+
+    window.flip = flip_and_notify
+
+
+def install_overlay_key(window):
+    """Activa la tecla F3 para mostrar u ocultar la capa de depuración."""
+
+    def on_key_press(key, modifiers):
+        if key == OVERLAY_KEY:
+            FRAME_STATS.toggle_overlay()
+
+    window.push_handlers(on_key_press=on_key_press)
@@ -0,0 +1,264 @@
+"""
+Atlas de texturas de gemas.
+Rasteriza una sola vez cada color de GEM_COLORS en los tamaños de gema del
+juego (con sombra y brillo) dentro de una sola imagen. La imagen se guarda en
+disco para que los siguientes arranques solo tengan que cargarla.
+"""
+
+import hashlib
+import math
+import os
+
+import arcade
+from PIL import Image, ImageDraw
+from constants import *
+
+
+# Cambiar este número si cambia la forma de las gemas para invalidar la caché
+ATLAS_VERSION = 1
+ATLAS_CACHE_DIR = os.path.join("assets", "cache")
+
+# Factor de sobremuestreo para bordes suaves
+SUPERSAMPLE = 4
+
+# Las gemas del menú se rasterizan a este tamaño y se escalan al dibujarse
+MENU_GEM_SIZE = 30
+
+SPARKLE_RADII = (3, 2)
+
+# Filas del atlas: (estilo, tamaño)
+ATLAS_ROWS = [
+    ("level", GEM_SIZE_SMALL),
+    ("level", GEM_SIZE),
+    ("level", GEM_SIZE_LARGE),
+    ("menu", MENU_GEM_SIZE),
+]
+
+# --- Texturas cargadas (se llenan con load_gem_atlas) ---
+GEM_TEXTURES = {}
+SPARKLE_TEXTURES = {}
+
+
+def gem_cell_size(size):
+    """Calcula el tamaño de la celda que contiene una gema con su sombra.
+
+    La gema queda centrada en la celda para que el centro del sprite
+    coincida con la posición (x, y) de la gema.
+
+    Args:
+        size: Tamaño base de la gema.
+
+    Returns:
+        Tupla (ancho, alto) en píxeles.
+    """
+    half_w = math.ceil(size * 0.6) + 3
+    half_h = math.ceil(size) + 2
+    return half_w * 2, half_h * 2
+
+
+def rasterize_gem(color, size, style="level"):
+    """Dibuja una gema (sombra, cuerpo y brillo) en una imagen RGBA.
+
+    Reproduce la forma de los diamantes que antes se dibujaban con primitivas.
+
+    Args:
+        color: Tupla RGB del color de la gema.
+        size: Tamaño base de la gema.
+        style: "level" para gemas de los niveles, "menu" para las del menú.
+
+    Returns:
+        Imagen PIL del tamaño de gem_cell_size(size).
+    """
+    width, height = gem_cell_size(size)
+    big = Image.new("RGBA", (width * SUPERSAMPLE, height * SUPERSAMPLE), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(big)
+
+    def to_image(dx, dy):
+        # Coordenadas relativas al centro de la gema (y hacia arriba)
+        return (
+            (width / 2 + dx) * SUPERSAMPLE,
+            (height / 2 - dy) * SUPERSAMPLE,
+        )
+
+    def polygon(points, fill):
+        draw.polygon([to_image(px * size, py * size) for px, py in points], fill=fill)
+
+    if style == "menu":
+        highlight = tuple(min(255, c + 80) for c in color)
+        polygon([(0, 1), (0.6, 0), (0, -0.4), (-0.6, 0)], (*color, 255))
+        polygon([(0, 0.6), (0.3, 0.1), (0, -0.1), (-0.3, 0.1)], (*highlight, 255))
+    else:
+        # Sombra debajo de la gema
+        left, top = to_image(2 - size * 0.4, -size * 0.5 + size * 0.1)
+        right, bottom = to_image(2 + size * 0.4, -size * 0.5 - size * 0.1)
+        draw.ellipse([left, top, right, bottom], fill=(0, 0, 0, 30))
+
+        highlight = tuple(min(255, c + 100) for c in color)
+        polygon([(0, 1), (0.6, 0), (0, -0.4), (-0.6, 0)], (*color, 255))
+        polygon([(0, 0.7), (0.25, 0.15), (0, 0.05), (-0.25, 0.15)], (*highlight, 255))
+
+    return _downsample(big, (width, height))
+
+
+def rasterize_sparkle(radius):
+    """Dibuja un destello circular blanco.
+
+    Args:
+        radius: Radio en píxeles.
+
+    Returns:
+        Imagen PIL cuadrada con el destello centrado.
+    """
+    side = radius * 2 + 2
+    big = Image.new("RGBA", (side * SUPERSAMPLE, side * SUPERSAMPLE), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(big)
+    margin = SUPERSAMPLE
+    draw.ellipse(
+        [margin, margin, (side - 1) * SUPERSAMPLE, (side - 1) * SUPERSAMPLE],
+        fill=(255, 255, 255, 255),
+    )
+    return _downsample(big, (side, side))
+
+
+def _downsample(image, size):
+    """Reduce una imagen sobremuestreada usando alpha premultiplicado."""
+    return image.convert("RGBa").resize(size, Image.LANCZOS).convert("RGBA")
+
+
+def atlas_layout():
+    """Calcula la posición de cada celda dentro del atlas.
+
+    Returns:
+        Tupla (cells, atlas_size) donde cells es un diccionario
+        clave -> (x, y, ancho, alto). Las claves de gemas son
+        (estilo, color, tamaño) y las de destellos ("sparkle", radio).
+    """
+    cells = {}
+    atlas_w = 0
+    y = 0
+    for style, size in ATLAS_ROWS:
+        cell_w, cell_h = gem_cell_size(size)
+        for i, color in enumerate(GEM_COLORS):
+            cells[(style, tuple(color), size)] = (i * cell_w, y, cell_w, cell_h)
+        atlas_w = max(atlas_w, cell_w * len(GEM_COLORS))
+        y += cell_h
+
+    x = 0
+    row_h = 0
+    for radius in SPARKLE_RADII:
+        side = radius * 2 + 2
+        cells[("sparkle", radius)] = (x, y, side, side)
+        x += side
+        row_h = max(row_h, side)
+    atlas_w = max(atlas_w, x)
+    y += row_h
+
+    return cells, (atlas_w, y)
+
+
+def atlas_cache_path():
+    """Ruta del archivo de caché del atlas.
+
+    El nombre incluye un hash de los colores y tamaños, así un cambio en
+    constants.py genera un atlas nuevo automáticamente.
+    """
+    key_source = repr((ATLAS_VERSION, SUPERSAMPLE, GEM_COLORS, ATLAS_ROWS, SPARKLE_RADII))
+    key = hashlib.sha1(key_source.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(ATLAS_CACHE_DIR, f"gem_atlas_{key}.png")
+
+
+def build_atlas_image():
+    """Rasteriza todas las gemas y destellos en una sola imagen."""
+    cells, atlas_size = atlas_layout()
+    atlas = Image.new("RGBA", atlas_size, (0, 0, 0, 0))
+    for key, (x, y, _, _) in cells.items():
+        if key[0] == "sparkle":
+            cell = rasterize_sparkle(key[1])
+        else:
+            style, color, size = key
+            cell = rasterize_gem(color, size, style)
+        atlas.paste(cell, (x, y))
+    return atlas
+
+
+def load_atlas_image():
+    """Carga el atlas desde la caché en disco o lo genera si no existe.
+
+    Si no se puede escribir la caché, el juego sigue funcionando con el
+    atlas en memoria.
+    """
+    _, atlas_size = atlas_layout()
+    path = atlas_cache_path()
+
+    try:
+        if os.path.exists(path):
+            with Image.open(path) as cached:
+                image = cached.convert("RGBA")
+            if image.size == atlas_size:
+                return image
+    except Exception as e:
+        print(f"Aviso: No se pudo leer la caché del atlas: {e}")
+
+    image = build_atlas_image()
+    try:
+        os.makedirs(ATLAS_CACHE_DIR, exist_ok=True)
+        image.save(path)
+    except Exception as e:
+        print(f"Aviso: No se pudo guardar la caché del atlas: {e}")
+    return image
+
+
+def load_gem_atlas():
+    """Carga el atlas y crea una textura de arcade por cada celda.
+
+    Se ejecuta una sola vez; las llamadas siguientes no hacen nada.
+    """
+    if GEM_TEXTURES:
+        return
+
+    image = load_atlas_image()
+    cells, _ = atlas_layout()
+    for key, (x, y, w, h) in cells.items():
+        cell = image.crop((x, y, x + w, y + h))
+        name = "gem_atlas_" + "_".join(str(part) for part in key)
+        texture = arcade.Texture(name, image=cell, hit_box_algorithm="None")
+        if key[0] == "sparkle":
+            SPARKLE_TEXTURES[key[1]] = texture
+        else:
+            GEM_TEXTURES[key] = texture
+
+
+def get_gem_texture(color, size, style="level"):
+    """Obtiene la textura de una gema y la escala para dibujarla a su tamaño.
+
+    Si el tamaño no está en el atlas se usa el tamaño más cercano escalado.
+    Los colores fuera de GEM_COLORS se rasterizan aparte y se guardan en memoria.
+
+    Args:
+        color: Tupla RGB del color de la gema.
+        size: Tamaño base deseado.
+        style: "level" o "menu".
+
+    Returns:
+        Tupla (textura, escala).
+    """
+    load_gem_atlas()
+    sizes = [s for st, s in ATLAS_ROWS if st == style]
+    base_size = min(sizes, key=lambda s: abs(s - size))
+    key = (style, tuple(color[:3]), base_size)
+
+    texture = GEM_TEXTURES.get(key)
+    if texture is None:
+        name = "gem_extra_" + "_".join(str(part) for part in (style, *key[1], base_size))
+        texture = arcade.Texture(
+            name, image=rasterize_gem(key[1], base_size, style), hit_box_algorithm="None"
+        )
+        GEM_TEXTURES[key] = texture
+
+    return texture, size / base_size
+
+
+def get_sparkle_texture(radius):
+    """Obtiene la textura de un destello del radio indicado (3 o 2 píxeles)."""
+    load_gem_atlas()
+    return SPARKLE_TEXTURES[radius]
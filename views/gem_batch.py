@@ -0,0 +1,51 @@
+"""
+Renderizado por lotes de gemas.
+Todas las gemas de un intento comparten un solo arcade.SpriteList con
+texturas pre-rasterizadas del atlas de gemas, así que dibujarlas cuesta una
+sola llamada instanciada. Cada frame solo cambian posiciones y transparencias.
+"""
+
+import arcade
+from views import render
+
+
+class GemBatch:
+    """Lote de gemas que se dibuja con una sola llamada."""
+
+    def __init__(self, gems=None):
+        """Inicializa el lote.
+
+        Args:
+            gems: Lista de gemas (Gem o subclases) a dibujar.
+        """
+        self.gems = []
+        self.sprite_list = arcade.SpriteList(use_spatial_hash=False, lazy=True)
+        if gems:
+            self.set_gems(gems)
+
+    def set_gems(self, gems):
+        """Reemplaza las gemas del lote (por ejemplo al iniciar un intento).
+
+        Los destellos solo se agregan para las gemas que ya están destellando,
+        así que start_sparkle debe llamarse antes de set_gems.
+
+        Args:
+            gems: Nueva lista de gemas.
+        """
+        self.gems = list(gems)
+        self.sprite_list.clear()
+        for gem in self.gems:
+            if not gem.visible:
+                continue
+            if gem.is_sparkling:
+                self.sprite_list.extend(gem.sprites)
+            else:
+                self.sprite_list.append(gem.sprite)
+
+    @render.counted("GemBatch")
+    def draw(self):
+        """Dibuja todas las gemas del lote."""
+        for gem in self.gems:
+            if gem.is_sparkling:
+                gem.update_sparkles()
+        render.draw_sprite_list(self.sprite_list)
@@ -0,0 +1,209 @@
+"""
+Detector de frames largos ("tirones").
+Un tirón no es solo un defecto visual: en el Nivel 1 las gemas se muestran
+1.5 s y en todos los niveles el tiempo de respuesta se mide con el reloj de
+la sesión, así que un frame bloqueado deforma las mediciones.
+
+Las vistas cronometradas (TimedView) avisan al vigilante al empezar y al
+terminar cada on_update/on_draw. También se vigilan los temporizadores del
+planificador (watch_timers), donde corren el cambio de intento y de nivel,
+y los eventos de entrada (input_timing.py), donde se procesan las
+respuestas. Un hilo aparte revisa cada pocos
+milisegundos si el callback en curso superó el presupuesto y, en ese
+momento, copia la pila del hilo principal. Al terminar el callback se
+registra el evento con el nivel, el intento y el estado de la vista, y el
+intento en curso se marca como de tiempo dudoso (timing_suspect).
+"""
+
+import json
+import sys
+import threading
+import time
+import traceback
+
+# Duración de un callback a partir de la cual se considera un tirón (segundos)
+HITCH_BUDGET = 0.05
+
+# Cada cuánto revisa el hilo vigilante (segundos)
+HITCH_POLL_INTERVAL = 0.005
+
+# Eventos guardados como máximo por sesión
+HITCH_MAX_EVENTS = 500
+
+
+def view_state(view):
+    """Estado de la vista para el registro ("playing", "feedback", ...)."""
+    state = getattr(view, "state", None)
+    if getattr(view, "showing_gems", False):
+        state = f"{state}/mostrando gemas"
+    return state
+
+
+class HitchWatchdog:
+    """Vigila la duración de los callbacks del hilo principal."""
+
+    def __init__(self, budget=HITCH_BUDGET, poll_interval=HITCH_POLL_INTERVAL):
+        """Inicializa el vigilante (inactivo hasta llamar a start()).
+
+        Args:
+            budget: Duración máxima de un callback en segundos.
+            poll_interval: Segundos entre revisiones del hilo vigilante.
+        """
+        self.budget = budget
+        self.poll_interval = poll_interval
+        self.active = False
+        self.thread_id = None
+        self.thread = None
+        self.stop_event = threading.Event()
+        # (número de callback, instante de inicio) o None fuera de un callback.
+        # Se asigna como una sola tupla para que el hilo vigilante la lea entera.
+        self.current = None
+        self.callback_number = 0
+        # (número de callback, pila) capturada por el hilo vigilante
+        self.captured = None
+        self.events = []
+
+    def start(self, thread_id=None):
+        """Empieza a vigilar el hilo indicado (por defecto el actual)."""
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.stop_event.clear()
+        self.active = True
+        self.thread = threading.Thread(target=self._run, name="HitchWatchdog", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Detiene el hilo vigilante."""
+        self.active = False
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def _run(self):
+        while not self.stop_event.wait(self.poll_interval):
+            current = self.current
+            if current is None:
+                continue
+            number, start = current
+            captured = self.captured
+            if captured is not None and captured[0] == number:
+                continue
+            if time.perf_counter() - start > self.budget:
+                frame = sys._current_frames().get(self.thread_id)
+                if frame is not None:
+                    self.captured = (number, traceback.format_stack(frame))
+
+    def begin(self):
+        """Marca el inicio de un callback en el hilo principal."""
+        self.callback_number += 1
+        self.current = (self.callback_number, time.perf_counter())
+
+    def end(self, view, callback):
+        """Marca el final de un callback y registra el tirón si lo hubo.
+
+        Args:
+            view: Vista que ejecutó el callback (puede ser None).
+            callback: "on_update", "on_draw", el evento de entrada
+                ("on_mouse_press"...) o "timer:<función>".
+
+        Returns:
+            Evento registrado o None si el callback cumplió el presupuesto.
+        """
+        current = self.current
+        self.current = None
+        if current is None:
+            return None
+        number, start = current
+        duration = time.perf_counter() - start
+        if duration <= self.budget:
+            return None
+
+        captured = self.captured
+        stack = captured[1] if captured is not None and captured[0] == number else None
+        event = {
+            "time": time.time(),
+            "view": type(view).__name__ if view is not None else None,
+            "callback": callback,
+            "duration_ms": round(duration * 1000, 2),
+            "budget_ms": round(self.budget * 1000, 2),
+            "level": getattr(view, "level_number", None),
+            "trial": getattr(view, "trial_number", None),
+            "state": view_state(view),
+            "stack": [line.rstrip() for line in stack] if stack else None,
+        }
+        if len(self.events) < HITCH_MAX_EVENTS:
+            self.events.append(event)
+        print(
+            f"Aviso: {event['view']}.{callback} tardó {event['duration_ms']} ms "
+            f"(nivel {event['level']}, intento {event['trial']}, estado {event['state']})"
+        )
+        self.mark_trial(view)
+        return event
+
+    @staticmethod
+    def mark_trial(view):
+        """Marca como dudoso el intento de la vista si aún espera respuesta."""
+        window = getattr(view, "window", None)
+        tracker = getattr(window, "tracker", None) if window else None
+        trial = tracker.current_trial if tracker is not None else None
+        if (
+            trial is not None
+            and trial.end_time is None
+            and trial.level == getattr(view, "level_number", None)
+        ):
+            trial.timing_suspect = True
+            trial.hitch_count += 1
+
+    def watch(self, view, name, callback, *args):
+        """Ejecuta callback(*args) midiendo su duración como un callback de la vista.
+
+        Si el vigilante está inactivo, o ya se está midiendo otro callback
+        que contiene a este, solo lo ejecuta.
+        """
+        if not self.active or self.current is not None:
+            return callback(*args)
+        self.begin()
+        try:
+            return callback(*args)
+        finally:
+            self.end(view, name)
+
+    def save(self, report_file=None):
+        """Guarda los tirones en JSON junto al reporte (sufijo "_hitches").
+
+        Returns:
+            Ruta del archivo guardado, o None si no hubo tirones o hubo un error.
+        """
+        if not self.events:
+            return None
+        if report_file:
+            base = report_file[:-5] if report_file.endswith(".json") else report_file
+            filename = f"{base}_hitches.json"
+        else:
+            filename = f"hitches_{int(time.time())}.json"
+        try:
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(self.events, f, ensure_ascii=False, indent=2)
+            return filename
+        except Exception as e:
+            print(f"Aviso: No se pudieron guardar los tirones: {e}")
+            return None
+
+
+# Vigilante compartido por todas las vistas cronometradas
+HITCH_WATCHDOG = HitchWatchdog()
+
+
+def watch_timers(scheduler, watchdog=HITCH_WATCHDOG):
+    """Mide con el vigilante cada temporizador que ejecute el planificador.
+
+    El tirón se atribuye al dueño del temporizador o, si no tiene, al objeto
+    del método llamado (la vista en self.end_feedback, por ejemplo).
+    """
+    def call(timer):
+        callback = timer.callback
+        view = timer.owner if timer.owner is not None else getattr(callback, "__self__", None)
+        name = f"timer:{getattr(callback, '__name__', 'callback')}"
+        watchdog.watch(view, name, callback, *timer.args)
+
+    scheduler.on_call = call
@@ -4,6 +4,7 @@ Pantalla de información sobre el juego.
 
 import arcade
 from constants import *
+from views import render
 
 
 class InfoView(arcade.View):
@@ -19,15 +20,15 @@ class InfoView(arcade.View):
         self.clear()
 
         # Panel de fondo
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, 800, 650, (255, 255, 255, 220)
         )
-        arcade.draw_rectangle_outline(
+        render.draw_rectangle_outline(
             SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, 800, 650, COLOR_PRIMARY, 3
         )
 
         # Título
-        arcade.draw_text(
+        render.draw_text(
             "Sobre NumWorld",
             SCREEN_WIDTH // 2,
             680,
@@ -62,7 +63,7 @@ class InfoView(arcade.View):
 
         for i, line in enumerate(info_lines):
             color = COLOR_ERROR if "IMPORTANTE" in line or "NO es" in line else COLOR_TEXT_DARK
-            arcade.draw_text(
+            render.draw_text(
                 line,
                 SCREEN_WIDTH // 2,
                 620 - i * 30,
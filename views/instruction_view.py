@@ -5,9 +5,11 @@ Pantalla de instrucciones antes de cada nivel.
 import arcade
 import math
 from constants import *
+from views import render
+from views.frame_timing import TimedView
 
 
-class InstructionView(arcade.View):
+class InstructionView(TimedView):
     """Vista que muestra las instrucciones antes de comenzar un nivel."""
 
     def __init__(self, level):
@@ -15,7 +17,6 @@ class InstructionView(arcade.View):
         self.level = level
         self.animation_time = 0
         self.ready = False
-        self.ready_timer = 0
 
         # --- Panel ---
         self.panel_cx = SCREEN_WIDTH // 2
@@ -33,6 +34,11 @@ class InstructionView(arcade.View):
 
     def on_show_view(self):
         arcade.set_background_color(COLOR_BACKGROUND)
+        self.call_later(INSTRUCTIONS_READY_DELAY, self.set_ready)
+
+    def set_ready(self):
+        """Habilita el botón de empezar."""
+        self.ready = True
 
     def on_draw(self):
         self.clear()
@@ -42,27 +48,27 @@ class InstructionView(arcade.View):
             y_offset = math.sin(self.animation_time * 2 + i * 0.05) * 20
             color_top = GEM_COLORS[i % len(GEM_COLORS)]
             color_bot = GEM_COLORS[(i + 3) % len(GEM_COLORS)]
-            arcade.draw_circle_filled(
+            render.draw_circle_filled(
                 i, 50 + y_offset, 8, (*color_top, 80)
             )
-            arcade.draw_circle_filled(
+            render.draw_circle_filled(
                 i, SCREEN_HEIGHT - 50 - y_offset, 8, (*color_bot, 80)
             )
 
         # Panel central
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             self.panel_cx, self.panel_cy,
             self.panel_w, self.panel_h,
             (255, 255, 255, 230)
         )
-        arcade.draw_rectangle_outline(
+        render.draw_rectangle_outline(
             self.panel_cx, self.panel_cy,
             self.panel_w, self.panel_h,
             COLOR_ACCENT, 3
         )
 
         # Número de nivel
-        arcade.draw_text(
+        render.draw_text(
             f"Nivel {self.level} de {TOTAL_LEVELS}",
             self.panel_cx,
             self.level_number_y,
@@ -75,7 +81,7 @@ class InstructionView(arcade.View):
 
         # Nombre del nivel (sin emojis)
         level_name = LEVEL_NAMES.get(self.level, f"Nivel {self.level}")
-        arcade.draw_text(
+        render.draw_text(
             level_name,
             self.panel_cx,
             self.level_name_y,
@@ -89,7 +95,7 @@ class InstructionView(arcade.View):
         # Instrucciones
         instructions = LEVEL_INSTRUCTIONS.get(self.level, ["¡Prepárate!"])
         for i, line in enumerate(instructions):
-            arcade.draw_text(
+            render.draw_text(
                 line,
                 self.panel_cx,
                 self.instructions_start_y - i * 32,
@@ -104,15 +110,15 @@ class InstructionView(arcade.View):
             pulse = math.sin(self.animation_time * 4) * 0.05 + 1.0
             btn_width = int(200 * pulse)
             btn_height = int(50 * pulse)
-            arcade.draw_rectangle_filled(
+            render.draw_rectangle_filled(
                 self.panel_cx, self.button_y,
                 btn_width, btn_height, COLOR_SECONDARY
             )
-            arcade.draw_rectangle_outline(
+            render.draw_rectangle_outline(
                 self.panel_cx, self.button_y,
                 btn_width, btn_height, (255, 255, 255, 150), 2
             )
-            arcade.draw_text(
+            render.draw_text(
                 "Empezar",
                 self.panel_cx,
                 self.button_y,
@@ -123,7 +129,7 @@ class InstructionView(arcade.View):
                 bold=True,
             )
         else:
-            arcade.draw_text(
+            render.draw_text(
                 "Preparando...",
                 self.panel_cx,
                 self.button_y,
@@ -135,10 +141,6 @@ class InstructionView(arcade.View):
 
     def on_update(self, delta_time):
         self.animation_time += delta_time
-        if not self.ready:
-            self.ready_timer += delta_time
-            if self.ready_timer >= 1.5:
-                self.ready = True
 
     def on_mouse_press(self, x, y, button, modifiers):
         if self.ready:
@@ -157,7 +159,7 @@ class InstructionView(arcade.View):
             self.window.show_view(Level3View())
         elif self.level == 4:
             from views.level4_estimation import Level4View
-            self.window.show_view(Level4View())
+            self.window.show_view(Level4View(extended=ESTIMATION_EXTENDED_MODE))
         elif self.level == 5:
             from views.level5_sequencing import Level5View
             self.window.show_view(Level5View())
\ No newline at end of file
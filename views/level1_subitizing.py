@@ -1,13 +1,24 @@
 """
 Nivel 1: Subitización
 El jugador debe reconocer rápidamente la cantidad de gemas mostradas brevemente.
+
+La exposición se cuenta en frames dibujados, no en tiempo acumulado: al
+preparar cada intento se calcula cuántos frames duran LEVEL1_EXPOSURE_TIME
+con el refresco medido de la pantalla (60, 120, 144 Hz...). Los instantes
+en que las gemas aparecen y desaparecen se toman en el flip del frame
+correspondiente (on_flip) y se guardan en el intento; el tiempo de
+respuesta se mide desde la desaparición.
 """
 
 import arcade
 import random
-import math
 from constants import *
+from placement import poisson_disk_sample
+from trial_bank import TrialBank
 from views.level_base import LevelBase, Gem, AnswerButton
+from views.gem_batch import GemBatch
+from views import render
+from views.frame_timing import REFRESH_RATE
 
 
 class Level1View(LevelBase):
@@ -15,62 +26,84 @@ class Level1View(LevelBase):
 
     def __init__(self):
         super().__init__(level_number=1)
-        self.display_time = 1.5  # Tiempo que las gemas son visibles (segundos)
-        self.display_timer = 0
+        self.exposure_frames = LEVEL1_EXPOSURE_FRAMES  # Frames con las gemas visibles
+        self.refresh_interval = None  # Refresco medido con que se calcularon
+        self.frames_shown = 0
         self.showing_gems = True
+        self.offset_pending = False  # Falta presentar el primer frame sin gemas
+        self.flip_event = None  # "onset"/"offset" a medir en el próximo flip
         self.correct_count = 0
         self.answered = False
         self.trial_number = 0
+        self.gem_batch = GemBatch()
+        self.trial_bank = TrialBank(
+            self.generate_trial, self.total_trials, self.session_seed(), self.level_number
+        )
         self.setup_trial()
 
-    def setup_trial(self):
-        """Configura un nuevo intento de subitización."""
-        self.trial_number += 1
-        self.showing_gems = True
-        self.display_timer = 0
-        self.answered = False
-        self.state = "playing"
+    def generate_trial(self, rng):
+        """Genera los datos de un intento de subitización.
+
+        Se ejecuta en el hilo del banco de intentos: solo calcula datos,
+        no crea objetos de arcade.
 
+        Args:
+            rng: random.Random del intento (ver seeding.trial_rng).
+
+        Returns:
+            Diccionario con la cantidad correcta, las gemas (x, y, color)
+            y las opciones de respuesta.
+        """
         # Generar cantidad aleatoria (1-6 para subitización)
-        self.correct_count = random.randint(1, 6)
+        correct_count = rng.randint(1, 6)
 
-        # Crear gemas en posiciones aleatorias (área central)
-        self.gems = []
+        # Posiciones aleatorias en el área central
         margin = 120
         area_left = margin + 100
         area_right = SCREEN_WIDTH - margin - 100
         area_bottom = 200
         area_top = SCREEN_HEIGHT - 150
 
-        positions = []
-        for _ in range(self.correct_count):
-            attempts = 0
-            while attempts < 50:
-                x = random.randint(area_left, area_right)
-                y = random.randint(area_bottom, area_top)
-                # Asegurar que no se superpongan
-                too_close = False
-                for px, py in positions:
-                    if math.hypot(x - px, y - py) < GEM_SIZE * 2.5:
-                        too_close = True
-                        break
-                if not too_close:
-                    positions.append((x, y))
-                    break
-                attempts += 1
-            else:
-                positions.append((random.randint(area_left, area_right),
-                                  random.randint(area_bottom, area_top)))
-
-        for x, y in positions:
-            color = random.choice(GEM_COLORS)
+        # Asegurar que no se superpongan
+        positions = poisson_disk_sample(
+            (area_left, area_right, area_bottom, area_top),
+            GEM_SIZE * 2.5,
+            correct_count,
+            rng=rng,
+        )
+
+        return {
+            "correct_count": correct_count,
+            "gems": [(x, y, rng.choice(GEM_COLORS)) for x, y in positions],
+            "options": self.generate_options(correct_count, 1, 6, 4, rng=rng),
+        }
+
+    def setup_trial(self):
+        """Configura un nuevo intento de subitización con el siguiente intento del banco."""
+        trial = self.trial_bank.pop()
+        self.trial_number += 1
+        self.showing_gems = True
+        self.frames_shown = 0
+        self.offset_pending = False
+        self.flip_event = None
+        self.refresh_interval = REFRESH_RATE.interval()
+        self.exposure_frames = self.exposure_frames_for(self.refresh_interval)
+        self.answered = False
+        self.state = "playing"
+
+        self.correct_count = trial["correct_count"]
+
+        # Crear gemas
+        self.gems = []
+        for x, y, color in trial["gems"]:
             gem = Gem(x, y, color, GEM_SIZE_LARGE)
             gem.start_sparkle()
             self.gems.append(gem)
+        self.gem_batch.set_gems(self.gems)
 
         # Crear botones de respuesta
         self.answer_buttons = []
-        options = self.generate_options(self.correct_count, 1, 6, 4)
+        options = trial["options"]
         btn_spacing = 120
         start_x = SCREEN_WIDTH // 2 - (len(options) - 1) * btn_spacing // 2
         for i, opt in enumerate(options):
@@ -89,14 +122,19 @@ class Level1View(LevelBase):
         if tracker:
             tracker.start_trial(self.level_number, self.trial_number, self.correct_count)
 
-    def generate_options(self, correct, min_val, max_val, num_options):
-        """Genera opciones de respuesta incluyendo la correcta."""
+    def generate_options(self, correct, min_val, max_val, num_options, rng=None):
+        """Genera opciones de respuesta incluyendo la correcta.
+
+        Args:
+            rng: Generador aleatorio; por defecto el módulo random.
+        """
+        rng = rng or random
         options = {correct}
         while len(options) < num_options:
-            opt = random.randint(min_val, max_val)
+            opt = rng.randint(min_val, max_val)
             options.add(opt)
         options = list(options)
-        random.shuffle(options)
+        rng.shuffle(options)
         return options
 
     def on_show_view(self):
@@ -106,7 +144,7 @@ class Level1View(LevelBase):
         self.clear()
 
         # Fondo
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
             SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_BACKGROUND
         )
@@ -116,7 +154,7 @@ class Level1View(LevelBase):
 
         # Instrucción
         if self.showing_gems:
-            arcade.draw_text(
+            render.draw_text(
                 "¡Observa las gemas!",
                 SCREEN_WIDTH // 2,
                 SCREEN_HEIGHT - 80,
@@ -126,14 +164,14 @@ class Level1View(LevelBase):
                 bold=True,
             )
             # Barra de tiempo restante
-            time_ratio = max(0, 1 - self.display_timer / self.display_time)
+            time_ratio = max(0, 1 - self.frames_shown / self.exposure_frames)
             bar_width = 300 * time_ratio
-            arcade.draw_rectangle_filled(
+            render.draw_rectangle_filled(
                 SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100,
                 bar_width, 6, COLOR_SECONDARY
             )
         else:
-            arcade.draw_text(
+            render.draw_text(
                 "¿Cuántas gemas había?",
                 SCREEN_WIDTH // 2,
                 SCREEN_HEIGHT - 80,
@@ -143,10 +181,19 @@ class Level1View(LevelBase):
                 bold=True,
             )
 
-        # Dibujar gemas (solo si están visibles)
+        # Dibujar gemas (solo si están visibles) y contar el frame
         if self.showing_gems:
-            for gem in self.gems:
-                gem.draw()
+            self.gem_batch.draw()
+            self.frames_shown += 1
+            if self.frames_shown == 1:
+                self.mark_stimulus("onset")
+            if self.frames_shown >= self.exposure_frames:
+                # El próximo frame ya se dibuja sin gemas
+                self.showing_gems = False
+                self.offset_pending = True
+        elif self.offset_pending:
+            self.offset_pending = False
+            self.mark_stimulus("offset")
 
         # Dibujar botones de respuesta (solo cuando las gemas desaparecen)
         if not self.showing_gems and not self.answered:
@@ -161,17 +208,58 @@ class Level1View(LevelBase):
         for gem in self.gems:
             gem.update(delta_time)
 
-        # Temporizador de visualización
-        if self.showing_gems:
-            self.display_timer += delta_time
-            if self.display_timer >= self.display_time:
-                self.showing_gems = False
+    @staticmethod
+    def exposure_frames_for(refresh_interval):
+        """Frames que duran LEVEL1_EXPOSURE_TIME con el refresco dado.
+
+        Args:
+            refresh_interval: Segundos entre frames, o None si no se conoce.
+        """
+        if not refresh_interval:
+            return LEVEL1_EXPOSURE_FRAMES
+        return max(1, round(LEVEL1_EXPOSURE_TIME / refresh_interval))
+
+    def mark_stimulus(self, event):
+        """Anota la aparición ("onset") o desaparición ("offset") de las gemas.
+
+        El frame que se está dibujando llega a la pantalla en el próximo
+        flip: se guarda ya la hora actual y on_flip la reemplaza por la del
+        flip (si la ventana no avisa de los flips queda la de dibujo).
+        """
+        self.flip_event = event
+        self.record_stimulus_time(event, self.clock().now())
 
-        # Actualizar feedback
-        self.update_feedback(delta_time)
+    def on_flip(self):
+        if self.flip_event is not None:
+            self.record_stimulus_time(self.flip_event, self.clock().now())
+            self.flip_event = None
+
+    def record_stimulus_time(self, event, timestamp):
+        tracker = getattr(self.window, 'tracker', None)
+        if tracker is None:
+            return
+        if event == "onset":
+            tracker.record_stimulus_onset(timestamp)
+        else:
+            tracker.record_stimulus_offset(timestamp, self.frames_shown, self.refresh_interval)
+
+    def accepting_answers(self):
+        """True cuando ya se puede responder.
+
+        Las gemas desaparecieron y la hora de desaparición ya quedó
+        registrada en el intento (ver mark_stimulus). Un clic anterior no
+        tendría desde cuándo medir el tiempo de respuesta, y la hora de
+        desaparición llegaría después de la respuesta. No se espera al
+        flip: en el bucle de pyglet el flip sigue al dibujo sin eventos de
+        por medio, y una ventana que no avisa de los flips nunca lo haría.
+        """
+        if self.showing_gems or self.offset_pending or self.answered:
+            return False
+        tracker = getattr(self.window, 'tracker', None)
+        return tracker is None or tracker.current_trial.stimulus_offset is not None
 
     def on_mouse_motion(self, x, y, dx, dy):
-        if not self.showing_gems and not self.answered:
+        if self.accepting_answers():
             for btn in self.answer_buttons:
                 btn.check_hover(x, y)
 
@@ -179,7 +267,7 @@ class Level1View(LevelBase):
         if self.state == "feedback":
             return
 
-        if not self.showing_gems and not self.answered:
+        if self.accepting_answers():
             for btn in self.answer_buttons:
                 if btn.is_clicked(x, y):
                     self.answered = True
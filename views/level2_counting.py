@@ -5,9 +5,12 @@ El jugador debe contar las gemas visibles sin límite de tiempo.
 
 import arcade
 import random
-import math
 from constants import *
+from placement import poisson_disk_sample
+from trial_bank import TrialBank
 from views.level_base import LevelBase, Gem, AnswerButton
+from views.gem_batch import GemBatch
+from views import render
 
 
 class Level2View(LevelBase):
@@ -19,59 +22,77 @@ class Level2View(LevelBase):
         self.answered = False
         self.gems_clicked = []
         self.trial_number = 0
+        self.gem_batch = GemBatch()
+        self.trial_bank = TrialBank(
+            self.generate_trial, self.total_trials, self.session_seed(), self.level_number
+        )
         self.setup_trial()
 
-    def setup_trial(self):
-        """Configura un nuevo intento de conteo."""
-        self.trial_number += 1
-        self.answered = False
-        self.gems_clicked = []
-        self.state = "playing"
+    def generate_trial(self, rng):
+        """Genera los datos de un intento de conteo.
+
+        Se ejecuta en el hilo del banco de intentos: solo calcula datos,
+        no crea objetos de arcade.
+
+        Args:
+            rng: random.Random del intento (ver seeding.trial_rng).
 
+        Returns:
+            Diccionario con la cantidad correcta, las posiciones de las
+            gemas y las opciones de respuesta.
+        """
         # Cantidades más variadas (5-12)
-        self.correct_count = random.randint(5, 12)
+        correct_count = rng.randint(5, 12)
 
-        # Crear gemas distribuidas
-        self.gems = []
+        # Gemas distribuidas
         margin = 80
         area_left = margin
         area_right = SCREEN_WIDTH - margin
         area_bottom = 180
         area_top = SCREEN_HEIGHT - 120
 
-        positions = []
-        for _ in range(self.correct_count):
-            attempts = 0
-            while attempts < 100:
-                x = random.randint(area_left, area_right)
-                y = random.randint(area_bottom, area_top)
-                too_close = False
-                for px, py in positions:
-                    if math.hypot(x - px, y - py) < GEM_SIZE * 2.2:
-                        too_close = True
-                        break
-                if not too_close:
-                    positions.append((x, y))
-                    break
-                attempts += 1
-            else:
-                positions.append((random.randint(area_left, area_right),
-                                  random.randint(area_bottom, area_top)))
-
-        for i, (x, y) in enumerate(positions):
+        positions = poisson_disk_sample(
+            (area_left, area_right, area_bottom, area_top),
+            GEM_SIZE * 2.2,
+            correct_count,
+            rng=rng,
+        )
+
+        options = self.generate_options(
+            correct_count,
+            max(3, correct_count - 3),
+            min(15, correct_count + 3),
+            4,
+            rng=rng,
+        )
+        return {
+            "correct_count": correct_count,
+            "positions": positions,
+            "options": options,
+        }
+
+    def setup_trial(self):
+        """Configura un nuevo intento de conteo con el siguiente intento del banco."""
+        trial = self.trial_bank.pop()
+        self.trial_number += 1
+        self.answered = False
+        self.gems_clicked = []
+        self.state = "playing"
+
+        self.correct_count = trial["correct_count"]
+
+        # Crear gemas distribuidas
+        self.gems = []
+        for i, (x, y) in enumerate(trial["positions"]):
             color = GEM_COLORS[i % len(GEM_COLORS)]
             gem = Gem(x, y, color, GEM_SIZE)
             gem.start_sparkle()
             self.gems.append(gem)
+        self.gem_batch.set_gems(self.gems)
 
         # Crear botones de respuesta
         self.answer_buttons = []
-        options = self.generate_options(
-            self.correct_count,
-            max(3, self.correct_count - 3),
-            min(15, self.correct_count + 3),
-            4,
-        )
+        options = trial["options"]
         btn_spacing = 120
         start_x = SCREEN_WIDTH // 2 - (len(options) - 1) * btn_spacing // 2
         for i, opt in enumerate(options):
@@ -90,14 +111,19 @@ class Level2View(LevelBase):
         if tracker:
             tracker.start_trial(self.level_number, self.trial_number, self.correct_count)
 
-    def generate_options(self, correct, min_val, max_val, num_options):
-        """Genera opciones de respuesta incluyendo la correcta."""
+    def generate_options(self, correct, min_val, max_val, num_options, rng=None):
+        """Genera opciones de respuesta incluyendo la correcta.
+
+        Args:
+            rng: Generador aleatorio; por defecto el módulo random.
+        """
+        rng = rng or random
         options = {correct}
         while len(options) < num_options:
-            opt = random.randint(min_val, max_val)
+            opt = rng.randint(min_val, max_val)
             options.add(opt)
         options = list(options)
-        random.shuffle(options)
+        rng.shuffle(options)
         return options
 
     def on_show_view(self):
@@ -105,7 +131,7 @@ class Level2View(LevelBase):
 
     def on_draw(self):
         self.clear()
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
             SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_BACKGROUND
         )
@@ -113,7 +139,7 @@ class Level2View(LevelBase):
         self.draw_hud()
 
         # Instrucción
-        arcade.draw_text(
+        render.draw_text(
             "Cuenta todas las gemas y elige el número correcto",
             SCREEN_WIDTH // 2,
             SCREEN_HEIGHT - 80,
@@ -124,7 +150,7 @@ class Level2View(LevelBase):
         )
 
         # Tip: el jugador puede hacer clic en gemas para marcarlas
-        arcade.draw_text(
+        render.draw_text(
             "Haz clic en cada gema para marcarla mientras cuentas",
             SCREEN_WIDTH // 2,
             SCREEN_HEIGHT - 110,
@@ -135,7 +161,7 @@ class Level2View(LevelBase):
 
         # Contador de gemas marcadas
         if self.gems_clicked:
-            arcade.draw_text(
+            render.draw_text(
                 f"Marcadas: {len(self.gems_clicked)}",
                 SCREEN_WIDTH // 2,
                 145,
@@ -146,17 +172,18 @@ class Level2View(LevelBase):
             )
 
         # Dibujar gemas
+        self.gem_batch.draw()
+
+        # Marcas de las gemas ya contadas
         for i, gem in enumerate(self.gems):
-            gem.draw()
-            # Si está marcada, dibujar un check
             if i in self.gems_clicked:
-                arcade.draw_circle_filled(
+                render.draw_circle_filled(
                     gem.x + gem.size * 0.4,
                     gem.y + gem.size * 0.6,
                     10,
                     COLOR_SUCCESS,
                 )
-                arcade.draw_text(
+                render.draw_text(
                     "✓",
                     gem.x + gem.size * 0.4,
                     gem.y + gem.size * 0.6,
@@ -178,7 +205,6 @@ class Level2View(LevelBase):
     def on_update(self, delta_time):
         for gem in self.gems:
             gem.update(delta_time)
-        self.update_feedback(delta_time)
 
     def on_mouse_motion(self, x, y, dx, dy):
         if not self.answered:
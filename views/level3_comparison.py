@@ -5,15 +5,31 @@ El jugador debe identificar cuál de dos grupos tiene más gemas.
 
 import arcade
 import random
-import math
 from constants import *
+from placement import poisson_disk_sample
+from trial_bank import TrialBank
 from views.level_base import LevelBase, Gem, AnswerButton
+from views.gem_batch import GemBatch
+from views import render
+
+
+# Área de cada grupo
+GROUP_WIDTH = SCREEN_WIDTH // 2 - 60
+GROUP_HEIGHT = SCREEN_HEIGHT - 220
+GROUP_CENTER_Y = SCREEN_HEIGHT // 2 - 20
 
 
 class GemGroup:
     """Representa un grupo de gemas para comparación."""
 
-    def __init__(self, center_x, center_y, count, area_width, area_height, color):
+    def __init__(self, center_x, center_y, count, area_width, area_height, color,
+                 positions=None):
+        """Crea el grupo y sus gemas.
+
+        Args:
+            positions: Posiciones (x, y) ya calculadas con generate_positions.
+                Si es None se calculan aquí.
+        """
         self.center_x = center_x
         self.center_y = center_y
         self.count = count
@@ -24,39 +40,38 @@ class GemGroup:
         self.area_height = area_height
         self.border_color = COLOR_PRIMARY
 
-        # Generar posiciones de gemas dentro del área
-        half_w = area_width // 2 - 40
-        half_h = area_height // 2 - 60
-        positions = []
-        for _ in range(count):
-            attempts = 0
-            while attempts < 80:
-                x = center_x + random.randint(-half_w, half_w)
-                y = center_y + random.randint(-half_h, half_h)
-                too_close = False
-                for px, py in positions:
-                    if math.hypot(x - px, y - py) < GEM_SIZE * 2:
-                        too_close = True
-                        break
-                if not too_close:
-                    positions.append((x, y))
-                    break
-                attempts += 1
-            else:
-                positions.append((
-                    center_x + random.randint(-half_w, half_w),
-                    center_y + random.randint(-half_h, half_h),
-                ))
+        if positions is None:
+            positions = self.generate_positions(
+                center_x, center_y, count, area_width, area_height
+            )
 
         for x, y in positions:
             gem = Gem(x, y, color, GEM_SIZE)
             gem.start_sparkle()
             self.gems.append(gem)
+        self.gem_batch = GemBatch(self.gems)
+
+    @staticmethod
+    def generate_positions(center_x, center_y, count, area_width, area_height, rng=None):
+        """Genera posiciones de gemas sin superposición dentro del área del grupo.
+
+        Args:
+            rng: Generador aleatorio; por defecto el módulo random.
+        """
+        half_w = area_width // 2 - 40
+        half_h = area_height // 2 - 60
+        return poisson_disk_sample(
+            (center_x - half_w, center_x + half_w, center_y - half_h, center_y + half_h),
+            GEM_SIZE * 2,
+            count,
+            rng=rng,
+        )
 
     def update(self, delta_time):
         for gem in self.gems:
             gem.update(delta_time)
 
+    @render.counted("GemGroup")
     def draw(self):
         # Fondo del grupo
         if self.state == "correct":
@@ -72,20 +87,19 @@ class GemGroup:
             bg_color = (255, 255, 255, 60)
             self.border_color = COLOR_PRIMARY
 
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             self.center_x, self.center_y,
             self.area_width, self.area_height,
             bg_color,
         )
-        arcade.draw_rectangle_outline(
+        render.draw_rectangle_outline(
             self.center_x, self.center_y,
             self.area_width, self.area_height,
             self.border_color, 3,
         )
 
         # Dibujar gemas
-        for gem in self.gems:
-            gem.draw()
+        self.gem_batch.draw()
 
     def contains_point(self, px, py):
         return (
@@ -108,51 +122,75 @@ class Level3View(LevelBase):
         self.correct_side = ""  # "left" o "right"
         self.answered = False
         self.trial_number = 0
+        self.trial_bank = TrialBank(
+            self.generate_trial, self.total_trials, self.session_seed(), self.level_number
+        )
         self.setup_trial()
 
-    def setup_trial(self):
-        """Configura un nuevo intento de comparación."""
-        self.trial_number += 1
-        self.answered = False
-        self.state = "playing"
+    def generate_trial(self, rng):
+        """Genera los datos de un intento de comparación.
+
+        Se ejecuta en el hilo del banco de intentos: solo calcula datos,
+        no crea objetos de arcade.
+
+        Args:
+            rng: random.Random del intento (ver seeding.trial_rng).
 
+        Returns:
+            Diccionario con los datos de cada grupo (cantidad, color y
+            posiciones) y el lado correcto.
+        """
         # Generar dos cantidades diferentes
-        count_a = random.randint(2, 9)
-        count_b = random.randint(2, 9)
+        count_a = rng.randint(2, 9)
+        count_b = rng.randint(2, 9)
         while count_a == count_b:
-            count_b = random.randint(2, 9)
+            count_b = rng.randint(2, 9)
+
+        color_left = rng.choice(GEM_COLORS)
+        color_right = rng.choice(GEM_COLORS)
+        while color_right == color_left:
+            color_right = rng.choice(GEM_COLORS)
 
         # Decidir posiciones
-        group_width = SCREEN_WIDTH // 2 - 60
-        group_height = SCREEN_HEIGHT - 220
+        groups = {}
+        for side, center_x, count, color in (
+            ("left", SCREEN_WIDTH // 4, count_a, color_left),
+            ("right", 3 * SCREEN_WIDTH // 4, count_b, color_right),
+        ):
+            groups[side] = {
+                "center_x": center_x,
+                "count": count,
+                "color": color,
+                "positions": GemGroup.generate_positions(
+                    center_x, GROUP_CENTER_Y, count, GROUP_WIDTH, GROUP_HEIGHT, rng=rng
+                ),
+            }
+
+        return {
+            "groups": groups,
+            "correct_side": "left" if count_a > count_b else "right",
+        }
 
-        color_left = random.choice(GEM_COLORS)
-        color_right = random.choice(GEM_COLORS)
-        while color_right == color_left:
-            color_right = random.choice(GEM_COLORS)
-
-        self.group_left = GemGroup(
-            center_x=SCREEN_WIDTH // 4,
-            center_y=SCREEN_HEIGHT // 2 - 20,
-            count=count_a,
-            area_width=group_width,
-            area_height=group_height,
-            color=color_left,
-        )
+    def setup_trial(self):
+        """Configura un nuevo intento de comparación con el siguiente intento del banco."""
+        trial = self.trial_bank.pop()
+        self.trial_number += 1
+        self.answered = False
+        self.state = "playing"
 
-        self.group_right = GemGroup(
-            center_x=3 * SCREEN_WIDTH // 4,
-            center_y=SCREEN_HEIGHT // 2 - 20,
-            count=count_b,
-            area_width=group_width,
-            area_height=group_height,
-            color=color_right,
+        self.group_left, self.group_right = (
+            GemGroup(
+                center_x=group["center_x"],
+                center_y=GROUP_CENTER_Y,
+                count=group["count"],
+                area_width=GROUP_WIDTH,
+                area_height=GROUP_HEIGHT,
+                color=group["color"],
+                positions=group["positions"],
+            )
+            for group in (trial["groups"]["left"], trial["groups"]["right"])
         )
-
-        if count_a > count_b:
-            self.correct_side = "left"
-        else:
-            self.correct_side = "right"
+        self.correct_side = trial["correct_side"]
 
         # Registro de datos
         tracker = getattr(self.window, 'tracker', None)
@@ -168,7 +206,7 @@ class Level3View(LevelBase):
 
     def on_draw(self):
         self.clear()
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
             SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_BACKGROUND
         )
@@ -176,7 +214,7 @@ class Level3View(LevelBase):
         self.draw_hud()
 
         # Instrucción
-        arcade.draw_text(
+        render.draw_text(
             "¿Qué grupo tiene MÁS gemas? ¡Haz clic en él!",
             SCREEN_WIDTH // 2,
             SCREEN_HEIGHT - 80,
@@ -187,7 +225,7 @@ class Level3View(LevelBase):
         )
 
         # Etiquetas
-        arcade.draw_text(
+        render.draw_text(
             "Grupo A",
             SCREEN_WIDTH // 4,
             SCREEN_HEIGHT - 110,
@@ -196,7 +234,7 @@ class Level3View(LevelBase):
             anchor_x="center",
             bold=True,
         )
-        arcade.draw_text(
+        render.draw_text(
             "Grupo B",
             3 * SCREEN_WIDTH // 4,
             SCREEN_HEIGHT - 110,
@@ -207,12 +245,12 @@ class Level3View(LevelBase):
         )
 
         # Separador central
-        arcade.draw_line(
+        render.draw_line(
             SCREEN_WIDTH // 2, 80,
             SCREEN_WIDTH // 2, SCREEN_HEIGHT - 130,
             (200, 200, 220), 2,
         )
-        arcade.draw_text(
+        render.draw_text(
             "VS",
             SCREEN_WIDTH // 2,
             SCREEN_HEIGHT // 2,
@@ -237,7 +275,6 @@ class Level3View(LevelBase):
             self.group_left.update(delta_time)
         if self.group_right:
             self.group_right.update(delta_time)
-        self.update_feedback(delta_time)
 
     def on_mouse_motion(self, x, y, dx, dy):
         if not self.answered:
@@ -7,80 +7,261 @@ import arcade
 import random
 import math
 from constants import *
+from trial_bank import TrialBank
+from scoring import within_tolerance
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy es opcional: sin él GemField avanza las gemas sobre listas
+    np = None
 from views.level_base import LevelBase, Gem, AnswerButton
+from views.gem_batch import GemBatch
+from views import render
+
+
+# Área donde se mueven las gemas: (izquierda, derecha, abajo, arriba)
+FIELD_BOUNDS = (80, SCREEN_WIDTH - 80, 160, SCREEN_HEIGHT - 120)
 
 
 class MovingGem(Gem):
-    """Gema que se mueve por la pantalla para dificultar el conteo exacto."""
+    """Gema de Nivel 4 con velocidad propia.
+
+    Solo guarda el estado inicial del movimiento; la que la mueve es
+    GemField, que avanza todas las gemas del campo a la vez.
+    """
 
-    def __init__(self, x, y, color, size, speed_x, speed_y, bounds):
+    def __init__(self, x, y, color, size, speed_x, speed_y):
         super().__init__(x, y, color, size)
         self.speed_x = speed_x
         self.speed_y = speed_y
-        self.bounds = bounds  # (left, right, bottom, top)
 
-    def update(self, delta_time):
-        super().update(delta_time)
-        # Movimiento
-        self.x += self.speed_x * delta_time
-        self.base_y += self.speed_y * delta_time
-        self.y = self.base_y + math.sin(self.time * GEM_FLOAT_SPEED + self.phase) * 5
 
-        # Rebotar en los bordes
-        left, right, bottom, top = self.bounds
-        if self.x < left or self.x > right:
-            self.speed_x *= -1
-            self.x = max(left, min(right, self.x))
-        if self.base_y < bottom or self.base_y > top:
-            self.speed_y *= -1
-            self.base_y = max(bottom, min(top, self.base_y))
+class GemField:
+    """Estado de movimiento de todas las gemas de Nivel 4 como arreglos.
+
+    Guarda x, base_y, velocidades, fase y tiempo de cada gema en arreglos
+    (estructura de arreglos) y los avanza con step_gem_arrays. Las gemas
+    solo se usan para dibujar: después de cada paso se copian sus
+    posiciones a ellas y a sus sprites.
+    """
+
+    def __init__(self, gems, bounds, use_numpy=True):
+        """Crea el campo a partir de gemas en movimiento.
+
+        Args:
+            gems: Lista de MovingGem con su posición y velocidad inicial.
+            bounds: Límites (izquierda, derecha, abajo, arriba) del rebote.
+            use_numpy: False para usar listas aunque NumPy esté instalado
+                (pruebas y mediciones del camino sin NumPy).
+        """
+        self.gems = list(gems)
+        self.bounds = bounds
+        self.use_numpy = use_numpy and np is not None
+        self.x = self._array([g.x for g in self.gems])
+        self.base_y = self._array([g.base_y for g in self.gems])
+        self.y = self._array([g.y for g in self.gems])
+        self.vx = self._array([g.speed_x for g in self.gems])
+        self.vy = self._array([g.speed_y for g in self.gems])
+        self.phase = self._array([g.phase for g in self.gems])
+        self.time = self._array([g.time for g in self.gems])
+
+    def _array(self, values):
+        """Convierte una lista a arreglo de floats (o lista sin NumPy)."""
+        if self.use_numpy:
+            return np.array(values, dtype=np.float64)
+        return [float(v) for v in values]
+
+    def step(self, delta_time):
+        """Avanza todas las gemas: integración, flotación y rebote en bordes.
+
+        Args:
+            delta_time: Tiempo transcurrido desde el último frame.
+        """
+        step_gem_arrays(
+            self.x, self.base_y, self.y, self.vx, self.vy,
+            self.phase, self.time, self.bounds, delta_time,
+        )
+        self.sync()
+
+    def sync(self):
+        """Copia las posiciones calculadas a las gemas y sus sprites."""
+        xs = self.x.tolist() if self.use_numpy else self.x
+        ys = self.y.tolist() if self.use_numpy else self.y
+        for gem, x, y in zip(self.gems, xs, ys):
+            gem.x = x
+            gem.y = y
+            gem.sprite.position = (x, y)
+
+
+def step_gem_arrays(x, base_y, y, vx, vy, phase, time, bounds, delta_time):
+    """Paso de todas las gemas en movimiento (modifica los arreglos).
+
+    Es la única definición del movimiento de Nivel 4. Acepta arreglos de
+    NumPy o, sin NumPy, listas de floats: en los dos casos hace las mismas
+    operaciones en el mismo orden, columna por columna.
+
+    Args:
+        x, base_y, y: Posición horizontal, altura base y altura con flotación.
+        vx, vy: Velocidades en píxeles por segundo.
+        phase, time: Fase y tiempo acumulado de la flotación.
+        bounds: Límites (izquierda, derecha, abajo, arriba).
+        delta_time: Tiempo transcurrido desde el último frame.
+    """
+    left, right, bottom, top = bounds
+
+    if np is not None and isinstance(x, np.ndarray):
+        # Integración
+        time += delta_time
+        x += vx * delta_time
+        base_y += vy * delta_time
+        np.sin(time * GEM_FLOAT_SPEED + phase, out=y)
+        y *= 5
+        y += base_y
+
+        # Rebote en los bordes
+        out_x = (x < left) | (x > right)
+        vx[out_x] *= -1
+        np.clip(x, left, right, out=x)
+        out_y = (base_y < bottom) | (base_y > top)
+        vy[out_y] *= -1
+        np.clip(base_y, bottom, top, out=base_y)
+        return
+
+    # Integración
+    time[:] = [t + delta_time for t in time]
+    x[:] = [p + v * delta_time for p, v in zip(x, vx)]
+    base_y[:] = [p + v * delta_time for p, v in zip(base_y, vy)]
+    y[:] = [
+        math.sin(t * GEM_FLOAT_SPEED + f) * 5 + b
+        for t, f, b in zip(time, phase, base_y)
+    ]
+
+    # Rebote en los bordes
+    vx[:] = [-v if p < left or p > right else v for p, v in zip(x, vx)]
+    x[:] = [min(max(p, left), right) for p in x]
+    vy[:] = [-v if p < bottom or p > top else v for p, v in zip(base_y, vy)]
+    base_y[:] = [min(max(p, bottom), top) for p in base_y]
 
 
 class Level4View(LevelBase):
-    """Nivel de estimación: estimar cantidad de gemas en movimiento."""
+    """Nivel de estimación: estimar cantidad de gemas en movimiento.
 
-    def __init__(self):
+    En modo extendido se muestran entre ESTIMATION_EXTENDED_MIN y
+    ESTIMATION_EXTENDED_MAX gemas. Para mantener 60 fps sin GPU dedicada
+    esas gemas no tienen destellos (un solo sprite por gema), se mueven
+    con el paso vectorizado de GemField y se dibujan en una sola llamada;
+    el máximo sale del costo medido de ese dibujo (ver constants.py y el
+    benchmark level4_extended_frame).
+    """
+
+    def __init__(self, extended=False):
+        """Inicializa el nivel.
+
+        Args:
+            extended: True para el modo de estimación con muchas gemas (hasta
+                ESTIMATION_EXTENDED_MAX).
+        """
         super().__init__(level_number=4)
+        self.extended = extended
         self.correct_count = 0
         self.answered = False
         self.moving_gems = []
+        self.gem_field = None
         self.trial_number = 0
+        self.gem_batch = GemBatch()
+        self.trial_bank = TrialBank(
+            self.generate_trial, self.total_trials, self.session_seed(), self.level_number
+        )
         self.setup_trial()
 
-    def setup_trial(self):
-        """Configura un nuevo intento de estimación."""
+    def generate_trial(self, rng):
+        """Genera los datos de un intento de estimación.
+
+        Se ejecuta en el hilo del banco de intentos: solo calcula datos,
+        no crea objetos de arcade.
+
+        Args:
+            rng: random.Random del intento (ver seeding.trial_rng).
+
+        Returns:
+            Diccionario con la cantidad correcta, el tamaño de gema, las
+            gemas (x, y, color, velocidad x, velocidad y) y las opciones.
+        """
+        if self.extended:
+            # Distribución logarítmica: igual cantidad de intentos por orden de magnitud
+            correct_count = int(round(math.exp(rng.uniform(
+                math.log(ESTIMATION_EXTENDED_MIN), math.log(ESTIMATION_EXTENDED_MAX)
+            ))))
+        else:
+            # Cantidades grandes (10-25) para que sea difícil contar exactamente
+            correct_count = rng.randint(10, 25)
+        return self.generate_trial_for(correct_count, rng)
+
+    def generate_trial_for(self, correct_count, rng):
+        """Genera las gemas y las opciones de un intento con `correct_count` gemas.
+
+        Args:
+            correct_count: Cantidad real de gemas.
+            rng: random.Random del intento.
+
+        Returns:
+            Diccionario de intento como el de generate_trial.
+        """
+        left, right, bottom, top = FIELD_BOUNDS
+        gems = []
+        for _ in range(correct_count):
+            x = rng.randint(left, right)
+            y = rng.randint(bottom, top)
+            color = rng.choice(GEM_COLORS)
+            speed_x = rng.uniform(-80, 80)
+            speed_y = rng.uniform(-60, 60)
+            gems.append((x, y, color, speed_x, speed_y))
+
+        return {
+            "correct_count": correct_count,
+            "gem_size": self.gem_size_for(correct_count),
+            "gems": gems,
+            "options": self.generate_estimation_options(
+                correct_count, scale=self.deviation_scale(correct_count), rng=rng
+            ),
+        }
+
+    def setup_trial(self, trial=None):
+        """Configura un nuevo intento de estimación.
+
+        Args:
+            trial: Datos del intento (ver generate_trial); por defecto el
+                siguiente intento del banco.
+        """
+        if trial is None:
+            trial = self.trial_bank.pop()
         self.trial_number += 1
         self.answered = False
         self.state = "playing"
 
-        # Cantidades grandes (10-25) para que sea difícil contar exactamente
-        self.correct_count = random.randint(10, 25)
+        self.correct_count = trial["correct_count"]
 
         # Crear gemas en movimiento
         self.moving_gems = []
-        margin = 80
-        bounds = (margin, SCREEN_WIDTH - margin, 160, SCREEN_HEIGHT - 120)
-
-        for _ in range(self.correct_count):
-            x = random.randint(bounds[0], bounds[1])
-            y = random.randint(bounds[2], bounds[3])
-            color = random.choice(GEM_COLORS)
-            speed_x = random.uniform(-80, 80)
-            speed_y = random.uniform(-60, 60)
-            gem = MovingGem(x, y, color, GEM_SIZE_SMALL, speed_x, speed_y, bounds)
-            gem.start_sparkle()
+        for x, y, color, speed_x, speed_y in trial["gems"]:
+            gem = MovingGem(x, y, color, trial["gem_size"], speed_x, speed_y)
+            if not self.extended:
+                gem.start_sparkle()
             self.moving_gems.append(gem)
+        self.gem_field = GemField(self.moving_gems, FIELD_BOUNDS)
+        self.gem_batch.set_gems(self.moving_gems)
 
         # Crear opciones de respuesta (estimaciones)
         self.answer_buttons = []
-        options = self.generate_estimation_options(self.correct_count)
-        btn_spacing = 120
+        options = trial["options"]
+        btn_spacing = 150 if self.extended else 120
         start_x = SCREEN_WIDTH // 2 - (len(options) - 1) * btn_spacing // 2
         for i, opt in enumerate(options):
             btn = AnswerButton(
                 x=start_x + i * btn_spacing,
                 y=80,
-                width=80,
+                width=120 if self.extended else 80,
                 height=60,
                 text=str(opt),
                 value=opt,
@@ -92,41 +273,91 @@ class Level4View(LevelBase):
         if tracker:
             tracker.start_trial(self.level_number, self.trial_number, self.correct_count)
 
-    def generate_estimation_options(self, correct):
-        """Genera opciones de estimación con rangos variados."""
+    def gem_size_for(self, count):
+        """Tamaño de gema según la cantidad, para que quepan en el área de juego.
+
+        Args:
+            count: Número de gemas del intento.
+
+        Returns:
+            GEM_SIZE_SMALL en modo normal; en modo extendido un tamaño que
+            baja con la raíz de la cantidad y que no pasa del que permite el
+            presupuesto de dibujo (ver constants.py), con un mínimo de
+            ESTIMATION_GEM_MIN_SIZE píxeles.
+        """
+        if not self.extended:
+            return GEM_SIZE_SMALL
+        scaled = GEM_SIZE_SMALL * math.sqrt(ESTIMATION_EXTENDED_MIN / count)
+        # Tiempo de dibujo disponible por gema, menos su costo fijo: el resto es área
+        per_gem = (ESTIMATION_GEM_DRAW_BUDGET - ESTIMATION_GEM_DRAW_BASE) / count
+        area = max(0.0, per_gem - ESTIMATION_GEM_DRAW_COST) / ESTIMATION_GEM_PIXEL_COST
+        size = min(GEM_SIZE_SMALL, round(scaled), int(math.sqrt(area)))
+        return max(ESTIMATION_GEM_MIN_SIZE, size)
+
+    def deviation_scale(self, count):
+        """Factor de escala de las desviaciones de las opciones.
+
+        En modo normal es 1 (desviaciones fijas de ±4 y ±8). En modo
+        extendido las desviaciones son proporcionales a la cantidad real.
+
+        Args:
+            count: Cantidad real de gemas del intento.
+        """
+        if not self.extended:
+            return 1.0
+        return count / ESTIMATION_REFERENCE_COUNT
+
+    def tolerance(self):
+        """Distancia máxima a la cantidad real para contar la respuesta como cercana."""
+        return max(2, round(2 * self.deviation_scale(self.correct_count)))
+
+    def scoring(self):
+        """Cuenta como correcta una estimación a tolerance() o menos de la cantidad real."""
+        return within_tolerance(self.tolerance())
+
+    def generate_estimation_options(self, correct, scale=1.0, rng=None):
+        """Genera opciones de estimación con rangos variados.
+
+        Args:
+            correct: Cantidad real de gemas.
+            scale: Factor que multiplica las desviaciones base (±4, ±8)
+                y el rango de relleno (±10).
+            rng: Generador aleatorio; por defecto el módulo random.
+        """
+        rng = rng or random
         options = [correct]
         # Agregar opciones a diferentes distancias
-        deviations = [-8, -4, 4, 8]
-        random.shuffle(deviations)
+        deviations = [round(dev * scale) for dev in (-8, -4, 4, 8)]
+        rng.shuffle(deviations)
         for dev in deviations[:3]:
             val = max(3, correct + dev)
             if val not in options:
                 options.append(val)
 
         # Si no tenemos suficientes opciones, agregar más
+        spread = round(10 * scale)
         while len(options) < 4:
-            val = random.randint(max(3, correct - 10), correct + 10)
+            val = rng.randint(max(3, correct - spread), correct + spread)
             if val not in options:
                 options.append(val)
 
         options = options[:4]
-        random.shuffle(options)
+        rng.shuffle(options)
         return options
 
     def on_show_view(self):
         arcade.set_background_color(COLOR_BACKGROUND)
 
     def on_draw(self):
+        # clear ya pinta el fondo (COLOR_BACKGROUND, ver on_show_view); un
+        # rectángulo de pantalla completa encima costaba casi un frame entero
+        # en el rasterizador por software
         self.clear()
-        arcade.draw_rectangle_filled(
-            SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
-            SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_BACKGROUND
-        )
 
         self.draw_hud()
 
         # Instrucción
-        arcade.draw_text(
+        render.draw_text(
             "¿Aproximadamente cuántas gemas hay? ¡No necesitas ser exacto!",
             SCREEN_WIDTH // 2,
             SCREEN_HEIGHT - 80,
@@ -137,15 +368,14 @@ class Level4View(LevelBase):
         )
 
         # Área de gemas
-        arcade.draw_rectangle_outline(
+        render.draw_rectangle_outline(
             SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20,
             SCREEN_WIDTH - 100, SCREEN_HEIGHT - 280,
             (200, 200, 220, 100), 2,
         )
 
-        # Dibujar gemas en movimiento
-        for gem in self.moving_gems:
-            gem.draw()
+        # Dibujar gemas en movimiento (una sola llamada)
+        self.gem_batch.draw()
 
         # Botones de respuesta
         if not self.answered:
@@ -156,9 +386,8 @@ class Level4View(LevelBase):
         self.draw_feedback()
 
     def on_update(self, delta_time):
-        for gem in self.moving_gems:
-            gem.update(delta_time)
-        self.update_feedback(delta_time)
+        # Todas las gemas avanzan en un solo paso vectorizado
+        self.gem_field.step(delta_time)
 
     def on_mouse_motion(self, x, y, dx, dy):
         if not self.answered:
@@ -169,7 +398,8 @@ class Level4View(LevelBase):
         """Maneja la selección de una respuesta de estimación.
         
         Para estimación, se acepta como correcta cualquier respuesta
-        dentro de un rango de +/- 2 del valor real.
+        dentro de un rango de +/- 2 del valor real (en modo extendido el
+        rango crece en proporción a la cantidad, ver tolerance).
         
         Args:
             x, y: Posición del clic.
@@ -184,25 +414,19 @@ class Level4View(LevelBase):
                 self.answered = True
                 answer = btn.value
 
-                # Verificar si es exacta o cercana (+/- 2)
-                is_close = abs(answer - self.correct_count) <= 2
+                # Verificar si es exacta o cercana (+/- 2 en modo normal)
+                scoring = self.scoring()
+                is_close = scoring(answer, self.correct_count)
                 is_exact = answer == self.correct_count
 
                 # Registrar datos en el tracker
                 tracker = getattr(self.window, 'tracker', None)
                 if tracker:
-                    tracker.current_trial.is_correct = is_close
-                    tracker.current_trial.player_answer = answer
-                    tracker.current_trial.end_time = __import__('time').time()
-                    tracker.current_trial.response_time = (
-                        tracker.current_trial.end_time - tracker.current_trial.start_time
-                    )
-                    tracker.current_trial.attempts = 1
-                    tracker.level_data[self.level_number].append(tracker.current_trial)
+                    tracker.record_answer(answer, scoring)
 
                 # Configurar feedback visual
                 self.state = "feedback"
-                self.feedback_timer = 0
+                self.start_feedback_timer()
                 self.feedback_text_line2 = ""
 
                 if is_exact:
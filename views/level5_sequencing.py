@@ -7,13 +7,16 @@ import arcade
 import random
 import math
 from constants import *
+from trial_bank import TrialBank
+from scoring import sequence_match
 from views.level_base import LevelBase
+from views import render
 
 
 class NumberCard:
     """Tarjeta con un número para secuenciación."""
 
-    def __init__(self, x, y, number, width=90, height=90):
+    def __init__(self, x, y, number, width=90, height=90, color=None):
         self.x = x
         self.y = y
         self.base_y = y
@@ -25,13 +28,14 @@ class NumberCard:
         self.is_hovered = False
         self.time = 0
         self.phase = random.uniform(0, math.pi * 2)
-        self.color = random.choice(GEM_COLORS)
+        self.color = color if color is not None else random.choice(GEM_COLORS)
 
     def update(self, delta_time):
         self.time += delta_time
         if self.state == "available":
             self.y = self.base_y + math.sin(self.time * 1.5 + self.phase) * 3
 
+    @render.counted("NumberCard")
     def draw(self):
         if self.state == "selected":
             bg_color = COLOR_SECONDARY
@@ -54,12 +58,12 @@ class NumberCard:
         h = self.height * scale
 
         # Sombra
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             self.x + 3, self.y - 3, w, h, (0, 0, 0, 30)
         )
         # Tarjeta
-        arcade.draw_rectangle_filled(self.x, self.y, w, h, bg_color)
-        arcade.draw_rectangle_outline(self.x, self.y, w, h, border_color, 3)
+        render.draw_rectangle_filled(self.x, self.y, w, h, bg_color)
+        render.draw_rectangle_outline(self.x, self.y, w, h, border_color, 3)
 
         # Pequeña gema decorativa en la esquina superior
         gem_x = self.x - w * 0.3
@@ -71,11 +75,11 @@ class NumberCard:
             (gem_x, gem_y - gem_size * 0.3),
             (gem_x - gem_size * 0.5, gem_y),
         ]
-        arcade.draw_polygon_filled(gem_points, self.color)
+        render.draw_polygon_filled(gem_points, self.color)
 
         # Número
         text_color = COLOR_TEXT_LIGHT if self.state in ("selected", "correct", "incorrect") else COLOR_TEXT_DARK
-        arcade.draw_text(
+        render.draw_text(
             str(self.number),
             self.x,
             self.y - 5,
@@ -88,10 +92,10 @@ class NumberCard:
 
         # Orden de selección
         if self.state == "selected" and self.order_selected > 0:
-            arcade.draw_circle_filled(
+            render.draw_circle_filled(
                 self.x + w * 0.35, self.y + h * 0.35, 14, COLOR_PRIMARY
             )
-            arcade.draw_text(
+            render.draw_text(
                 str(self.order_selected),
                 self.x + w * 0.35,
                 self.y + h * 0.35,
@@ -136,26 +140,32 @@ class Level5View(LevelBase):
         self.reset_btn_w = 160
         self.reset_btn_h = 40
 
+        self.trial_bank = TrialBank(
+            self.generate_trial, self.total_trials, self.session_seed(), self.level_number
+        )
         self.setup_trial()
 
-    def setup_trial(self):
-        """Configura un nuevo intento de secuenciación."""
-        self.trial_number += 1
-        self.answered = False
-        self.player_sequence = []
-        self.selection_order = 0
-        self.state = "playing"
+    def generate_trial(self, rng):
+        """Genera los datos de un intento de secuenciación.
+
+        Se ejecuta en el hilo del banco de intentos: solo calcula datos,
+        no crea objetos de arcade.
+
+        Args:
+            rng: random.Random del intento (ver seeding.trial_rng).
 
+        Returns:
+            Diccionario con la secuencia correcta y las tarjetas
+            (x, y, número, color) en orden desordenado.
+        """
         # Generar números aleatorios (4-6 números)
-        num_cards = random.randint(4, 6)
-        numbers = random.sample(range(1, 20), num_cards)
-        self.correct_sequence = sorted(numbers)
+        num_cards = rng.randint(4, 6)
+        numbers = rng.sample(range(1, 20), num_cards)
 
-        # Crear tarjetas desordenadas
+        # Tarjetas desordenadas
         shuffled = numbers[:]
-        random.shuffle(shuffled)
+        rng.shuffle(shuffled)
 
-        self.cards = []
         cols = min(num_cards, 4)
         rows = math.ceil(num_cards / cols)
         card_spacing_x = 130
@@ -163,13 +173,36 @@ class Level5View(LevelBase):
         start_x = SCREEN_WIDTH // 2 - (cols - 1) * card_spacing_x // 2
         start_y = SCREEN_HEIGHT // 2 + (rows - 1) * card_spacing_y // 2 - 20
 
+        cards = []
         for i, num in enumerate(shuffled):
             col = i % cols
             row = i // cols
             x = start_x + col * card_spacing_x
             y = start_y - row * card_spacing_y
-            card = NumberCard(x, y, num)
-            self.cards.append(card)
+            cards.append((x, y, num, rng.choice(GEM_COLORS)))
+
+        return {
+            "correct_sequence": sorted(numbers),
+            "cards": cards,
+        }
+
+    def scoring(self):
+        """La secuencia es correcta solo si tiene el mismo orden que la correcta."""
+        return sequence_match
+
+    def setup_trial(self):
+        """Configura un nuevo intento de secuenciación con el siguiente intento del banco."""
+        trial = self.trial_bank.pop()
+        self.trial_number += 1
+        self.answered = False
+        self.player_sequence = []
+        self.selection_order = 0
+        self.state = "playing"
+
+        self.correct_sequence = trial["correct_sequence"]
+        self.cards = [
+            NumberCard(x, y, num, color=color) for x, y, num, color in trial["cards"]
+        ]
 
         # Registro de datos
         tracker = getattr(self.window, 'tracker', None)
@@ -185,7 +218,7 @@ class Level5View(LevelBase):
 
     def on_draw(self):
         self.clear()
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
             SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_BACKGROUND
         )
@@ -193,7 +226,7 @@ class Level5View(LevelBase):
         self.draw_hud()
 
         # Instrucción
-        arcade.draw_text(
+        render.draw_text(
             "Haz clic en los números en orden: del MENOR al MAYOR",
             SCREEN_WIDTH // 2,
             SCREEN_HEIGHT - 80,
@@ -206,7 +239,7 @@ class Level5View(LevelBase):
         # Mostrar secuencia seleccionada
         if self.player_sequence:
             seq_text = " -> ".join(str(n) for n in self.player_sequence)
-            arcade.draw_text(
+            render.draw_text(
                 f"Tu orden: {seq_text}",
                 SCREEN_WIDTH // 2,
                 SCREEN_HEIGHT - 115,
@@ -225,15 +258,15 @@ class Level5View(LevelBase):
             pulse = math.sin(self.transition_timer * 4) * 0.05 + 1.0
             btn_w = int(self.confirm_btn_w * pulse)
             btn_h = int(self.confirm_btn_h * pulse)
-            arcade.draw_rectangle_filled(
+            render.draw_rectangle_filled(
                 self.confirm_btn_x, self.confirm_btn_y,
                 btn_w, btn_h, COLOR_SUCCESS
             )
-            arcade.draw_rectangle_outline(
+            render.draw_rectangle_outline(
                 self.confirm_btn_x, self.confirm_btn_y,
                 btn_w, btn_h, (255, 255, 255, 150), 2
             )
-            arcade.draw_text(
+            render.draw_text(
                 "Confirmar",
                 self.confirm_btn_x,
                 self.confirm_btn_y,
@@ -246,11 +279,11 @@ class Level5View(LevelBase):
 
         # Botón de reiniciar
         if self.player_sequence and not self.answered:
-            arcade.draw_rectangle_filled(
+            render.draw_rectangle_filled(
                 self.reset_btn_x, self.reset_btn_y,
                 self.reset_btn_w, self.reset_btn_h, COLOR_ERROR
             )
-            arcade.draw_text(
+            render.draw_text(
                 "Reiniciar",
                 self.reset_btn_x,
                 self.reset_btn_y,
@@ -268,7 +301,6 @@ class Level5View(LevelBase):
         self.transition_timer += delta_time
         for card in self.cards:
             card.update(delta_time)
-        self.update_feedback(delta_time)
 
     def on_mouse_motion(self, x, y, dx, dy):
         if not self.answered:
@@ -320,19 +352,12 @@ class Level5View(LevelBase):
         muestra el feedback con sonido.
         """
         self.answered = True
-        is_correct = self.player_sequence == self.correct_sequence
+        is_correct = self.scoring()(self.player_sequence, self.correct_sequence)
 
         # Registrar respuesta en el tracker
         tracker = getattr(self.window, 'tracker', None)
         if tracker:
-            tracker.current_trial.player_answer = self.player_sequence
-            tracker.current_trial.is_correct = is_correct
-            tracker.current_trial.end_time = __import__('time').time()
-            tracker.current_trial.response_time = (
-                tracker.current_trial.end_time - tracker.current_trial.start_time
-            )
-            tracker.current_trial.attempts = 1
-            tracker.level_data[self.level_number].append(tracker.current_trial)
+            tracker.record_answer(list(self.player_sequence), self.scoring())
 
         # Marcar tarjetas según si están en la posición correcta
         for card in self.cards:
@@ -344,7 +369,7 @@ class Level5View(LevelBase):
 
         # Configurar feedback visual
         self.state = "feedback"
-        self.feedback_timer = 0
+        self.start_feedback_timer()
         if is_correct:
             self.feedback_text = "¡Correcto! ¡Muy bien!"
             self.feedback_text_line2 = ""
@@ -7,6 +7,12 @@ import arcade
 import math
 import os
 from constants import *
+from seeding import new_session_seed
+from clock import get_clock
+from scoring import exact_match
+from views.gem_atlas import get_gem_texture, get_sparkle_texture, SPARKLE_RADII
+from views import render
+from views.frame_timing import TimedView
 
 
 # --- Cargar sonidos una sola vez a nivel de módulo ---
@@ -45,7 +51,11 @@ load_game_sounds()
 
 
 class Gem:
-    """Representa una gema visual en el juego."""
+    """Representa una gema visual en el juego.
+
+    La gema se dibuja con sprites cuyas texturas vienen del atlas de gemas
+    (views/gem_atlas.py): el cuerpo con su sombra y brillo, y dos destellos.
+    """
 
     def __init__(self, x, y, color, size=GEM_SIZE):
         """Inicializa una gema con posición, color y tamaño.
@@ -68,6 +78,16 @@ class Gem:
         self.sparkle_time = 0
         self.is_sparkling = False
 
+        # Sprites: cuerpo de la gema; los dos destellos se crean en
+        # start_sparkle (las gemas que no destellan no los necesitan)
+        texture, texture_scale = get_gem_texture(color, size)
+        self.sprite = arcade.Sprite(
+            texture=texture, scale=texture_scale * self.scale, center_x=x, center_y=y
+        )
+        self.sprite.alpha = self.alpha
+        self.sparkle_sprites = []
+        self.sprites = [self.sprite]
+
     def update(self, delta_time):
         """Actualiza la animación de flotación de la gema.
         
@@ -76,61 +96,49 @@ class Gem:
         """
         self.time += delta_time
         self.y = self.base_y + math.sin(self.time * GEM_FLOAT_SPEED + self.phase) * 5
+        self.sprite.center_y = self.y
+
+    def update_sparkles(self):
+        """Mueve los destellos junto a la gema y avanza su animación un frame."""
+        actual_size = self.size * self.scale
+        sparkle_alpha = self.next_sparkle_alpha()
+        offsets = ((0.3, 0.5), (-0.2, 0.3))
+        for sparkle, (ox, oy) in zip(self.sparkle_sprites, offsets):
+            sparkle.position = (self.x + actual_size * ox, self.y + actual_size * oy)
+            sparkle.alpha = sparkle_alpha
 
+    @render.counted("Gem")
     def draw(self):
-        """Dibuja la gema como un polígono en forma de diamante con efectos."""
+        """Dibuja la gema por sí sola. Para varias gemas es mejor usar GemBatch."""
         if not self.visible:
             return
 
-        actual_size = self.size * self.scale
+        if self.is_sparkling:
+            self.update_sparkles()
+        for sprite in self.sprites:
+            render.draw_sprite(sprite)
 
-        # Sombra debajo de la gema
-        arcade.draw_ellipse_filled(
-            self.x + 2, self.y - actual_size * 0.5,
-            actual_size * 0.8, actual_size * 0.2,
-            (0, 0, 0, 30)
-        )
+    def next_sparkle_alpha(self):
+        """Avanza la animación de destello un frame y devuelve su transparencia.
 
-        # Cuerpo de la gema (forma de diamante)
-        points = [
-            (self.x, self.y + actual_size),
-            (self.x + actual_size * 0.6, self.y),
-            (self.x, self.y - actual_size * 0.4),
-            (self.x - actual_size * 0.6, self.y),
-        ]
-        arcade.draw_polygon_filled(points, (*self.color, self.alpha))
-
-        # Brillo superior para dar profundidad
-        highlight = (
-            min(255, self.color[0] + 100),
-            min(255, self.color[1] + 100),
-            min(255, self.color[2] + 100),
-        )
-        small_points = [
-            (self.x, self.y + actual_size * 0.7),
-            (self.x + actual_size * 0.25, self.y + actual_size * 0.15),
-            (self.x, self.y + actual_size * 0.05),
-            (self.x - actual_size * 0.25, self.y + actual_size * 0.15),
-        ]
-        arcade.draw_polygon_filled(small_points, (*highlight, min(255, self.alpha)))
-
-        # Destellos animados
-        if self.is_sparkling:
-            self.sparkle_time += 0.05
-            sparkle_alpha = int(abs(math.sin(self.sparkle_time * 5)) * 200)
-            arcade.draw_circle_filled(
-                self.x + actual_size * 0.3, self.y + actual_size * 0.5,
-                3, (255, 255, 255, sparkle_alpha)
-            )
-            arcade.draw_circle_filled(
-                self.x - actual_size * 0.2, self.y + actual_size * 0.3,
-                2, (255, 255, 255, sparkle_alpha)
-            )
+        Returns:
+            Alpha (0-200) de los destellos, o 0 si la gema no está destellando.
+        """
+        if not self.is_sparkling:
+            return 0
+        self.sparkle_time += 0.05
+        return int(abs(math.sin(self.sparkle_time * 5)) * 200)
 
     def start_sparkle(self):
         """Activa el efecto de destello en la gema."""
         self.is_sparkling = True
         self.sparkle_time = 0
+        if not self.sparkle_sprites:
+            for radius in SPARKLE_RADII:
+                sparkle = arcade.Sprite(texture=get_sparkle_texture(radius))
+                sparkle.alpha = 0
+                self.sparkle_sprites.append(sparkle)
+            self.sprites = [self.sprite, *self.sparkle_sprites]
 
     def contains_point(self, px, py):
         """Verifica si un punto está dentro del área de la gema.
@@ -167,6 +175,7 @@ class AnswerButton:
         self.state = "normal"
         self.animation_time = 0
 
+    @render.counted("AnswerButton")
     def draw(self):
         """Dibuja el botón con su estado visual actual."""
         if self.state == "correct":
@@ -187,12 +196,13 @@ class AnswerButton:
         h = self.height * scale
 
         # Sombra
-        arcade.draw_rectangle_filled(self.x + 3, self.y - 3, w, h, (0, 0, 0, 40))
+        render.draw_rectangle_filled(self.x + 3, self.y - 3, w, h, (0, 0, 0, 40))
         # Botón
-        arcade.draw_rectangle_filled(self.x, self.y, w, h, color)
-        arcade.draw_rectangle_outline(self.x, self.y, w, h, (255, 255, 255, 120), 2)
+        render.draw_rectangle_filled(self.x, self.y, w, h, color)
+        render.draw_rectangle_outline(self.x, self.y, w, h, (255, 255, 255, 120), 2)
         # Texto
-        arcade.draw_text(
+        render.draw_text_cached(
+            (id(self), "label"),
             self.text,
             self.x, self.y,
             COLOR_TEXT_LIGHT,
@@ -232,7 +242,7 @@ class AnswerButton:
         )
 
 
-class LevelBase(arcade.View):
+class LevelBase(TimedView):
     """Clase base para todos los niveles del juego.
     
     Proporciona funcionalidad compartida: HUD, sistema de feedback
@@ -252,12 +262,42 @@ class LevelBase(arcade.View):
         self.gems = []
         self.answer_buttons = []
         self.state = "playing"
-        self.feedback_timer = 0
+        self.feedback_timer = None  # Temporizador del panel de feedback (scheduler.Timer)
         self.feedback_text = ""
         self.feedback_text_line2 = ""
         self.feedback_color = COLOR_SUCCESS
         self.transition_timer = 0
         self.message = ""
+        self._session_seed = None
+
+    def session_seed(self):
+        """Semilla de la sesión actual (la del tracker si existe).
+
+        Sin tracker se crea una semilla propia para esta vista.
+        """
+        tracker = getattr(self.window, 'tracker', None)
+        if tracker is not None:
+            return tracker.session_seed
+        if self._session_seed is None:
+            self._session_seed = new_session_seed()
+        return self._session_seed
+
+    def scoring(self):
+        """Regla de calificación del nivel (ver scoring.py); por defecto, respuesta exacta."""
+        return exact_match
+
+    def clock(self):
+        """Reloj de la sesión (el del tracker si existe, si no el activo)."""
+        tracker = getattr(self.window, 'tracker', None)
+        if tracker is not None:
+            return tracker.clock
+        return get_clock()
+
+    def start_feedback_timer(self):
+        """Programa el fin del panel de feedback dentro de FEEDBACK_DURATION segundos."""
+        if self.feedback_timer is not None:
+            self.feedback_timer.cancel()
+        self.feedback_timer = self.call_later(FEEDBACK_DURATION, self.end_feedback)
 
     def play_feedback_sound(self, is_correct):
         """Reproduce el sonido de feedback según si la respuesta fue correcta.
@@ -277,13 +317,14 @@ class LevelBase(arcade.View):
     def draw_hud(self):
         """Dibuja la barra de información superior (HUD)."""
         # Barra superior
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             SCREEN_WIDTH // 2, SCREEN_HEIGHT - 25, SCREEN_WIDTH, 50, (*COLOR_PRIMARY, 220)
         )
 
         # Nombre del nivel
         level_name = LEVEL_NAMES.get(self.level_number, f"Nivel {self.level_number}")
-        arcade.draw_text(
+        render.draw_text_cached(
+            ("hud", "level"),
             f"Nivel {self.level_number}: {level_name}",
             15, SCREEN_HEIGHT - 35,
             COLOR_TEXT_LIGHT,
@@ -292,7 +333,8 @@ class LevelBase(arcade.View):
         )
 
         # Progreso (ronda actual)
-        arcade.draw_text(
+        render.draw_text_cached(
+            ("hud", "round"),
             f"Ronda {self.trial_number}/{self.total_trials}",
             SCREEN_WIDTH - 15, SCREEN_HEIGHT - 35,
             COLOR_TEXT_LIGHT,
@@ -307,12 +349,12 @@ class LevelBase(arcade.View):
         bar_y = SCREEN_HEIGHT - 45
         progress = self.trial_number / self.total_trials if self.total_trials > 0 else 0
 
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             SCREEN_WIDTH // 2, bar_y, bar_width, 8, (255, 255, 255, 80)
         )
         if progress > 0:
             filled_width = bar_width * progress
-            arcade.draw_rectangle_filled(
+            render.draw_rectangle_filled(
                 bar_x + filled_width / 2, bar_y, filled_width, 8, COLOR_GOLD
             )
 
@@ -325,18 +367,19 @@ class LevelBase(arcade.View):
             panel_h = 140 if has_line2 else 100
 
             # Panel semi-transparente
-            arcade.draw_rectangle_filled(
+            render.draw_rectangle_filled(
                 SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
                 panel_w, panel_h, (*self.feedback_color, 230)
             )
-            arcade.draw_rectangle_outline(
+            render.draw_rectangle_outline(
                 SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
                 panel_w, panel_h, (255, 255, 255, 180), 3
             )
 
             if has_line2:
                 # Texto en dos líneas
-                arcade.draw_text(
+                render.draw_text_cached(
+                    ("feedback", "line1"),
                     self.feedback_text,
                     SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 22,
                     COLOR_TEXT_LIGHT,
@@ -344,7 +387,8 @@ class LevelBase(arcade.View):
                     anchor_x="center", anchor_y="center",
                     bold=True,
                 )
-                arcade.draw_text(
+                render.draw_text_cached(
+                    ("feedback", "line2"),
                     self.feedback_text_line2,
                     SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 22,
                     COLOR_TEXT_LIGHT,
@@ -354,7 +398,8 @@ class LevelBase(arcade.View):
                 )
             else:
                 # Texto en una línea
-                arcade.draw_text(
+                render.draw_text_cached(
+                    ("feedback", "single"),
                     self.feedback_text,
                     SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
                     COLOR_TEXT_LIGHT,
@@ -370,7 +415,7 @@ class LevelBase(arcade.View):
             is_correct: True si la respuesta fue correcta.
         """
         self.state = "feedback"
-        self.feedback_timer = 0
+        self.start_feedback_timer()
         self.feedback_text_line2 = ""
         if is_correct:
             self.feedback_text = "¡Correcto!"
@@ -382,17 +427,12 @@ class LevelBase(arcade.View):
         # Reproducir sonido de feedback
         self.play_feedback_sound(is_correct)
 
-    def update_feedback(self, delta_time):
-        """Actualiza el temporizador de feedback y avanza cuando termina.
-        
-        Args:
-            delta_time: Tiempo transcurrido desde el último frame.
-        """
+    def end_feedback(self):
+        """Cierra el panel de feedback y avanza (lo llama el temporizador)."""
+        self.feedback_timer = None
         if self.state == "feedback":
-            self.feedback_timer += delta_time
-            if self.feedback_timer >= 1.5:
-                self.state = "playing"
-                self.next_trial()
+            self.state = "playing"
+            self.next_trial()
 
     def next_trial(self):
         """Avanza al siguiente intento o al siguiente nivel."""
@@ -407,6 +447,9 @@ class LevelBase(arcade.View):
 
     def go_to_next_level(self):
         """Avanza al siguiente nivel o muestra el reporte final."""
+        tracker = getattr(self.window, 'tracker', None)
+        if tracker:
+            tracker.record_level_complete(self.level_number)
         next_level = self.level_number + 1
         if next_level <= TOTAL_LEVELS:
             from views.instruction_view import InstructionView
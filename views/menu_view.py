@@ -5,6 +5,9 @@ Pantalla de menú principal del juego.
 import arcade
 import math
 from constants import *
+from views.gem_atlas import get_gem_texture
+from views import render
+from views.frame_timing import TimedView
 
 
 class FloatingGem:
@@ -20,32 +23,20 @@ class FloatingGem:
         self.phase = phase
         self.time = 0
 
+        # Sprite con la textura de gema del menú (diamante con brillo)
+        texture, texture_scale = get_gem_texture(color, size, style="menu")
+        self.sprite = arcade.Sprite(
+            texture=texture, scale=texture_scale, center_x=x, center_y=y
+        )
+
     def update(self, delta_time):
         self.time += delta_time
         self.y = self.base_y + math.sin(self.time * self.speed + self.phase) * GEM_FLOAT_RANGE
+        self.sprite.center_y = self.y
 
+    @render.counted("FloatingGem")
     def draw(self):
-        # Dibujar una gema como un diamante (rombo)
-        points = [
-            (self.x, self.y + self.size),
-            (self.x + self.size * 0.6, self.y),
-            (self.x, self.y - self.size * 0.4),
-            (self.x - self.size * 0.6, self.y),
-        ]
-        arcade.draw_polygon_filled(points, self.color)
-        # Brillo
-        highlight_color = (
-            min(255, self.color[0] + 80),
-            min(255, self.color[1] + 80),
-            min(255, self.color[2] + 80),
-        )
-        small_points = [
-            (self.x, self.y + self.size * 0.6),
-            (self.x + self.size * 0.3, self.y + self.size * 0.1),
-            (self.x, self.y - self.size * 0.1),
-            (self.x - self.size * 0.3, self.y + self.size * 0.1),
-        ]
-        arcade.draw_polygon_filled(small_points, highlight_color)
+        render.draw_sprite(self.sprite)
 
 
 class Button:
@@ -62,19 +53,20 @@ class Button:
         self.text_color = text_color
         self.is_hovered = False
 
+    @render.counted("Button")
     def draw(self):
         current_color = self.hover_color if self.is_hovered else self.color
         # Sombra
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             self.x + 3, self.y - 3, self.width, self.height, (0, 0, 0, 50)
         )
         # Botón
-        arcade.draw_rectangle_filled(self.x, self.y, self.width, self.height, current_color)
-        arcade.draw_rectangle_outline(
+        render.draw_rectangle_filled(self.x, self.y, self.width, self.height, current_color)
+        render.draw_rectangle_outline(
             self.x, self.y, self.width, self.height, (255, 255, 255, 100), 2
         )
         # Texto
-        arcade.draw_text(
+        render.draw_text(
             self.text,
             self.x,
             self.y,
@@ -99,12 +91,13 @@ class Button:
         )
 
 
-class MenuView(arcade.View):
+class MenuView(TimedView):
     """Vista del menú principal."""
 
     def __init__(self):
         super().__init__()
         self.floating_gems = []
+        self.gem_sprites = arcade.SpriteList(use_spatial_hash=False, lazy=True)
         self.title_time = 0
 
         # --- Definir geometría del panel ---
@@ -143,6 +136,7 @@ class MenuView(arcade.View):
                 phase=random.uniform(0, math.pi * 2),
             )
             self.floating_gems.append(gem)
+            self.gem_sprites.append(gem.sprite)
 
     def on_show_view(self):
         arcade.set_background_color(COLOR_BACKGROUND)
@@ -156,19 +150,18 @@ class MenuView(arcade.View):
             r = int(COLOR_BACKGROUND[0] * (1 - ratio * 0.15))
             g = int(COLOR_BACKGROUND[1] * (1 - ratio * 0.1))
             b = int(COLOR_BACKGROUND[2] * (1 - ratio * 0.05))
-            arcade.draw_line(0, i, SCREEN_WIDTH, i, (r, g, b))
+            render.draw_line(0, i, SCREEN_WIDTH, i, (r, g, b))
 
-        # Dibujar gemas flotantes
-        for gem in self.floating_gems:
-            gem.draw()
+        # Dibujar gemas flotantes (una sola llamada)
+        render.draw_sprite_list(self.gem_sprites)
 
         # Panel central semi-transparente (centrado)
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             SCREEN_WIDTH // 2, self.panel_center_y,
             self.panel_width, self.panel_height,
             (255, 255, 255, 180)
         )
-        arcade.draw_rectangle_outline(
+        render.draw_rectangle_outline(
             SCREEN_WIDTH // 2, self.panel_center_y,
             self.panel_width, self.panel_height,
             COLOR_PRIMARY, 3
@@ -176,7 +169,7 @@ class MenuView(arcade.View):
 
         # Título con efecto de onda
         title_y = self.title_y + math.sin(self.title_time * 2) * 5
-        arcade.draw_text(
+        render.draw_text(
             "NumWorld",
             SCREEN_WIDTH // 2,
             title_y,
@@ -188,7 +181,7 @@ class MenuView(arcade.View):
         )
 
         # Subtítulo
-        arcade.draw_text(
+        render.draw_text(
             "Aventura Numerica",
             SCREEN_WIDTH // 2,
             self.subtitle_y,
@@ -208,7 +201,7 @@ class MenuView(arcade.View):
             "demuestra tus habilidades numericas.",
         ]
         for i, line in enumerate(desc_lines):
-            arcade.draw_text(
+            render.draw_text(
                 line,
                 SCREEN_WIDTH // 2,
                 self.desc_start_y - i * 28,
@@ -223,7 +216,7 @@ class MenuView(arcade.View):
         self.info_button.draw()
 
         # Pie de página
-        arcade.draw_text(
+        render.draw_text(
             "Herramienta de observacion educativa - No es un instrumento de diagnostico",
             SCREEN_WIDTH // 2,
             30,
@@ -4,6 +4,8 @@ Pantalla para recopilar información básica del jugador.
 
 import arcade
 from constants import *
+from views import render
+from scheduler import SCHEDULER
 
 
 class PlayerInfoView(arcade.View):
@@ -16,7 +18,6 @@ class PlayerInfoView(arcade.View):
         self.active_field = "name"
         self.error_message = ""
         self.cursor_visible = True
-        self.cursor_timer = 0
 
         # --- Panel ---
         self.panel_cx = SCREEN_WIDTH // 2
@@ -45,24 +46,32 @@ class PlayerInfoView(arcade.View):
 
     def on_show_view(self):
         arcade.set_background_color(COLOR_BACKGROUND)
+        # Parpadeo del cursor
+        SCHEDULER.call_every(0.5, self.toggle_cursor, owner=self)
+
+    def on_hide_view(self):
+        SCHEDULER.cancel_owner(self)
+
+    def toggle_cursor(self):
+        self.cursor_visible = not self.cursor_visible
 
     def on_draw(self):
         self.clear()
 
         # Panel central
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             self.panel_cx, self.panel_cy,
             self.panel_w, self.panel_h,
             (255, 255, 255, 230)
         )
-        arcade.draw_rectangle_outline(
+        render.draw_rectangle_outline(
             self.panel_cx, self.panel_cy,
             self.panel_w, self.panel_h,
             COLOR_PRIMARY, 3
         )
 
         # Título
-        arcade.draw_text(
+        render.draw_text(
             "¡Cuéntanos sobre ti!",
             self.panel_cx,
             self.title_y,
@@ -75,25 +84,25 @@ class PlayerInfoView(arcade.View):
 
         # --- Campo de nombre ---
         name_color = COLOR_PRIMARY if self.active_field == "name" else (180, 180, 200)
-        arcade.draw_text(
+        render.draw_text(
             "Tu nombre:",
             self.panel_cx - self.field_width // 2,
             self.name_label_y,
             COLOR_TEXT_DARK,
             font_size=FONT_SIZE_BODY,
         )
-        arcade.draw_rectangle_outline(
+        render.draw_rectangle_outline(
             self.panel_cx, self.name_field_y,
             self.field_width, self.field_height,
             name_color, 2
         )
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             self.panel_cx, self.name_field_y,
             self.field_width - 4, self.field_height - 4,
             (245, 245, 255)
         )
         cursor_name = "|" if self.active_field == "name" and self.cursor_visible else ""
-        arcade.draw_text(
+        render.draw_text(
             self.player_name + cursor_name,
             self.panel_cx - self.field_width // 2 + 10,
             self.name_field_y - 8,
@@ -103,25 +112,25 @@ class PlayerInfoView(arcade.View):
 
         # --- Campo de edad ---
         age_color = COLOR_PRIMARY if self.active_field == "age" else (180, 180, 200)
-        arcade.draw_text(
+        render.draw_text(
             "Tu edad:",
             self.panel_cx - self.field_width // 2,
             self.age_label_y,
             COLOR_TEXT_DARK,
             font_size=FONT_SIZE_BODY,
         )
-        arcade.draw_rectangle_outline(
+        render.draw_rectangle_outline(
             self.panel_cx, self.age_field_y,
             self.field_width, self.field_height,
             age_color, 2
         )
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             self.panel_cx, self.age_field_y,
             self.field_width - 4, self.field_height - 4,
             (245, 245, 255)
         )
         cursor_age = "|" if self.active_field == "age" and self.cursor_visible else ""
-        arcade.draw_text(
+        render.draw_text(
             self.player_age + cursor_age,
             self.panel_cx - self.field_width // 2 + 10,
             self.age_field_y - 8,
@@ -131,13 +140,13 @@ class PlayerInfoView(arcade.View):
 
         # --- Botón comenzar ---
         btn_color = COLOR_SUCCESS if (self.player_name and self.player_age) else (180, 180, 180)
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             self.panel_cx, self.button_y, 200, 50, btn_color
         )
-        arcade.draw_rectangle_outline(
+        render.draw_rectangle_outline(
             self.panel_cx, self.button_y, 200, 50, (255, 255, 255, 100), 2
         )
-        arcade.draw_text(
+        render.draw_text(
             "¡Comenzar!",
             self.panel_cx,
             self.button_y,
@@ -150,7 +159,7 @@ class PlayerInfoView(arcade.View):
 
         # --- Mensaje de error ---
         if self.error_message:
-            arcade.draw_text(
+            render.draw_text(
                 self.error_message,
                 self.panel_cx,
                 self.error_y,
@@ -161,7 +170,7 @@ class PlayerInfoView(arcade.View):
             )
 
         # --- Instrucción (fuera del panel, abajo) ---
-        arcade.draw_text(
+        render.draw_text(
             "Usa Tab para cambiar de campo - Enter para continuar",
             self.panel_cx,
             self.instruction_y,
@@ -171,12 +180,6 @@ class PlayerInfoView(arcade.View):
             anchor_y="center",
         )
 
-    def on_update(self, delta_time):
-        self.cursor_timer += delta_time
-        if self.cursor_timer >= 0.5:
-            self.cursor_visible = not self.cursor_visible
-            self.cursor_timer = 0
-
     def on_key_press(self, key, modifiers):
         if key == arcade.key.TAB:
             self.active_field = "age" if self.active_field == "name" else "name"
@@ -227,7 +230,14 @@ class PlayerInfoView(arcade.View):
             from views.instruction_view import InstructionView
             from data_tracker import DataTracker
 
+            # El registro de la partida anterior (si la hubo) se cierra antes de reemplazarla
+            previous = getattr(self.window, 'tracker', None)
+            if previous:
+                previous.close_event_log()
+
             tracker = DataTracker()
             tracker.set_player_info(self.player_name.strip(), self.player_age.strip())
+            # Los datos se guardan en disco a medida que se juega
+            tracker.open_event_log()
             self.window.tracker = tracker
             self.window.show_view(InstructionView(level=1))
\ No newline at end of file
@@ -0,0 +1,258 @@
+"""
+Capa de dibujo intercambiable.
+Las vistas y los objetos del juego dibujan con las funciones de este módulo
+en lugar de llamar a arcade.draw_* directamente. Cada llamada se envía al
+backend activo:
+
+- ArcadeBackend: dibuja con arcade (el juego normal).
+- NullBackend: no dibuja nada; cuenta las primitivas y opcionalmente las
+  guarda. Permite ejecutar los niveles sin contexto OpenGL ni pantalla
+  (ver headless.py).
+
+Además, cada llamada se cuenta en DRAW_COUNTER por objeto y por tipo de
+primitiva: el objeto es el nombre pasado a counted() en su método draw
+(Gem, AnswerButton, ...) o la vista que se está dibujando. Los contadores se
+vacían al empezar cada frame (ver frame_timing.py).
+"""
+
+import functools
+
+import arcade
+from views.text_cache import TEXT_CACHE
+
+
+class ArcadeBackend:
+    """Backend que dibuja en la ventana con arcade."""
+
+    uses_opengl = True
+
+    def draw_rectangle_filled(self, center_x, center_y, width, height, color, tilt_angle=0):
+        arcade.draw_rectangle_filled(center_x, center_y, width, height, color, tilt_angle)
+
+    def draw_rectangle_outline(self, center_x, center_y, width, height, color,
+                               border_width=1, tilt_angle=0):
+        arcade.draw_rectangle_outline(
+            center_x, center_y, width, height, color, border_width, tilt_angle
+        )
+
+    def draw_circle_filled(self, center_x, center_y, radius, color):
+        arcade.draw_circle_filled(center_x, center_y, radius, color)
+
+    def draw_line(self, start_x, start_y, end_x, end_y, color, line_width=1):
+        arcade.draw_line(start_x, start_y, end_x, end_y, color, line_width)
+
+    def draw_polygon_filled(self, point_list, color):
+        arcade.draw_polygon_filled(point_list, color)
+
+    def draw_text(self, text, start_x, start_y, color, font_size=12, **style):
+        arcade.draw_text(text, start_x, start_y, color, font_size=font_size, **style)
+
+    def draw_text_cached(self, key, text, x, y, color, font_size=12, **style):
+        TEXT_CACHE.draw(key, text, x, y, color, font_size=font_size, **style)
+
+    def draw_sprite(self, sprite):
+        sprite.draw()
+
+    def draw_sprite_list(self, sprite_list):
+        sprite_list.draw()
+
+
+class NullBackend:
+    """Backend sin salida gráfica que cuenta (y opcionalmente guarda) las primitivas."""
+
+    uses_opengl = False
+
+    def __init__(self, record=False):
+        """Inicializa el backend.
+
+        Args:
+            record: True para guardar cada primitiva con sus argumentos en
+                commands (útil para comparar lo que dibuja una vista).
+        """
+        self.record = record
+        self.counts = {}
+        self.commands = []
+
+    def _add(self, name, *args, count=1, **kwargs):
+        self.counts[name] = self.counts.get(name, 0) + count
+        if self.record:
+            self.commands.append((name, args, kwargs))
+
+    def reset(self):
+        """Vacía los contadores y las primitivas guardadas."""
+        self.counts.clear()
+        self.commands.clear()
+
+    def total(self):
+        """Número total de primitivas dibujadas desde el último reset."""
+        return sum(self.counts.values())
+
+    def draw_rectangle_filled(self, center_x, center_y, width, height, color, tilt_angle=0):
+        self._add("rectangle_filled", center_x, center_y, width, height, color, tilt_angle)
+
+    def draw_rectangle_outline(self, center_x, center_y, width, height, color,
+                               border_width=1, tilt_angle=0):
+        self._add(
+            "rectangle_outline", center_x, center_y, width, height, color,
+            border_width, tilt_angle,
+        )
+
+    def draw_circle_filled(self, center_x, center_y, radius, color):
+        self._add("circle_filled", center_x, center_y, radius, color)
+
+    def draw_line(self, start_x, start_y, end_x, end_y, color, line_width=1):
+        self._add("line", start_x, start_y, end_x, end_y, color, line_width)
+
+    def draw_polygon_filled(self, point_list, color):
+        self._add("polygon_filled", tuple(point_list), color)
+
+    def draw_text(self, text, start_x, start_y, color, font_size=12, **style):
+        self._add("text", str(text), start_x, start_y, color, font_size=font_size, **style)
+
+    def draw_text_cached(self, key, text, x, y, color, font_size=12, **style):
+        self._add("text", str(text), x, y, color, font_size=font_size, **style)
+
+    def draw_sprite(self, sprite):
+        self._add("sprite", sprite.position, sprite.texture.name)
+
+    def draw_sprite_list(self, sprite_list):
+        self._add(
+            "sprite",
+            [(sprite.position, sprite.texture.name) for sprite in sprite_list]
+            if self.record else None,
+            count=len(sprite_list),
+        )
+
+
+class DrawCounter:
+    """Llamadas de dibujo y primitivas del frame actual por objeto y tipo.
+
+    Una llamada es un envío al backend; las primitivas son lo que dibuja
+    (una lista de sprites es una llamada con muchas primitivas).
+    """
+
+    def __init__(self):
+        self.owner = "vista"
+        self.calls = {}       # (objeto, primitiva) -> llamadas
+        self.primitives = {}  # (objeto, primitiva) -> primitivas
+
+    def add(self, primitive, count=1):
+        """Cuenta una llamada de dibujo a nombre del objeto actual."""
+        key = (self.owner, primitive)
+        self.calls[key] = self.calls.get(key, 0) + 1
+        self.primitives[key] = self.primitives.get(key, 0) + count
+
+    def reset(self, owner="vista"):
+        """Vacía los contadores al empezar un frame."""
+        self.owner = owner
+        self.calls.clear()
+        self.primitives.clear()
+
+    def total_calls(self):
+        return sum(self.calls.values())
+
+    def total_primitives(self):
+        return sum(self.primitives.values())
+
+    def by_owner(self):
+        """Llamadas y primitivas por objeto.
+
+        Returns:
+            Diccionario objeto -> {"calls": n, "primitives": n}.
+        """
+        owners = {}
+        for (owner, _), calls in self.calls.items():
+            entry = owners.setdefault(owner, {"calls": 0, "primitives": 0})
+            entry["calls"] += calls
+        for (owner, _), primitives in self.primitives.items():
+            owners[owner]["primitives"] += primitives
+        return owners
+
+
+# Backend activo
+BACKEND = ArcadeBackend()
+
+# Contadores de dibujo del frame actual
+DRAW_COUNTER = DrawCounter()
+
+
+def set_backend(backend):
+    """Cambia el backend activo y devuelve el anterior."""
+    global BACKEND
+    previous = BACKEND
+    BACKEND = backend
+    return previous
+
+
+def get_backend():
+    """Devuelve el backend activo."""
+    return BACKEND
+
+
+def counted(owner):
+    """Decorador para métodos draw: sus llamadas se cuentan a nombre de `owner`.
+
+    Args:
+        owner: Nombre del tipo de objeto (por ejemplo "Gem").
+    """
+    def decorator(draw):
+        @functools.wraps(draw)
+        def wrapper(*args, **kwargs):
+            previous = DRAW_COUNTER.owner
+            DRAW_COUNTER.owner = owner
+            try:
+                return draw(*args, **kwargs)
+            finally:
+                DRAW_COUNTER.owner = previous
+        return wrapper
+    return decorator
+
+
+# --- Funciones de dibujo (misma firma que las de arcade) ---
+
+def draw_rectangle_filled(center_x, center_y, width, height, color, tilt_angle=0):
+    DRAW_COUNTER.add("rectangle_filled")
+    BACKEND.draw_rectangle_filled(center_x, center_y, width, height, color, tilt_angle)
+
+
+def draw_rectangle_outline(center_x, center_y, width, height, color, border_width=1, tilt_angle=0):
+    DRAW_COUNTER.add("rectangle_outline")
+    BACKEND.draw_rectangle_outline(
+        center_x, center_y, width, height, color, border_width, tilt_angle
+    )
+
+
+def draw_circle_filled(center_x, center_y, radius, color):
+    DRAW_COUNTER.add("circle_filled")
+    BACKEND.draw_circle_filled(center_x, center_y, radius, color)
+
+
+def draw_line(start_x, start_y, end_x, end_y, color, line_width=1):
+    DRAW_COUNTER.add("line")
+    BACKEND.draw_line(start_x, start_y, end_x, end_y, color, line_width)
+
+
+def draw_polygon_filled(point_list, color):
+    DRAW_COUNTER.add("polygon_filled")
+    BACKEND.draw_polygon_filled(point_list, color)
+
+
+def draw_text(text, start_x, start_y, color, font_size=12, **style):
+    DRAW_COUNTER.add("text")
+    BACKEND.draw_text(text, start_x, start_y, color, font_size=font_size, **style)
+
+
+def draw_text_cached(key, text, x, y, color, font_size=12, **style):
+    """Dibuja un texto reutilizando su maquetación (ver TextCache.draw)."""
+    DRAW_COUNTER.add("text")
+    BACKEND.draw_text_cached(key, text, x, y, color, font_size=font_size, **style)
+
+
+def draw_sprite(sprite):
+    DRAW_COUNTER.add("sprite")
+    BACKEND.draw_sprite(sprite)
+
+
+def draw_sprite_list(sprite_list):
+    DRAW_COUNTER.add("sprite_list", len(sprite_list))
+    BACKEND.draw_sprite_list(sprite_list)
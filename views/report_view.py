@@ -6,6 +6,92 @@ Muestra un resumen del rendimiento del jugador en todos los niveles.
 import arcade
 import math
 from constants import *
+from views import render
+from views.frame_timing import TimedView
+
+
+LAYER_VERTEX_SHADER = """
+#version 330
+
+in vec2 in_vert;
+in vec2 in_uv;
+out vec2 uv;
+
+void main() {
+    gl_Position = vec4(in_vert, 0.0, 1.0);
+    uv = in_uv;
+}
+"""
+
+LAYER_FRAGMENT_SHADER = """
+#version 330
+
+uniform sampler2D layer;
+in vec2 uv;
+out vec4 f_color;
+
+void main() {
+    // La capa es opaca: se ignora el alpha acumulado al dibujar en la textura
+    f_color = vec4(texture(layer, uv).rgb, 1.0);
+}
+"""
+
+
+class StaticLayer:
+    """Capa de dibujo que se renderiza una sola vez en una textura fuera de
+    pantalla y después se copia a la ventana en cada frame."""
+
+    def __init__(self, draw_function, background_color):
+        """Inicializa la capa.
+
+        Args:
+            draw_function: Función que dibuja el contenido estático.
+            background_color: Color con el que se limpia la textura.
+        """
+        self.draw_function = draw_function
+        self.background_color = background_color
+        self.framebuffer = None
+        self.quad = None
+        self.program = None
+        self.dirty = True
+
+    def invalidate(self):
+        """Marca la capa para volver a dibujarla en el siguiente frame."""
+        self.dirty = True
+
+    def _init_gl(self):
+        """Crea la textura, el framebuffer y el programa de copia."""
+        ctx = arcade.get_window().ctx
+        texture = ctx.texture(
+            ctx.screen.size, components=4, filter=(ctx.NEAREST, ctx.NEAREST)
+        )
+        self.framebuffer = ctx.framebuffer(color_attachments=[texture])
+        self.quad = arcade.gl.geometry.quad_2d_fs()
+        self.program = ctx.program(
+            vertex_shader=LAYER_VERTEX_SHADER,
+            fragment_shader=LAYER_FRAGMENT_SHADER,
+        )
+
+    @render.counted("StaticLayer")
+    def draw(self):
+        """Copia la capa a la pantalla, redibujándola antes si cambió."""
+        if not render.get_backend().uses_opengl:
+            # Sin contexto OpenGL no hay textura: se envían las primitivas cada vez
+            self.draw_function()
+            return
+
+        if self.framebuffer is None:
+            self._init_gl()
+
+        if self.dirty:
+            with self.framebuffer.activate() as fbo:
+                fbo.clear(self.background_color)
+                self.draw_function()
+            self.dirty = False
+
+        self.framebuffer.color_attachments[0].use(0)
+        render.DRAW_COUNTER.add("layer")
+        self.quad.render(self.program)
 
 
 class LevelCard:
@@ -40,28 +126,35 @@ class LevelCard:
         else:
             self.accent_color = COLOR_ERROR
 
-    def draw(self):
+    @render.counted("LevelCard")
+    def draw(self, highlight=True):
+        """Dibuja la tarjeta.
+
+        Args:
+            highlight: Si es False se dibuja en estado normal aunque tenga
+                el mouse encima (para la capa estática del reporte).
+        """
         # Sombra
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             self.x + 2, self.y - 2,
             self.width, self.height,
             (0, 0, 0, 30)
         )
 
         # Fondo de la card
-        bg = (240, 248, 255) if not self.is_hovered else (230, 240, 250)
-        arcade.draw_rectangle_filled(
+        bg = (230, 240, 250) if highlight and self.is_hovered else (240, 248, 255)
+        render.draw_rectangle_filled(
             self.x, self.y, self.width, self.height, bg
         )
 
         # Borde superior con color de rendimiento
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             self.x, self.y + self.height // 2 - 3,
             self.width, 6, self.accent_color
         )
 
         # Borde general
-        arcade.draw_rectangle_outline(
+        render.draw_rectangle_outline(
             self.x, self.y, self.width, self.height,
             (200, 210, 220), 2
         )
@@ -76,7 +169,8 @@ class LevelCard:
         }
         name = short_names.get(self.level_num, f"Nivel {self.level_num}")
 
-        arcade.draw_text(
+        render.draw_text_cached(
+            (id(self), "name"),
             name,
             self.x, self.y + self.height // 2 - 25,
             COLOR_TEXT_DARK,
@@ -87,7 +181,8 @@ class LevelCard:
         )
 
         # Porcentaje grande
-        arcade.draw_text(
+        render.draw_text_cached(
+            (id(self), "accuracy"),
             f"{self.accuracy}%",
             self.x, self.y + 10,
             self.accent_color,
@@ -101,18 +196,19 @@ class LevelCard:
         bar_w = self.width - 30
         bar_h = 8
         bar_y = self.y - 20
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             self.x, bar_y, bar_w, bar_h, (220, 220, 230)
         )
         filled = bar_w * (self.accuracy / 100)
         if filled > 0:
-            arcade.draw_rectangle_filled(
+            render.draw_rectangle_filled(
                 self.x - bar_w / 2 + filled / 2, bar_y,
                 filled, bar_h, self.accent_color
             )
 
         # Tiempo promedio
-        arcade.draw_text(
+        render.draw_text_cached(
+            (id(self), "avg_time"),
             f"{self.avg_time}s prom.",
             self.x, self.y - 42,
             (120, 120, 140),
@@ -123,7 +219,8 @@ class LevelCard:
 
         # Errores
         error_color = COLOR_ERROR if self.errors > 0 else (120, 120, 140)
-        arcade.draw_text(
+        render.draw_text_cached(
+            (id(self), "errors"),
             f"{self.errors} error{'es' if self.errors != 1 else ''}",
             self.x, self.y - 58,
             error_color,
@@ -155,12 +252,19 @@ class ObservationTab:
         self.is_selected = False
         self.is_hovered = False
 
-    def draw(self):
-        if self.is_selected:
+    @render.counted("ObservationTab")
+    def draw(self, highlight=True):
+        """Dibuja la pestaña.
+
+        Args:
+            highlight: Si es False se dibuja sin selección ni hover
+                (para la capa estática del reporte).
+        """
+        if highlight and self.is_selected:
             bg = self.tab_color
             text_color = COLOR_TEXT_LIGHT
             border_w = 2
-        elif self.is_hovered:
+        elif highlight and self.is_hovered:
             bg = (*self.tab_color, 180)
             text_color = COLOR_TEXT_LIGHT
             border_w = 1
@@ -170,20 +274,21 @@ class ObservationTab:
             border_w = 1
 
         # Pestaña
-        arcade.draw_rectangle_filled(self.x, self.y, self.width, self.height, bg)
-        arcade.draw_rectangle_outline(
+        render.draw_rectangle_filled(self.x, self.y, self.width, self.height, bg)
+        render.draw_rectangle_outline(
             self.x, self.y, self.width, self.height, (180, 190, 200), border_w
         )
 
         # Texto de la pestaña
-        arcade.draw_text(
+        render.draw_text_cached(
+            (id(self), "title"),
             self.title,
             self.x, self.y,
             text_color,
             font_size=10,
             anchor_x="center",
             anchor_y="center",
-            bold=self.is_selected,
+            bold=highlight and self.is_selected,
         )
 
     def contains_point(self, px, py):
@@ -197,26 +302,40 @@ class ObservationTab:
         return self.is_hovered
 
 
-class ReportView(arcade.View):
+class ReportView(TimedView):
     """Vista del reporte observacional final."""
 
     def __init__(self):
         super().__init__()
         self.report = None
         self.saved_file = None
+        self.save_state = None  # "saving", "saved" o "failed"
         self.animation_time = 0
         self.cards = []
         self.tabs = []
         self.selected_tab = 0
+        self.static_layer = StaticLayer(self.draw_static_layer, COLOR_BACKGROUND)
 
     def on_show_view(self):
         arcade.set_background_color(COLOR_BACKGROUND)
         tracker = getattr(self.window, 'tracker', None)
         if tracker:
             self.report = tracker.get_full_report()
-            self.saved_file = tracker.save_report_to_file(self.report)
+            # El archivo se escribe en segundo plano; on_report_saved avisa al terminar
+            self.save_state = "saving"
+            tracker.save_report_async(self.report, self.on_report_saved)
         self.build_cards()
         self.build_tabs()
+        self.static_layer.invalidate()
+
+    def on_report_saved(self, filename):
+        """Recibe el resultado del guardado (callback de save_report_async).
+
+        Args:
+            filename: Ruta del reporte ya guardado en disco, o None si falló.
+        """
+        self.saved_file = filename
+        self.save_state = "saved" if filename else "failed"
 
     def build_cards(self):
         """Construye las 5 tarjetas de nivel."""
@@ -306,7 +425,8 @@ class ReportView(arcade.View):
         self.clear()
 
         if not self.report:
-            arcade.draw_text(
+            render.draw_text_cached(
+                ("report", "no_data"),
                 "No hay datos disponibles",
                 SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
                 COLOR_TEXT_DARK, font_size=FONT_SIZE_SUBTITLE,
@@ -314,20 +434,65 @@ class ReportView(arcade.View):
             )
             return
 
+        # Capa estática: se dibuja una sola vez en una textura y se reutiliza
+        self.static_layer.draw()
+
+        # Capa dinámica: tarjeta resaltada, pestañas activas y su contenido
+        for card in self.cards:
+            if card.is_hovered:
+                card.draw()
+        for tab in self.tabs:
+            if tab.is_selected or tab.is_hovered:
+                tab.draw()
+        self.draw_tab_content()
+
+        # --- Archivo guardado ---
+        if self.save_state == "saving":
+            render.draw_text_cached(
+                ("report", "saved_file"),
+                "Guardando reporte…",
+                SCREEN_WIDTH // 2, 115,
+                COLOR_TEXT_DARK, font_size=11,
+                anchor_x="center", anchor_y="center",
+            )
+        elif self.save_state == "saved":
+            render.draw_text_cached(
+                ("report", "saved_file"),
+                f"Reporte guardado en: {self.saved_file}",
+                SCREEN_WIDTH // 2, 115,
+                COLOR_SUCCESS, font_size=11,
+                anchor_x="center", anchor_y="center",
+            )
+        elif self.save_state == "failed":
+            render.draw_text_cached(
+                ("report", "saved_file"),
+                "No se pudo guardar el reporte",
+                SCREEN_WIDTH // 2, 115,
+                COLOR_ERROR, font_size=11,
+                anchor_x="center", anchor_y="center",
+            )
+
+    def draw_static_layer(self):
+        """Dibuja las partes del reporte que no cambian con el mouse.
+
+        Las tarjetas y pestañas se dibujan en su estado normal; on_draw
+        vuelve a dibujar encima solo la que esté resaltada o seleccionada.
+        """
         # --- Fondo del panel principal ---
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
             SCREEN_WIDTH - 40, SCREEN_HEIGHT - 30,
             (255, 255, 255, 230),
         )
-        arcade.draw_rectangle_outline(
+        render.draw_rectangle_outline(
             SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
             SCREEN_WIDTH - 40, SCREEN_HEIGHT - 30,
             COLOR_PRIMARY, 3,
         )
 
         # --- Título ---
-        arcade.draw_text(
+        render.draw_text_cached(
+            ("report", "title"),
             "Resumen Observacional",
             SCREEN_WIDTH // 2, SCREEN_HEIGHT - 45,
             COLOR_PRIMARY,
@@ -337,7 +502,8 @@ class ReportView(arcade.View):
         )
 
         # --- Info del jugador ---
-        arcade.draw_text(
+        render.draw_text_cached(
+            ("report", "player"),
             f"Jugador: {self.report.get('player_name', 'N/A')}  |  "
             f"Edad: {self.report.get('player_age', 'N/A')}  |  "
             f"Duracion: {self.report.get('total_session_time', 0)}s",
@@ -355,7 +521,8 @@ class ReportView(arcade.View):
         else:
             ov_color = COLOR_ERROR
 
-        arcade.draw_text(
+        render.draw_text_cached(
+            ("report", "overall"),
             f"Precision General: {overall}%  "
             f"({self.report.get('overall_correct', 0)}/{self.report.get('overall_total', 0)} correctas)",
             SCREEN_WIDTH // 2, SCREEN_HEIGHT - 115,
@@ -367,19 +534,20 @@ class ReportView(arcade.View):
         # Barra general
         bar_w = 500
         bar_y = SCREEN_HEIGHT - 140
-        arcade.draw_rectangle_filled(
+        render.draw_rectangle_filled(
             SCREEN_WIDTH // 2, bar_y, bar_w, 10, (220, 220, 230)
         )
         filled = bar_w * (overall / 100)
         if filled > 0:
-            arcade.draw_rectangle_filled(
+            render.draw_rectangle_filled(
                 SCREEN_WIDTH // 2 - bar_w / 2 + filled / 2, bar_y,
                 filled, 10, ov_color,
             )
 
         # --- Cards de niveles ---
         # Etiqueta
-        arcade.draw_text(
+        render.draw_text_cached(
+            ("report", "levels_label"),
             "Resultados por nivel:",
             SCREEN_WIDTH // 2, SCREEN_HEIGHT - 170,
             COLOR_PRIMARY, font_size=FONT_SIZE_SMALL,
@@ -388,16 +556,17 @@ class ReportView(arcade.View):
         )
 
         for card in self.cards:
-            card.draw()
+            card.draw(highlight=False)
 
         # --- Sección de observaciones ---
         obs_section_y = 290
-        arcade.draw_line(
+        render.draw_line(
             50, obs_section_y, SCREEN_WIDTH - 50, obs_section_y,
             (200, 210, 220), 2
         )
 
-        arcade.draw_text(
+        render.draw_text_cached(
+            ("report", "observations_label"),
             "Observaciones:",
             SCREEN_WIDTH // 2, obs_section_y + 18,
             COLOR_PRIMARY, font_size=FONT_SIZE_SMALL,
@@ -407,9 +576,57 @@ class ReportView(arcade.View):
 
         # Pestañas
         for tab in self.tabs:
-            tab.draw()
+            tab.draw(highlight=False)
+
+        # --- Disclaimer ---
+        disclaimer_y = 155
+        render.draw_rectangle_filled(
+            SCREEN_WIDTH // 2, disclaimer_y,
+            SCREEN_WIDTH - 120, 44,
+            (*COLOR_ERROR, 25),
+        )
+        render.draw_rectangle_outline(
+            SCREEN_WIDTH // 2, disclaimer_y,
+            SCREEN_WIDTH - 120, 44,
+            COLOR_ERROR, 2,
+        )
+        render.draw_text_cached(
+            ("report", "disclaimer"),
+            "HERRAMIENTA DE OBSERVACION -- NO ES UN INSTRUMENTO DE DIAGNOSTICO",
+            SCREEN_WIDTH // 2, disclaimer_y + 8,
+            COLOR_ERROR, font_size=11,
+            anchor_x="center", anchor_y="center",
+            bold=True,
+        )
+        render.draw_text_cached(
+            ("report", "disclaimer_note"),
+            "Los resultados deben ser interpretados por un profesional calificado.",
+            SCREEN_WIDTH // 2, disclaimer_y - 10,
+            COLOR_TEXT_DARK, font_size=10,
+            anchor_x="center", anchor_y="center",
+        )
 
-        # Contenido de la pestaña seleccionada
+        # --- Botón volver ---
+        btn_y = 55
+        btn_w = 200
+        btn_h = 40
+        render.draw_rectangle_filled(
+            SCREEN_WIDTH // 2, btn_y, btn_w, btn_h, COLOR_PRIMARY
+        )
+        render.draw_rectangle_outline(
+            SCREEN_WIDTH // 2, btn_y, btn_w, btn_h, (255, 255, 255, 100), 2
+        )
+        render.draw_text_cached(
+            ("report", "back_button"),
+            "Volver al Menu",
+            SCREEN_WIDTH // 2, btn_y,
+            COLOR_TEXT_LIGHT, font_size=FONT_SIZE_SMALL,
+            anchor_x="center", anchor_y="center",
+            bold=True,
+        )
+
+    def draw_tab_content(self):
+        """Dibuja el panel con el contenido de la pestaña seleccionada."""
         if self.tabs and self.selected_tab < len(self.tabs):
             selected = self.tabs[self.selected_tab]
             content = selected.content
@@ -419,19 +636,19 @@ class ReportView(arcade.View):
             content_h = 60
             content_w = SCREEN_WIDTH - 120
 
-            arcade.draw_rectangle_filled(
+            render.draw_rectangle_filled(
                 SCREEN_WIDTH // 2, content_y,
                 content_w, content_h,
                 (245, 248, 252),
             )
-            arcade.draw_rectangle_outline(
+            render.draw_rectangle_outline(
                 SCREEN_WIDTH // 2, content_y,
                 content_w, content_h,
                 selected.tab_color, 2,
             )
 
             # Indicador de color a la izquierda
-            arcade.draw_rectangle_filled(
+            render.draw_rectangle_filled(
                 SCREEN_WIDTH // 2 - content_w // 2 + 4, content_y,
                 8, content_h, selected.tab_color,
             )
@@ -445,79 +662,29 @@ class ReportView(arcade.View):
                     mid = max_chars
                 line1 = content[:mid]
                 line2 = content[mid:].strip()
-                arcade.draw_text(
+                render.draw_text_cached(
+                    ("report", "content_line1"),
                     line1,
                     SCREEN_WIDTH // 2 - content_w // 2 + 20, content_y + 12,
                     COLOR_TEXT_DARK, font_size=12,
                     anchor_y="center",
                 )
-                arcade.draw_text(
+                render.draw_text_cached(
+                    ("report", "content_line2"),
                     line2,
                     SCREEN_WIDTH // 2 - content_w // 2 + 20, content_y - 12,
                     COLOR_TEXT_DARK, font_size=12,
                     anchor_y="center",
                 )
             else:
-                arcade.draw_text(
+                render.draw_text_cached(
+                    ("report", "content"),
                     content,
                     SCREEN_WIDTH // 2 - content_w // 2 + 20, content_y,
                     COLOR_TEXT_DARK, font_size=12,
                     anchor_y="center",
                 )
 
-        # --- Disclaimer ---
-        disclaimer_y = 155
-        arcade.draw_rectangle_filled(
-            SCREEN_WIDTH // 2, disclaimer_y,
-            SCREEN_WIDTH - 120, 44,
-            (*COLOR_ERROR, 25),
-        )
-        arcade.draw_rectangle_outline(
-            SCREEN_WIDTH // 2, disclaimer_y,
-            SCREEN_WIDTH - 120, 44,
-            COLOR_ERROR, 2,
-        )
-        arcade.draw_text(
-            "HERRAMIENTA DE OBSERVACION -- NO ES UN INSTRUMENTO DE DIAGNOSTICO",
-            SCREEN_WIDTH // 2, disclaimer_y + 8,
-            COLOR_ERROR, font_size=11,
-            anchor_x="center", anchor_y="center",
-            bold=True,
-        )
-        arcade.draw_text(
-            "Los resultados deben ser interpretados por un profesional calificado.",
-            SCREEN_WIDTH // 2, disclaimer_y - 10,
-            COLOR_TEXT_DARK, font_size=10,
-            anchor_x="center", anchor_y="center",
-        )
-
-        # --- Archivo guardado ---
-        if self.saved_file:
-            arcade.draw_text(
-                f"Reporte guardado en: {self.saved_file}",
-                SCREEN_WIDTH // 2, 115,
-                COLOR_SUCCESS, font_size=11,
-                anchor_x="center", anchor_y="center",
-            )
-
-        # --- Botón volver ---
-        btn_y = 55
-        btn_w = 200
-        btn_h = 40
-        arcade.draw_rectangle_filled(
-            SCREEN_WIDTH // 2, btn_y, btn_w, btn_h, COLOR_PRIMARY
-        )
-        arcade.draw_rectangle_outline(
-            SCREEN_WIDTH // 2, btn_y, btn_w, btn_h, (255, 255, 255, 100), 2
-        )
-        arcade.draw_text(
-            "Volver al Menu",
-            SCREEN_WIDTH // 2, btn_y,
-            COLOR_TEXT_LIGHT, font_size=FONT_SIZE_SMALL,
-            anchor_x="center", anchor_y="center",
-            bold=True,
-        )
-
     def on_update(self, delta_time):
         self.animation_time += delta_time
 
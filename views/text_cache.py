@@ -0,0 +1,82 @@
+"""
+Caché de textos pre-maquetados.
+arcade.draw_text vuelve a maquetar los glifos cada vez que el texto cambia,
+y como varios textos comparten la misma etiqueta interna eso ocurre en cada
+frame. Esta caché guarda un arcade.Text por clave y solo lo recrea cuando
+cambia el texto, el color o el estilo.
+"""
+
+from collections import OrderedDict
+
+import arcade
+
+
+class TextCache:
+    """Almacén de objetos arcade.Text con contadores de aciertos y fallos."""
+
+    def __init__(self, max_entries=512):
+        """Inicializa la caché.
+
+        Args:
+            max_entries: Número máximo de textos guardados. Al superarlo se
+                descarta el que lleva más tiempo sin dibujarse.
+        """
+        self.entries = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def draw(self, key, text, x, y, color, font_size=12, **style):
+        """Dibuja un texto reutilizando su maquetación si no ha cambiado.
+
+        Args:
+            key: Identificador estable del texto (por ejemplo ("hud", "ronda")).
+            text: Texto a dibujar.
+            x, y: Posición del ancla del texto. Moverlo no invalida la caché.
+            color: Color RGB o RGBA.
+            font_size: Tamaño de la fuente.
+            **style: Resto de argumentos de arcade.Text (anchor_x, bold...).
+        """
+        text = str(text)
+        style_key = (font_size, tuple(color), tuple(sorted(style.items())))
+        entry = self.entries.get(key)
+
+        if entry is not None and entry[0] == text and entry[1] == style_key:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            label = entry[2]
+            if label.position != (x, y):
+                label.position = (x, y)
+        else:
+            self.misses += 1
+            label = arcade.Text(text, x, y, color, font_size=font_size, **style)
+            self.entries[key] = (text, style_key, label)
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+        label.draw()
+
+    def stats(self):
+        """Devuelve los contadores de la caché.
+
+        Returns:
+            Diccionario con aciertos, fallos, textos guardados y tasa de aciertos (%).
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self.entries),
+            "hit_rate": round(self.hits / total * 100, 1) if total > 0 else 0,
+        }
+
+    def clear(self):
+        """Vacía la caché y reinicia los contadores."""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Caché compartida por todas las vistas
+TEXT_CACHE = TextCache()